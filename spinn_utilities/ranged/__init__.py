@@ -19,15 +19,20 @@ population views and assemblies.
 """
 
 from .abstract_dict import AbstractDict
-from .abstract_list import AbstractList, DualList, SingleList
+from .abstract_list import AbstractList
 from .abstract_sized import AbstractSized
 from .abstract_view import AbstractView
+from .chunked_values import ChunkedValues
+from .dual_list import DualList
 from .multiple_values_exception import MultipleValuesException
 from .range_dictionary import RangeDictionary
-from .ranged_list import RangedList
+from .ranged_list import RangedList, vectorised_function
 from .ranged_list_of_lists import RangedListOfList
+from .shared_range_dictionary import SharedRangeDictionary
+from .single_list import SingleList
 
 __all__ = [
     "AbstractDict", "AbstractList", "DualList", "SingleList", "AbstractSized",
-    "AbstractView", "MultipleValuesException", "RangeDictionary",
-    "RangedList", "RangedListOfList"]
+    "AbstractView", "ChunkedValues", "MultipleValuesException",
+    "RangeDictionary", "RangedList", "RangedListOfList",
+    "SharedRangeDictionary", "vectorised_function"]
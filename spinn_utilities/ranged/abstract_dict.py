@@ -15,8 +15,11 @@ from typing import (
     Dict, FrozenSet, Iterable, Iterator, MutableSequence, Optional, Sequence,
     Set, Tuple, Union,
     Generic, TypeVar, overload)
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from .abstract_list import _MAX_BLOCK
+from .list_functions import _as_array
 #: :meta private:
 T = TypeVar("T")
 # Can't be Iterable[str] or Sequence[str] because that includes str itself
@@ -205,6 +208,45 @@ class AbstractDict(Generic[T], metaclass=AbstractBase):
         """
         raise NotImplementedError
 
+    def get_columns(self, key: _Keys = None) -> Dict[str, NDArray]:
+        """
+        Gets the values of all IDs covered by this view, as one NumPy array
+        per key in the same order as :py:meth:`ids`.
+
+        :param key: The key or keys to get the values of. Use `None` for all
+        :type key: str or iterable(str) or None
+        :return: A dictionary of key to array of values
+        """
+        if isinstance(key, str):
+            key = [key]
+        elif key is None:
+            key = list(self.keys())
+        return {a_key: _as_array(list(self.iter_all_values(a_key)))
+                for a_key in key}
+
+    def iter_blocks(self, key: str, max_block: int = _MAX_BLOCK
+                    ) -> Iterator[Tuple[int, int, NDArray]]:
+        """
+        Iterates over the values of a key for the IDs covered by this view,
+        a block of IDs at a time rather than one by one.
+
+        .. note::
+            This iterator is *not* update safe!
+
+        See :py:meth:`AbstractList.iter_blocks`.
+
+        :param str key: The key to get the values of
+        :param int max_block:
+            The most IDs in a block with one value per ID
+        :return: yields tuples of (`start`, `stop`, `values`)
+        """
+        if max_block < 1:
+            raise ValueError("The blocks must have at least one ID")
+        # Each range is a block of one value, so max_block can not be
+        # exceeded; views that can give one value per ID override this
+        for (start, stop, value) in self.iter_ranges(key):
+            yield start, stop, _as_array([value])
+
     @abstractmethod
     def get_default(self, key: str) -> Optional[T]:
         """
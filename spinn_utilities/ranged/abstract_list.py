@@ -14,14 +14,17 @@
 from __future__ import annotations
 from numbers import Number
 from typing import (
-    Any, Callable, Generic, Iterator, Optional, Sequence, Tuple,
-    TypeVar, Union, cast)
+    Any, Callable, Dict, Generic, Hashable, Iterator, List, Optional,
+    Sequence, Tuple, TypeVar, Union, cast)
 import numpy
-from numpy.typing import NDArray
+from numpy.typing import DTypeLike, NDArray
 from typing_extensions import Self, TypeAlias, TypeGuard
 from spinn_utilities.abstract_base import AbstractBase, abstractmethod
 from spinn_utilities.overrides import overrides
-from .abstract_sized import AbstractSized, Selector
+from .abstract_sized import Selector
+from .list_functions import (
+    _SIMPLE_TYPES, _as_array, _ranges_to_array, _slice_runs)
+from .list_statistics import _ListStatistics
 from .multiple_values_exception import MultipleValuesException
 #: :meta private:
 R = TypeVar("R")
@@ -31,9 +34,28 @@ T = TypeVar("T")
 U = TypeVar("U")
 #: :meta private:
 IdsType: TypeAlias = Union[Sequence[int], NDArray[numpy.integer]]
+_ValueIndex: TypeAlias = Optional[Dict[Any, List[Tuple[int, int]]]]
+
+#: Default most IDs in each array given by
+#: :py:meth:`AbstractList.iter_blocks`
+_MAX_BLOCK = 2 ** 16
+#: The :py:meth:`AbstractList.version` of a list whose changes are not
+#: tracked
+_UNTRACKED: Optional[Hashable] = None
 
 
 def _eq(x: Any, y: Any) -> bool:
+    """
+    Whether two values are equal, with the same results as
+    :py:func:`numpy.array_equal` but without it for simple values.
+
+    A simple value is equal to itself without comparing it,
+    unless it is a float, which might be NaN.
+    """
+    # The exact types keep bools, ints and NumPy scalars apart
+    # pylint: disable=unidiomatic-typecheck
+    if type(x) in _SIMPLE_TYPES and type(y) in _SIMPLE_TYPES:
+        return (x is y and type(x) is not float) or x == y
     # Lies!
     return numpy.array_equal(cast(float, x), cast(float, y))
 
@@ -49,7 +71,7 @@ def is_number(value: T) -> TypeGuard[float]:
     return isinstance(value, Number)
 
 
-class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
+class AbstractList(_ListStatistics[T], Generic[T], metaclass=AbstractBase):
     """
     A ranged implementation of list.
 
@@ -87,7 +109,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
     `//`
         element-wise floor division or floor division by a single scalar
     """
-    __slots__ = ("_key", )
+    __slots__ = ("_key", "_value_index")
 
     def __init__(self, size: int, key=None):
         """
@@ -97,6 +119,7 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         super().__init__(size)
         self._key = key
+        self._value_index: Optional[Tuple[Hashable, _ValueIndex]] = None
 
     @abstractmethod
     def range_based(self) -> bool:
@@ -122,6 +145,25 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         return self._size
 
+    def version(self) -> Optional[Hashable]:
+        """
+        Identifies the current state of the values of the list.
+
+        Anything worked out from the values can be reused for as long as
+        this stays equal to what it was when that was done.
+
+        :return: A value that changes whenever any value of the list changes,
+            or `None` if changes are not tracked
+        """
+        return _UNTRACKED
+
+    def _settle(self) -> None:
+        """
+        Does now any work that reading the values would otherwise do and
+        that changes how the list holds them, so that the list can then be
+        read by many threads at once without changes in between.
+        """
+
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, AbstractList):
             if self.range_based() and other.range_based():
@@ -383,7 +425,203 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         """
         return list(self.iter_by_selector(selector))
 
+    def to_numpy(self, selector: Selector = None,
+                 dtype: Optional[DTypeLike] = None) -> NDArray:
+        """
+        Get the value of all elements pointed to by the selector as a NumPy
+        array.
+
+        Each range of equal values is expanded in a single step, so this is
+        much faster than building an array from ``list(a_list)``.
+
+        .. note::
+            The result is *not* update-safe; it may be a read-only view of
+            the data of the list.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :param dtype:
+            The NumPy type of the result, or ``None`` to let NumPy decide
+            (values it cannot hold as numbers or strings give an array of
+            objects)
+        :return: One element for each ID selected, in the selected order
+        :rtype: ~numpy.ndarray
+        """
+        if selector is None:
+            slice_start, slice_stop = 0, self._size
+        elif isinstance(selector, slice) and (
+                selector.step is None or selector.step == 1):
+            slice_start, slice_stop = self._check_slice_in_range(
+                selector.start, selector.stop)
+        else:
+            ids = self._selector_to_id_array(selector)
+            if len(ids) == 0:
+                return numpy.empty(
+                    0, dtype=object if dtype is None else dtype)
+            return self._ids_to_numpy(ids, dtype)
+        if slice_start >= slice_stop:
+            return numpy.empty(0, dtype=object if dtype is None else dtype)
+        return self._slice_to_numpy(slice_start, slice_stop, dtype)
+
+    def _slice_to_numpy(self, slice_start: int, slice_stop: int,
+                        dtype: Optional[DTypeLike]) -> NDArray:
+        """
+        Implements :py:meth:`to_numpy` for a checked non-empty continuous
+        slice.
+
+        Subclasses that hold their values in an array should override this.
+        """
+        if self.range_based():
+            return _ranges_to_array(
+                list(self.iter_ranges_by_slice(slice_start, slice_stop)),
+                dtype)
+        return _as_array(
+            list(self.iter_by_slice(slice_start, slice_stop)), dtype)
+
+    def _ids_to_numpy(self, ids: NDArray[numpy.int64],
+                      dtype: Optional[DTypeLike]) -> NDArray:
+        """
+        Implements :py:meth:`to_numpy` for a non-empty array of checked IDs.
+
+        The range holding each ID is found by a search of the range stops.
+        """
+        low = int(ids.min())
+        ranges = list(self.iter_ranges_by_slice(low, int(ids.max()) + 1))
+        stops = numpy.array([stop for (_, stop, _) in ranges])
+        values = _as_array([value for (_, _, value) in ranges], dtype)
+        return values[numpy.searchsorted(stops, ids, side="right")]
+
+    def iter_blocks(self, selector: Selector = None,
+                    max_block: int = _MAX_BLOCK) -> Iterator[
+                        Tuple[int, int, NDArray]]:
+        """
+        Fast but *not* update-safe iterator of the elements pointed to by
+        the selector, a block of IDs at a time rather than one by one.
+
+        Each block is a tuple of (`start`, `stop`, `values`) covering the
+        IDs from `start` up to (but not including) `stop`, in order.
+        A run of IDs with the same value gives `values` holding just that
+        value; otherwise `values` holds the value of each ID in the block.
+        Either way ``buffer[start:stop] = values`` writes the block.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :param int max_block:
+            The most IDs in a block with one value per ID
+        :return: yields tuples of (`start`, `stop`, `values`),
+            where `values` is a :py:class:`~numpy.ndarray`
+        """
+        if max_block < 1:
+            raise ValueError("The blocks must have at least one ID")
+        if selector is None:
+            yield from self._iter_blocks_by_slice(0, self._size, max_block)
+            return
+        if isinstance(selector, slice) and (
+                selector.step is None or selector.step == 1):
+            yield from self._iter_blocks_by_slice(
+                *self._check_slice_in_range(selector.start, selector.stop),
+                max_block)
+            return
+        # Split the IDs into runs of consecutive IDs
+        ids = self._selector_to_id_array(selector)
+        if len(ids) == 0:
+            return
+        breaks = numpy.flatnonzero(ids[1:] != ids[:-1] + 1) + 1
+        starts = ids[numpy.append(0, breaks)]
+        stops = ids[numpy.append(breaks - 1, len(ids) - 1)] + 1
+        for (start, stop) in zip(starts.tolist(), stops.tolist()):
+            yield from self._iter_blocks_by_slice(start, stop, max_block)
+
+    def _iter_blocks_by_slice(
+            self, slice_start: int, slice_stop: int,
+            max_block: int) -> Iterator[Tuple[int, int, NDArray]]:
+        """
+        Implements :py:meth:`iter_blocks` for a checked continuous slice.
+        """
+        if slice_start >= slice_stop:
+            return
+        if self.range_based():
+            for (start, stop, value) in self.iter_ranges_by_slice(
+                    slice_start, slice_stop):
+                yield start, stop, _as_array([value])
+            return
+        for start in range(slice_start, slice_stop, max_block):
+            stop = min(start + max_block, slice_stop)
+            yield start, stop, self.to_numpy(slice(start, stop))
+
+    def __indexed_ranges(self, x: T) -> Optional[List[Tuple[int, int]]]:
+        """
+        Looks up the ranges of IDs with a value in an index of the ranges of
+        each value, built when first needed and kept until the list changes.
+
+        :return: The ranges, or `None` if the index can not be used for this
+            list (as its version is not tracked or its values can not be
+            hashed) or for this value
+        """
+        version = self.version()
+        if version is None:
+            return None
+        try:
+            hash(x)
+        except TypeError:
+            return None
+        if is_number(x) and x != x:
+            # NaN is never equal to anything
+            return []
+        if self._value_index is None or self._value_index[0] != version:
+            new_index: Dict[Any, List[Tuple[int, int]]] = {}
+            try:
+                for (start, stop, value) in self.iter_ranges():
+                    ranges = new_index.setdefault(value, [])
+                    if ranges and ranges[-1][1] == start:
+                        ranges[-1] = (ranges[-1][0], stop)
+                    else:
+                        ranges.append((start, stop))
+                self._value_index = (version, new_index)
+            except TypeError:
+                self._value_index = (version, None)
+        index = self._value_index[1]
+        if index is None:
+            return None
+        return index.get(x, [])
+
+    def where(self, x: T) -> List[Tuple[int, int]]:
+        """
+        Finds the ranges of IDs of the elements with value ``x``.
+
+        If the values can be hashed, an index from each value to its ranges
+        is built by the first query and kept until the list changes,
+        so further queries take time in proportion to the number of ranges
+        found rather than the number of ranges in the list.
+
+        :param x: The value to find.
+        :return: The start and (exclusive) stop of each range, sorted
+        :rtype: list(tuple(int, int))
+        """
+        ranges = self.__indexed_ranges(x)
+        if ranges is None:
+            return [(start, stop) for (start, stop, value)
+                    in self.iter_ranges() if _eq(value, x)]
+        return list(ranges)
+
+    def ids_of(self, x: T) -> NDArray[numpy.int64]:
+        """
+        Finds the IDs of the elements with value ``x``.
+
+        See :py:meth:`where`.
+
+        :param x: The value to find.
+        :return: The IDs, sorted
+        :rtype: ~numpy.ndarray
+        """
+        ranges = numpy.array(self.where(x), dtype=numpy.int64).reshape(-1, 2)
+        lengths = ranges[:, 1] - ranges[:, 0]
+        # Each ID is its position plus how far its range is from the last
+        return numpy.arange(lengths.sum()) + numpy.repeat(
+            ranges[:, 0] - (numpy.cumsum(lengths) - lengths), lengths)
+
     def __contains__(self, item: T) -> bool:
+        ranges = self.__indexed_ranges(item)
+        if ranges is not None:
+            return bool(ranges)
         return any(_eq(value, item)
                    for (_, _, value) in self.iter_ranges())
 
@@ -395,6 +633,9 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         :return: count of matching elements
         :rtype: int
         """
+        ranges = self.__indexed_ranges(x)
+        if ranges is not None:
+            return sum(stop - start for (start, stop) in ranges)
         return sum(
             stop - start
             for (start, stop, value) in self.iter_ranges()
@@ -409,11 +650,31 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         :return: The ID/index
         :raise ValueError: If the value is not found
         """
+        ranges = self.__indexed_ranges(x)
+        if ranges is not None:
+            if ranges:
+                return ranges[0][0]
+            raise ValueError(f"{x} is not in list")
         for (start, _, value) in self.iter_ranges():
             if _eq(value, x):
                 return start
         raise ValueError(f"{x} is not in list")
 
+    @overrides(_ListStatistics._weighted_values)
+    def _weighted_values(self, selector: Selector) -> Tuple[
+            Optional[NDArray[numpy.int64]], NDArray]:
+        if self.range_based() and (selector is None or (
+                isinstance(selector, slice) and (
+                    selector.step is None or selector.step == 1))):
+            slice_start, slice_stop = (0, self._size) if selector is None \
+                else self._check_slice_in_range(selector.start, selector.stop)
+            if slice_start < slice_stop:
+                runs = _slice_runs(self, slice_start, slice_stop)
+                assert runs is not None
+                stops, values = runs
+                return numpy.diff(stops, prepend=slice_start), values
+        return None, self.to_numpy(selector)
+
     @abstractmethod
     def iter_ranges(self) -> Iterator[Tuple[int, int, T]]:
         """
@@ -524,10 +785,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x + y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                vectorised=True)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x + other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(
+                a_list=self, operation=s_operation, vectorised=True)
         raise TypeError("__add__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -548,10 +811,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x - y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                vectorised=True)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x - other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(
+                a_list=self, operation=s_operation, vectorised=True)
         raise TypeError("__sub__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -572,10 +837,12 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x * y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                vectorised=True)
         if is_number(other):
             s_operation: Callable[[Any], float] = lambda x: x * other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(
+                a_list=self, operation=s_operation, vectorised=True)
         raise TypeError("__mul__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -597,12 +864,14 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         if isinstance(other, AbstractList):
             d_operation: Callable[[Any, float], float] = lambda x, y: x / y
             return DualList(
-                left=self, right=other, operation=d_operation)
+                left=self, right=other, operation=d_operation,
+                vectorised=True)
         if is_number(other):
             if _is_zero(other):
                 raise ZeroDivisionError()
             s_operation: Callable[[Any], float] = lambda x: x / other
-            return SingleList(a_list=self, operation=s_operation)
+            return SingleList(
+                a_list=self, operation=s_operation, vectorised=True)
         raise TypeError("__truediv__ operation only supported for other "
                         "RangedLists and numerical Values")
 
@@ -631,7 +900,8 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
                         "RangedLists and numerical Values")
 
     def apply_operation(
-            self, operation: Callable[[T], U]) -> AbstractList[U]:
+            self, operation: Callable[[T], U],
+            vectorised: bool = False) -> AbstractList[U]:
         """
         Applies a function on the list to create a new one.
         The values of the new list are created on the fly so any changes
@@ -640,213 +910,18 @@ class AbstractList(AbstractSized, Generic[T], metaclass=AbstractBase):
         :param operation:
             A function that can be applied over the individual values to
             create new ones.
+        :param vectorised:
+            True if the operation also works element by element on a NumPy
+            array of numbers, giving an array of the same length
         :return: new list
         :rtype: AbstractList
         """
-        return SingleList(a_list=self, operation=operation)
-
-
-class SingleList(AbstractList[R], Generic[T, R],
-                 metaclass=AbstractBase):
-    """
-    A List that performs an operation on the elements of another list.
-    """
-    __slots__ = [
-        "_a_list", "_operation"]
+        return SingleList(
+            a_list=self, operation=operation, vectorised=vectorised)
 
-    def __init__(self, a_list: AbstractList[T],
-                 operation: Callable[[T], R],
-                 key: Optional[str] = None):
-        """
-        :param AbstractList a_list: The list to perform the operation on
-        :param callable operation:
-            A function which takes a single value and returns the result of
-            the operation on that value
-        :param key: The dict key this list covers.
-            This is used only for better Exception messages
-        """
-        super().__init__(size=len(a_list), key=key)
-        self._a_list = a_list
-        self._operation = operation
-
-    @overrides(AbstractList.range_based)
-    def range_based(self) -> bool:
-        return self._a_list.range_based()
-
-    @overrides(AbstractList.get_value_by_id)
-    def get_value_by_id(self, the_id: int) -> R:
-        return self._operation(self._a_list.get_value_by_id(the_id))
-
-    @overrides(AbstractList.get_single_value_by_slice)
-    def get_single_value_by_slice(
-            self, slice_start: int, slice_stop: int) -> R:
-        return self._operation(self._a_list.get_single_value_by_slice(
-            slice_start, slice_stop))
-
-    @overrides(AbstractList.get_single_value_by_ids)
-    def get_single_value_by_ids(self, ids: IdsType) -> R:
-        return self._operation(self._a_list.get_single_value_by_ids(ids))
-
-    @overrides(AbstractList.iter_ranges)
-    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
-        for (start, stop, value) in self._a_list.iter_ranges():
-            yield (start, stop, self._operation(value))
-
-    @overrides(AbstractList.get_default)
-    def get_default(self) -> Optional[R]:
-        default = self._a_list.get_default()
-        if default is None:
-            return None
-        return self._operation(default)
 
-    @overrides(AbstractList.iter_ranges_by_slice)
-    def iter_ranges_by_slice(
-            self, slice_start: int, slice_stop: int
-            ) -> Iterator[Tuple[int, int, R]]:
-        for (start, stop, value) in \
-                self._a_list.iter_ranges_by_slice(slice_start, slice_stop):
-            yield (start, stop, self._operation(value))
-
-
-class DualList(AbstractList[R], Generic[T, U, R],
-               metaclass=AbstractBase):
-    """
-    A list which combines two other lists with an operation.
-    """
-    __slots__ = [
-        "_left", "_operation", "_right"]
-
-    def __init__(self, left: AbstractList[T], right: AbstractList[U],
-                 operation: Callable[[T, U], R],
-                 key: Optional[str] = None):
-        """
-        :param AbstractList left: The first list to combine
-        :param AbstractList right: The second list to combine
-        :param callable operation:
-            The operation to perform as a function that takes two values and
-            returns the result of the operation
-        :param key:
-            The dict key this list covers.
-            This is used only for better Exception messages
-        :raises ValueError: If list are not the same size
-        """
-        if len(left) != len(right):
-            raise ValueError("Two list must have the same size")
-        super().__init__(size=len(left), key=key)
-        self._left = left
-        self._right = right
-        self._operation = operation
-
-    @overrides(AbstractList.range_based)
-    def range_based(self) -> bool:
-        return self._left.range_based() and self._right.range_based()
-
-    @overrides(AbstractList.get_value_by_id)
-    def get_value_by_id(self, the_id: int) -> R:
-        return self._operation(
-            self._left.get_value_by_id(the_id),
-            self._right.get_value_by_id(the_id))
-
-    @overrides(AbstractList.get_single_value_by_slice)
-    def get_single_value_by_slice(
-            self, slice_start: int, slice_stop: int) -> R:
-        return self._operation(
-            self._left.get_single_value_by_slice(slice_start, slice_stop),
-            self._right.get_single_value_by_slice(slice_start, slice_stop))
-
-    @overrides(AbstractList.get_single_value_by_ids)
-    def get_single_value_by_ids(self, ids: IdsType) -> R:
-        return self._operation(
-            self._left.get_single_value_by_ids(ids),
-            self._right.get_single_value_by_ids(ids))
-
-    @overrides(AbstractList.iter_by_slice)
-    def iter_by_slice(
-            self, slice_start: int, slice_stop: int) -> Iterator[R]:
-        slice_start, slice_stop = self._check_slice_in_range(
-            slice_start, slice_stop)
-        if self._left.range_based():
-            if self._right.range_based():
-
-                # Both lists are range based
-                for (start, stop, value) in \
-                        self.iter_ranges_by_slice(slice_start, slice_stop):
-                    for _ in range(start, stop):
-                        yield value
-            else:
-
-                # Left list is range based, right is not
-                left_iter = self._left.iter_ranges_by_slice(
-                    slice_start, slice_stop)
-                right_values = self._right.iter_by_slice(
-                    slice_start, slice_stop)
-                for (start, stop, left_value) in left_iter:
-                    for _ in range(start, stop):
-                        yield self._operation(left_value, next(right_values))
-        else:
-            if self._right.range_based():
-
-                # Right list is range based left is not
-                left_values = self._left.iter_by_slice(
-                    slice_start, slice_stop)
-                right_iter = self._right.iter_ranges_by_slice(
-                    slice_start, slice_stop)
-                for (start, stop, right_value) in right_iter:
-                    for _ in range(start, stop):
-                        yield self._operation(next(left_values), right_value)
-            else:
-
-                # Neither list is range based
-                left_values = self._left.iter_by_slice(slice_start, slice_stop)
-                right_values = self._right.iter_by_slice(
-                    slice_start, slice_stop)
-                while True:
-                    try:
-                        yield self._operation(
-                            next(left_values), next(right_values))
-                    except StopIteration:
-                        return
-
-    @overrides(AbstractList.iter_ranges)
-    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
-        left_iter = self._left.iter_ranges()
-        right_iter = self._right.iter_ranges()
-        return self._merge_ranges(left_iter, right_iter)
-
-    @overrides(AbstractList.iter_ranges_by_slice)
-    def iter_ranges_by_slice(
-            self, slice_start: int, slice_stop: int) -> Iterator[
-                Tuple[int, int, R]]:
-        left_iter = self._left.iter_ranges_by_slice(slice_start, slice_stop)
-        right_iter = self._right.iter_ranges_by_slice(slice_start, slice_stop)
-        return self._merge_ranges(left_iter, right_iter)
-
-    def _merge_ranges(self, left_iter: Iterator[Tuple[int, int, T]],
-                      right_iter: Iterator[Tuple[int, int, U]]
-                      ) -> Iterator[Tuple[int, int, R]]:
-        (left_start, left_stop, left_value) = next(left_iter)
-        (right_start, right_stop, right_value) = next(right_iter)
-        try:
-            while True:
-                yield (max(left_start, right_start),
-                       min(left_stop, right_stop),
-                       self._operation(left_value, right_value))
-                if left_stop < right_stop:
-                    (left_start, left_stop, left_value) = next(left_iter)
-                elif left_stop > right_stop:
-                    (right_start, right_stop, right_value) = next(right_iter)
-                else:
-                    (left_start, left_stop, left_value) = next(left_iter)
-                    (right_start, right_stop, right_value) = next(right_iter)
-        except StopIteration:
-            return
-
-    @overrides(AbstractList.get_default)
-    def get_default(self) -> Optional[R]:
-        l_default = self._left.get_default()
-        if l_default is None:
-            return None
-        r_default = self._right.get_default()
-        if r_default is None:
-            return None
-        return self._operation(l_default, r_default)
+# The lists made by the operators of AbstractList are
+# AbstractLists too, so can only be imported once it is defined
+# pylint: disable=wrong-import-position
+from .dual_list import DualList  # noqa: E402
+from .single_list import SingleList  # noqa: E402
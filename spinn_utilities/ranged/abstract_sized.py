@@ -16,9 +16,11 @@ from collections.abc import Sized
 import itertools
 import logging
 import sys
-from typing import Any, Optional, Sequence, SupportsInt, Tuple, Union
+from typing import (
+    Any, Iterable, Optional, Sequence, SupportsInt, Tuple, Union)
 from typing_extensions import TypeAlias, TypeGuard
 import numpy
+from numpy.typing import NDArray
 
 logger = logging.getLogger(__file__)
 
@@ -81,6 +83,27 @@ class AbstractSized(object):
             raise IndexError(f"The index {the_id} is out of range.")
         return the_id
 
+    def _check_ids_in_range(
+            self, ids: Iterable[Union[int, SupportsInt]]) -> NDArray[
+                numpy.int64]:
+        """
+        Checks a collection of IDs as :py:meth:`_check_id_in_range` does a
+        single ID.
+
+        :return: The IDs as an array
+        """
+        id_array = numpy.asarray(ids)
+        if id_array.dtype.kind not in "iu":
+            # Not simple integers so check each to raise the right error
+            return numpy.array(
+                [self._check_id_in_range(the_id) for the_id in ids],
+                dtype=numpy.int64)
+        outside = (id_array < 0) | (id_array >= self._size)
+        if outside.any():
+            raise IndexError(
+                f"The index {id_array[outside][0]} is out of range.")
+        return id_array.astype(numpy.int64, copy=False)
+
     def _check_slice_in_range(
             self, slice_start: Optional[int],
             slice_stop: Optional[int]) -> Tuple[int, int]:
@@ -164,6 +187,60 @@ class AbstractSized(object):
                 "but the length was only %d. All the missing entries will be "
                 "ignored!", self._size, len(selector))
 
+    def _array_selector_to_ids(
+            self, selector: Union[NDArray, Sequence[Any]],
+            warn: bool) -> Optional[NDArray[numpy.int64]]:
+        """
+        Does the work of :py:meth:`selector_to_ids` for an array, or a
+        sequence NumPy can turn into one, using NumPy rather than looking
+        at each item.
+
+        :return: The IDs, or `None` if the selector has to be checked item
+            by item (for example because it mixes bools and ints)
+        """
+        try:
+            array = numpy.asarray(selector)
+        except (OverflowError, TypeError, ValueError):
+            return None
+        if array.ndim != 1:
+            return None
+        kind = array.dtype.kind
+        if kind == "b":
+            if warn:
+                self._check_mask_size(array)
+            return numpy.flatnonzero(array[:self._size])
+        if len(array) == 0:
+            return numpy.empty(0, dtype=numpy.int64)
+        if kind not in "iu":
+            return None
+        if not isinstance(selector, numpy.ndarray):
+            # NumPy turns bools mixed with ints into ints
+            types = set(map(type, selector))
+            if bool in types or numpy.bool_ in types:
+                return None
+        outside = (array < 0) | (array >= self._size)
+        if outside.any():
+            _id = int(array[numpy.argmax(outside)])
+            if _id < 0:
+                raise TypeError(
+                    f"Selector includes the ID {_id} which is "
+                    "less than zero")
+            raise TypeError(
+                f"Selector includes the ID {_id} which not "
+                f"less than the size {self._size}")
+        return array.astype(numpy.int64, copy=False)
+
+    def _selector_to_id_array(
+            self, selector: Selector) -> NDArray[numpy.int64]:
+        """
+        Same as :py:meth:`selector_to_ids` but gives the IDs as an array.
+        """
+        if isinstance(selector, (numpy.ndarray, list, tuple)):
+            ids = self._array_selector_to_ids(selector, False)
+            if ids is not None:
+                return ids
+        return numpy.asarray(self.selector_to_ids(selector), dtype=numpy.int64)
+
     def selector_to_ids(self, selector: Selector, warn=False) -> Sequence[int]:
         """
         Gets the list of IDs covered by this selector.
@@ -196,6 +273,11 @@ class AbstractSized(object):
             If True, this method will warn about problems with the selector.
         :return: a (possibly sorted) list of IDs
         """
+        if isinstance(selector, (numpy.ndarray, list, tuple)):
+            array_ids = self._array_selector_to_ids(selector, warn)
+            if array_ids is not None:
+                return array_ids.tolist()
+
         if _is_iterable_selector(selector):
             # bool is subclass of int so if any are bool all must be
             if any(isinstance(item, (bool, numpy.bool_)) for item in selector):
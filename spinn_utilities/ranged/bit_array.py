@@ -0,0 +1,177 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Any, Optional, Union
+import numpy
+from numpy.typing import DTypeLike, NDArray
+from .abstract_list import is_number
+
+#: The number of bits set in each possible byte
+_BITS_SET = numpy.unpackbits(
+    numpy.arange(256, dtype=numpy.uint8)[:, None], axis=1).sum(axis=1)
+
+
+def _as_bit(value: Any) -> Optional[bool]:
+    """
+    Finds which bit a value is equal to.
+
+    :return: The bit, or `None` if the value is equal to neither
+    """
+    if isinstance(value, (bool, numpy.bool_)) or is_number(value):
+        if value == 1:
+            return True
+        if value == 0:
+            return False
+    return None
+
+
+class _BitArray(object):
+    """
+    Holds the values of a :py:class:`RangedList` of bools one bit per ID,
+    standing in for a NumPy array of bools.
+
+    Reads give NumPy arrays of bools; writes change just the bits written.
+    """
+    __slots__ = ["_bits", "_size"]
+
+    def __init__(self, bits: NDArray[numpy.uint8], size: int):
+        """
+        :param bits: The bits, packed with the first ID in the lowest bit
+        :param int size: The number of IDs
+        """
+        self._bits = bits
+        self._size = size
+
+    @classmethod
+    def from_array(cls, values: Any) -> _BitArray:
+        """
+        Packs the truth of each of some values.
+
+        :param values: An array or sequence of values
+        :rtype: _BitArray
+        """
+        array = numpy.asarray(values).astype(bool, copy=False)
+        return cls(numpy.packbits(array, bitorder="little"), len(array))
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory used by the bits.
+
+        :rtype: int
+        """
+        return self._bits.nbytes
+
+    def copy(self) -> _BitArray:
+        """
+        Copies the bits, as :py:meth:`numpy.ndarray.copy`.
+
+        :rtype: _BitArray
+        """
+        return _BitArray(self._bits.copy(), self._size)
+
+    def __check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("index out of range")
+        return index
+
+    def __unpack(self, start: int, stop: int) -> NDArray[numpy.bool_]:
+        """
+        Gets the bits of a slice in range as an array of bools.
+        """
+        first = start >> 3
+        unpacked = numpy.unpackbits(
+            self._bits[first:(stop + 7) >> 3], bitorder="little")
+        offset = start - (first << 3)
+        return unpacked[offset:offset + stop - start].view(numpy.bool_)
+
+    def __getitem__(
+            self, index: Union[int, slice, NDArray[numpy.integer]]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                return self[numpy.arange(start, stop, step)]
+            return self.__unpack(start, max(start, stop))
+        if isinstance(index, numpy.ndarray):
+            index = numpy.where(index < 0, index + self._size, index)
+            return ((self._bits[index >> 3] >> (index & 7)) & 1).astype(
+                numpy.bool_)
+        index = self.__check_index(index)
+        return numpy.bool_((self._bits[index >> 3] >> (index & 7)) & 1)
+
+    def item(self, index: int) -> bool:
+        """
+        Gets the value of an ID as a Python bool, like
+        :py:meth:`numpy.ndarray.item`.
+        """
+        return bool(self[index])
+
+    def __setitem__(
+            self, index: Union[int, slice, NDArray[numpy.integer]],
+            value: Any):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step != 1:
+                self[numpy.arange(start, stop, step)] = value
+                return
+            if start >= stop:
+                return
+            # Whole bytes are repacked, so keep the other bits in them
+            values = self.__unpack(
+                start - (start & 7), min(self._size, (stop + 7) & ~7))
+            values[start & 7:(start & 7) + stop - start] = numpy.asarray(
+                value).astype(bool)
+            self._bits[start >> 3:(stop + 7) >> 3] = numpy.packbits(
+                values, bitorder="little")
+            return
+        if isinstance(index, numpy.ndarray):
+            index = numpy.where(index < 0, index + self._size, index)
+            values = numpy.broadcast_to(
+                numpy.asarray(value).astype(bool), index.shape)
+            masks = numpy.left_shift(1, index & 7).astype(numpy.uint8)
+            numpy.bitwise_or.at(self._bits, index[values] >> 3, masks[values])
+            numpy.bitwise_and.at(
+                self._bits, index[~values] >> 3, ~masks[~values])
+            return
+        index = self.__check_index(index)
+        if value:
+            self._bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self._bits[index >> 3] &= ~(1 << (index & 7)) & 0xFF
+
+    def __array__(self, dtype: Optional[DTypeLike] = None,
+                  copy: Optional[bool] = None) -> NDArray:
+        if copy is False:
+            raise ValueError("The bits are always unpacked into a copy")
+        values = self.__unpack(0, self._size)
+        if dtype is None:
+            return values
+        return values.astype(dtype)
+
+    def count(self) -> int:
+        """
+        Counts the bits set, without unpacking them.
+
+        :rtype: int
+        """
+        whole = self._size >> 3
+        total = int(_BITS_SET[self._bits[:whole]].sum())
+        if whole < len(self._bits):
+            total += int(self.__unpack(whole << 3, self._size).sum())
+        return total
@@ -0,0 +1,168 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Any, Callable, Optional, Tuple, Union
+import numpy
+from numpy.typing import ArrayLike, DTypeLike, NDArray
+
+
+class ChunkedValues(object):
+    """
+    Values made by a generator (typically of random numbers), which are
+    only worked out when needed, a fixed size chunk at a time.
+
+    A :py:class:`RangedList` with a ``dtype`` keeps these unevaluated, so
+    reading a slice (for example with ``iter_by_slice`` or ``to_numpy``)
+    makes only the chunks that cover it.
+    The values are made in full the first time the list is written to.
+    A list without a ``dtype`` makes all the values straight away.
+
+    Each chunk is made by its own generator, seeded by the seed and the
+    number of the chunk, so the value of each ID is the same however (and
+    in whatever order) the values are read.
+
+    These can also be used as a function giving the values of an array of
+    IDs.
+    """
+    __slots__ = ["_chunk_size", "_generate", "_last", "_seed"]
+
+    def __init__(
+            self, generate: Callable[[numpy.random.Generator, int], ArrayLike],
+            seed: int, chunk_size: int = 65536):
+        """
+        :param ~collections.abc.Callable generate:
+            Makes a given number of values with a given generator, as in
+            ``lambda rng, n: rng.normal(-65.0, 5.0, n)``
+        :param int seed: The seed from which the seed of each chunk is made
+        :param int chunk_size: How many values to make at a time
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be positive")
+        self._generate = generate
+        self._seed = seed
+        self._chunk_size = chunk_size
+        # The last chunk made, as IDs are often read one at a time
+        self._last: Optional[Tuple[int, NDArray]] = None
+
+    @property
+    def chunk_size(self) -> int:
+        """
+        How many values are made at a time.
+
+        :rtype: int
+        """
+        return self._chunk_size
+
+    def _chunk(self, number: int) -> NDArray:
+        """
+        Makes the values of one chunk.
+        """
+        last = self._last
+        if last is not None and last[0] == number:
+            return last[1]
+        rng = numpy.random.default_rng(numpy.random.SeedSequence(
+            self._seed, spawn_key=(number, )))
+        values = numpy.asarray(self._generate(rng, self._chunk_size))
+        if values.shape != (self._chunk_size, ):
+            raise ValueError(
+                f"The generator made values of shape {values.shape} when "
+                f"asked for {self._chunk_size}")
+        self._last = (number, values)
+        return values
+
+    def values(self, start: int, stop: int) -> NDArray:
+        """
+        Makes the values of a slice of IDs, making only the chunks that
+        cover it.
+
+        :param int start: The first ID
+        :param int stop: The ID after the last
+        :rtype: ~numpy.ndarray
+        """
+        size = self._chunk_size
+        first = start // size
+        if stop <= start:
+            return self._chunk(first)[:0]
+        chunks = [self._chunk(number)
+                  for number in range(first, (stop - 1) // size + 1)]
+        values = chunks[0] if len(chunks) == 1 else numpy.concatenate(chunks)
+        return values[start - first * size:stop - first * size]
+
+    def __call__(self, ids: NDArray[numpy.integer]) -> NDArray:
+        """
+        Makes the values of an array of IDs, making only the chunks that
+        hold them.
+        """
+        ids = numpy.asarray(ids, dtype=numpy.int64)
+        numbers = ids // self._chunk_size
+        result: Optional[NDArray] = None
+        for number in numpy.unique(numbers).tolist():
+            in_chunk = numbers == number
+            values = self._chunk(number)
+            if result is None:
+                result = numpy.empty(len(ids), dtype=values.dtype)
+            result[in_chunk] = values[
+                ids[in_chunk] - number * self._chunk_size]
+        if result is None:
+            return self._chunk(0)[:0]
+        return result
+
+
+class _LazyArray(object):
+    """
+    Stands in for the array of values of a :py:class:`RangedList` that
+    have not been made yet, making just those that are read.
+    """
+    __slots__ = ["_dtype", "_size", "_source"]
+
+    def __init__(self, source: ChunkedValues, size: int, dtype: numpy.dtype):
+        self._source = source
+        self._size = size
+        self._dtype = dtype
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(
+            self, index: Union[int, slice, NDArray[numpy.integer]]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._size)
+            if step == 1:
+                values = self._source.values(start, max(start, stop))
+            else:
+                values = self._source(numpy.arange(start, stop, step))
+        elif isinstance(index, numpy.ndarray):
+            values = self._source(index)
+        else:
+            if index < 0:
+                index += self._size
+            if not 0 <= index < self._size:
+                raise IndexError("index out of range")
+            values = self._source.values(index, index + 1)[0]
+        return values.astype(self._dtype, copy=False)
+
+    def item(self, index: int) -> Any:
+        """
+        Gets the value of an ID as a Python object, like
+        :py:meth:`numpy.ndarray.item`.
+        """
+        return self[index].item()
+
+    def __array__(self, dtype: Optional[DTypeLike] = None,
+                  copy: Optional[bool] = None) -> NDArray:
+        if copy is False:
+            raise ValueError(
+                "The values are only made when read, so always in a copy")
+        return self._source.values(0, self._size).astype(
+            self._dtype if dtype is None else dtype)
@@ -0,0 +1,375 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import os
+from typing import (
+    Callable, Generic, Hashable, Iterator, List, Optional, Sequence, Tuple)
+import numpy
+from numpy.typing import DTypeLike, NDArray
+from typing_extensions import TypeAlias
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from spinn_utilities.overrides import overrides
+from .abstract_list import AbstractList, R
+from .abstract_sized import Selector
+from .list_functions import (
+    _SAFE_INT, _exact_array, _ranges_of_slice, _ranges_to_array, _run_starts,
+    _slice_ranges)
+_Fusion: TypeAlias = Tuple[
+    List["AbstractList"], Callable[[Sequence[NDArray]], NDArray]]
+#: Largest size of an integer that a float holds exactly
+_EXACT_FLOAT_INT = 2 ** 53
+#: Number of IDs worked out by each thread of
+#: :py:meth:`_DerivedList.to_numpy_parallel`
+_PARALLEL_CHUNK = 2 ** 18
+
+
+def _leaf_runs(a_list: AbstractList, slice_start: int,
+               slice_stop: int) -> Optional[Tuple[NDArray, NDArray]]:
+    """
+    Gets the stops and values of the runs of a slice of a list as arrays,
+    with integers held as `int64` and floats as `float64`.
+
+    :return: The stops and values, or `None` if the values are not all
+        simple numbers of the same Python type, as NumPy would then change
+        some of them
+    """
+    if not a_list.range_based():
+        values = _dense_leaf_values(a_list, slice_start, slice_stop)
+        if values is None:
+            return None
+        starts = _run_starts(values)
+        if starts is None:
+            return None
+        return (numpy.append(starts[1:], len(values)) + slice_start,
+                values[starts])
+    ranges = _ranges_of_slice(a_list, slice_start, slice_stop)
+    exact = _exact_array([value for (_, _, value) in ranges])
+    if exact is None:
+        return None
+    leaf_values = _leaf_values(exact)
+    if leaf_values is None:
+        return None
+    stops = numpy.array([stop for (_, stop, _) in ranges], dtype=numpy.int64)
+    return stops, leaf_values
+
+
+def _dense_leaf_values(a_list: AbstractList, slice_start: int,
+                       slice_stop: int) -> Optional[NDArray]:
+    """
+    Gets the values of a slice of a list that is not range based as an
+    array, with integers held as `int64` and floats as `float64`.
+
+    :return: The values, or `None` if they are not all simple numbers of
+        the same Python type
+    """
+    values = numpy.asarray(a_list.to_numpy(slice(slice_start, slice_stop)))
+    if values.dtype.kind == "f":
+        # Python integers mixed with floats are also held as floats
+        exact = _exact_array(list(a_list.iter_by_slice(
+            slice_start, slice_stop)))
+        if exact is None:
+            return None
+        values = exact
+    return _leaf_values(values)
+
+
+def _leaf_values(values: NDArray) -> Optional[NDArray]:
+    """
+    Gets values as `int64` if integers or `float64` if floats.
+
+    :return: The values, or `None` if they are not all simple numbers
+    """
+    kind = values.dtype.kind
+    if kind == "f":
+        return values.astype(numpy.float64, copy=False)
+    if kind in "bi" or (kind == "u" and values.dtype.itemsize < 8):
+        return values.astype(numpy.int64, copy=False)
+    return None
+
+
+def _checked(operation: Callable[..., NDArray], *arrays: NDArray) -> NDArray:
+    """
+    Applies a vectorised operation to arrays of simple numbers, checking
+    that NumPy gives what the operation would give on Python values.
+
+    :raises OverflowError: If an integer result may have overflowed, or a
+        float result was worked out from integers too big to be held
+        exactly as floats
+    """
+    result = numpy.asarray(operation(*arrays))
+    if result.dtype.kind in "iu":
+        # Python integers do not overflow, so check the size with floats
+        check = numpy.asarray(operation(*(
+            array.astype(numpy.float64) for array in arrays)))
+        if not numpy.all(numpy.abs(check) < _SAFE_INT):
+            raise OverflowError("Integer result too big for NumPy")
+    elif any(array.dtype.kind in "iu" and (
+            array.max() > _EXACT_FLOAT_INT or
+            array.min() < -_EXACT_FLOAT_INT) for array in arrays):
+        # Python divides such integers exactly, NumPy as floats
+        raise OverflowError("Integer too big to be held as a float")
+    return result
+
+
+def _fusion_of(a_list: AbstractList) -> _Fusion:
+    """
+    Gets the leaves of the expression a list is the root of, and the
+    function that works out the expression from arrays of their values.
+    A list that cannot be fused is a leaf of its own.
+    """
+    if isinstance(a_list, _DerivedList):
+        # pylint: disable-next=protected-access
+        fusion = a_list._fusion()
+        if fusion is not None:
+            return fusion
+    return [a_list], lambda arrays: arrays[0]
+
+
+class _DerivedList(AbstractList[R], Generic[R], metaclass=AbstractBase):
+    """
+    A list whose values are worked out from those of other lists.
+
+    The ranges of the whole list are kept once worked out, and reused until
+    the :py:meth:`version` of the lists they came from changes.
+
+    When the operations are vectorised, a tree of these lists (such as
+    ``a + b * c - d``) is worked out in one go: the boundaries of the ranges
+    of all the lists at the leaves are merged once, and the whole
+    expression is applied with NumPy over one value per merged range.
+    """
+    __slots__ = [
+        "_cached_ranges", "_cached_stops", "_cached_version"]
+
+    def __init__(self, size: int, key: Optional[str] = None):
+        super().__init__(size=size, key=key)
+        self._cached_ranges: List[Tuple[int, int, R]] = []
+        self._cached_stops: List[int] = []
+        self._cached_version: Optional[Hashable] = None
+
+    @abstractmethod
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        """
+        Works out the ranges of the whole list.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _compute_ranges_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[
+                Tuple[int, int, R]]:
+        """
+        Works out the ranges of a slice of the list.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _fusion(self) -> Optional[_Fusion]:
+        """
+        Gets the lists at the leaves of the expression this list is the root
+        of, and a function that works out the expression from arrays of
+        their values.
+
+        The function raises an :py:class:`ArithmeticError` if NumPy would
+        not give the same values as the operations on single values.
+
+        :return: The leaves and the function,
+            or `None` if the operation does not work on NumPy arrays
+        """
+        raise NotImplementedError
+
+    def _fused_values(
+            self, slice_start: int, slice_stop: int,
+            each_id: bool = False) -> Optional[
+                Tuple[Optional[NDArray], NDArray]]:
+        """
+        Works out the values of a slice of the list in one NumPy pass over
+        the whole expression.
+
+        :param bool each_id:
+            Whether one value per ID may be given instead of the ranges;
+            this is done if any leaf holds one value per ID, as finding and
+            merging the runs would cost more than it saves
+        :return: The stops and values of the ranges, with `None` as the
+            stops if there is one value per ID; or `None` if the expression
+            cannot be done this way, in which case the ranges should be
+            worked out one by one, which also raises any error
+        """
+        fusion = self._fusion()
+        if fusion is None or slice_start >= slice_stop:
+            return None
+        leaves, evaluate = fusion
+        stops: Optional[NDArray] = None
+        if each_id and not all(leaf.range_based() for leaf in leaves):
+            arrays = []
+            for leaf in leaves:
+                if leaf.range_based():
+                    leaf_runs = _leaf_runs(leaf, slice_start, slice_stop)
+                    if leaf_runs is None:
+                        return None
+                    leaf_stops, values = leaf_runs
+                    arrays.append(numpy.repeat(
+                        values, numpy.diff(leaf_stops, prepend=slice_start)))
+                else:
+                    dense_values = _dense_leaf_values(
+                        leaf, slice_start, slice_stop)
+                    if dense_values is None:
+                        return None
+                    arrays.append(dense_values)
+        else:
+            runs = []
+            for leaf in leaves:
+                leaf_runs = _leaf_runs(leaf, slice_start, slice_stop)
+                if leaf_runs is None:
+                    return None
+                runs.append(leaf_runs)
+            stops = numpy.sort(numpy.concatenate([run[0] for run in runs]))
+            stops = stops[numpy.append(stops[1:] != stops[:-1], True)]
+            starts = numpy.append(slice_start, stops[:-1])
+            arrays = [values[numpy.searchsorted(
+                leaf_stops, starts, side="right")]
+                for (leaf_stops, values) in runs]
+        try:
+            with numpy.errstate(divide="raise", over="raise",
+                                invalid="raise"):
+                values = numpy.asarray(evaluate(arrays))
+        except (ArithmeticError, TypeError, ValueError):
+            return None
+        if values.shape != arrays[0].shape:
+            return None
+        return stops, values
+
+    def _fused_ranges(self, slice_start: int, slice_stop: int) -> Optional[
+            Tuple[NDArray, NDArray, NDArray]]:
+        """
+        Works out the ranges of a slice of the list in one NumPy pass over
+        the whole expression.
+
+        :return: The starts, stops and values of the ranges, or `None` if
+            the expression cannot be done this way; in that case the ranges
+            should be worked out one by one, which also raises any error
+        """
+        fused = self._fused_values(slice_start, slice_stop)
+        if fused is None:
+            return None
+        stops, values = fused
+        assert stops is not None
+        return numpy.append(slice_start, stops[:-1]), stops, values
+
+    def __cache_valid(self) -> bool:
+        version = self._cached_version
+        return version is not None and version == self.version()
+
+    @overrides(AbstractList.iter_ranges)
+    def iter_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        version = self.version()
+        if version is not None and version == self._cached_version:
+            return iter(self._cached_ranges)
+        fused = self._fused_ranges(0, len(self))
+        if fused is None:
+            ranges = self._compute_ranges()
+        else:
+            starts, stops, values = fused
+            ranges = zip(starts.tolist(), stops.tolist(), values.tolist())
+        if version is None:
+            return ranges
+        self._cached_ranges = list(ranges)
+        self._cached_stops = [stop for (_, stop, _) in self._cached_ranges]
+        self._cached_version = version
+        return iter(self._cached_ranges)
+
+    @overrides(AbstractList.iter_ranges_by_slice)
+    def iter_ranges_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[
+                Tuple[int, int, R]]:
+        if not self.__cache_valid():
+            # Only the slice is worked out, so nothing is kept
+            fused = self.__fused_slice(slice_start, slice_stop)
+            if fused is None:
+                return self._compute_ranges_by_slice(slice_start, slice_stop)
+            starts, stops, values = fused
+            return zip(starts.tolist(), stops.tolist(), values.tolist())
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        return _slice_ranges(self._cached_ranges, self._cached_stops,
+                             slice_start, slice_stop)
+
+    def __fused_slice(self, slice_start: int, slice_stop: int) -> Optional[
+            Tuple[NDArray, NDArray, NDArray]]:
+        if self._fusion() is None:
+            return None
+        return self._fused_ranges(
+            *self._check_slice_in_range(slice_start, slice_stop))
+
+    @overrides(AbstractList._slice_to_numpy)
+    def _slice_to_numpy(self, slice_start: int, slice_stop: int,
+                        dtype: Optional[DTypeLike]) -> NDArray:
+        # Apply the operation once per range even if not range based
+        fused = None
+        if not self.__cache_valid():
+            fused = self._fused_values(slice_start, slice_stop, True)
+        if fused is None:
+            return _ranges_to_array(list(
+                self.iter_ranges_by_slice(slice_start, slice_stop)), dtype)
+        stops, values = fused
+        if dtype is not None:
+            values = values.astype(dtype, copy=False)
+        if stops is None:
+            return values
+        return numpy.repeat(values, numpy.diff(stops, prepend=slice_start))
+
+    def to_numpy_parallel(
+            self, selector: Selector = None,
+            dtype: Optional[DTypeLike] = None,
+            workers: Optional[int] = None) -> NDArray:
+        """
+        Like :py:meth:`to_numpy`, but a large continuous slice is split into
+        chunks which are worked out at the same time by a pool of threads.
+
+        This only helps when the operations are vectorised, as NumPy lets
+        other threads run while it works; otherwise, or when the ranges of
+        the list are already known, this is the same as
+        :py:meth:`to_numpy`.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :param dtype: The NumPy type of the result, as in :py:meth:`to_numpy`
+        :param workers:
+            The most threads to use, or ``None`` for one per CPU
+        :rtype: ~numpy.ndarray
+        """
+        if selector is None:
+            slice_start, slice_stop = 0, self._size
+        elif isinstance(selector, slice) and (
+                selector.step is None or selector.step == 1):
+            slice_start, slice_stop = self._check_slice_in_range(
+                selector.start, selector.stop)
+        else:
+            return self.to_numpy(selector, dtype)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        fusion = self._fusion()
+        if (workers < 2 or slice_stop - slice_start < 2 * _PARALLEL_CHUNK
+                or fusion is None or self.__cache_valid()):
+            return self.to_numpy(slice(slice_start, slice_stop), dtype)
+        for leaf in fusion[0]:
+            # The leaves are lists too, settled before the threads read them
+            # pylint: disable-next=protected-access
+            leaf._settle()
+        starts = range(slice_start, slice_stop, _PARALLEL_CHUNK)
+        with ThreadPoolExecutor(min(workers, len(starts))) as pool:
+            chunks = list(pool.map(
+                lambda start: self._slice_to_numpy(
+                    start, min(start + _PARALLEL_CHUNK, slice_stop), dtype),
+                starts))
+        return numpy.concatenate(chunks)
@@ -0,0 +1,212 @@
+# Copyright (c) 2017 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from itertools import repeat
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, cast
+from numpy.typing import NDArray
+from spinn_utilities.abstract_base import AbstractBase
+from spinn_utilities.overrides import overrides
+from .abstract_list import AbstractList, IdsType, R, T, U
+from .derived_list import _DerivedList, _Fusion, _checked, _fusion_of
+
+
+class DualList(_DerivedList[R], Generic[T, U, R], metaclass=AbstractBase):
+    """
+    A list which combines two other lists with an operation.
+
+    .. note::
+        The ranges may be kept and reused until either list changes, so
+        the operation should always give the same result for the same values.
+    """
+    __slots__ = [
+        "_left", "_operation", "_right", "_vectorised"]
+
+    def __init__(self, left: AbstractList[T], right: AbstractList[U],
+                 operation: Callable[[T, U], R],
+                 key: Optional[str] = None, vectorised: bool = False):
+        """
+        :param AbstractList left: The first list to combine
+        :param AbstractList right: The second list to combine
+        :param callable operation:
+            The operation to perform as a function that takes two values and
+            returns the result of the operation
+        :param key:
+            The dict key this list covers.
+            This is used only for better Exception messages
+        :param vectorised:
+            True if the operation also works element by element on two
+            NumPy arrays of numbers, giving an array of the same length
+        :raises ValueError: If list are not the same size
+        """
+        if len(left) != len(right):
+            raise ValueError("Two list must have the same size")
+        super().__init__(size=len(left), key=key)
+        self._left = left
+        self._right = right
+        self._operation = operation
+        self._vectorised = vectorised
+
+    @overrides(AbstractList.range_based)
+    def range_based(self) -> bool:
+        return self._left.range_based() and self._right.range_based()
+
+    @overrides(AbstractList.version)
+    def version(self) -> Optional[Hashable]:
+        left = self._left.version()
+        right = self._right.version()
+        if left is None or right is None:
+            return None
+        return (left, right)
+
+    @overrides(_DerivedList._settle)
+    def _settle(self) -> None:
+        # The lists this is derived from are settled in the same way
+        # pylint: disable=protected-access
+        self._left._settle()
+        self._right._settle()
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id: int) -> R:
+        return self._operation(
+            self._left.get_value_by_id(the_id),
+            self._right.get_value_by_id(the_id))
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(
+            self, slice_start: int, slice_stop: int) -> R:
+        return self._operation(
+            self._left.get_single_value_by_slice(slice_start, slice_stop),
+            self._right.get_single_value_by_slice(slice_start, slice_stop))
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids: IdsType) -> R:
+        return self._operation(
+            self._left.get_single_value_by_ids(ids),
+            self._right.get_single_value_by_ids(ids))
+
+    @overrides(AbstractList.iter_by_slice)
+    def iter_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[R]:
+        slice_start, slice_stop = self._check_slice_in_range(
+            slice_start, slice_stop)
+        if not self.range_based():
+            fused = self._fused_values(slice_start, slice_stop, True)
+            if fused is not None:
+                stops, values = fused
+                if stops is None:
+                    yield from values.tolist()
+                    return
+                start = slice_start
+                for (stop, value) in zip(stops.tolist(), values.tolist()):
+                    yield from repeat(value, stop - start)
+                    start = stop
+                return
+        if self._left.range_based():
+            if self._right.range_based():
+
+                # Both lists are range based
+                for (start, stop, value) in \
+                        self.iter_ranges_by_slice(slice_start, slice_stop):
+                    for _ in range(start, stop):
+                        yield value
+            else:
+
+                # Left list is range based, right is not
+                left_iter = self._left.iter_ranges_by_slice(
+                    slice_start, slice_stop)
+                right_values = self._right.iter_by_slice(
+                    slice_start, slice_stop)
+                for (start, stop, left_value) in left_iter:
+                    for _ in range(start, stop):
+                        yield self._operation(left_value, next(right_values))
+        else:
+            if self._right.range_based():
+
+                # Right list is range based left is not
+                left_values = self._left.iter_by_slice(
+                    slice_start, slice_stop)
+                right_iter = self._right.iter_ranges_by_slice(
+                    slice_start, slice_stop)
+                for (start, stop, right_value) in right_iter:
+                    for _ in range(start, stop):
+                        yield self._operation(next(left_values), right_value)
+            else:
+
+                # Neither list is range based
+                left_values = self._left.iter_by_slice(slice_start, slice_stop)
+                right_values = self._right.iter_by_slice(
+                    slice_start, slice_stop)
+                while True:
+                    try:
+                        yield self._operation(
+                            next(left_values), next(right_values))
+                    except StopIteration:
+                        return
+
+    @overrides(_DerivedList._compute_ranges)
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        left_iter = self._left.iter_ranges()
+        right_iter = self._right.iter_ranges()
+        return self._merge_ranges(left_iter, right_iter)
+
+    @overrides(_DerivedList._fusion)
+    def _fusion(self) -> Optional[_Fusion]:
+        if not self._vectorised:
+            return None
+        left_leaves, left = _fusion_of(self._left)
+        right_leaves, right = _fusion_of(self._right)
+        split = len(left_leaves)
+        # A vectorised operation works on arrays as well as single values
+        operation = cast(
+            Callable[[NDArray, NDArray], NDArray], self._operation)
+        return left_leaves + right_leaves, lambda arrays: _checked(
+            operation, left(arrays[:split]), right(arrays[split:]))
+
+    @overrides(_DerivedList._compute_ranges_by_slice)
+    def _compute_ranges_by_slice(
+            self, slice_start: int, slice_stop: int) -> Iterator[
+                Tuple[int, int, R]]:
+        left_iter = self._left.iter_ranges_by_slice(slice_start, slice_stop)
+        right_iter = self._right.iter_ranges_by_slice(slice_start, slice_stop)
+        return self._merge_ranges(left_iter, right_iter)
+
+    def _merge_ranges(self, left_iter: Iterator[Tuple[int, int, T]],
+                      right_iter: Iterator[Tuple[int, int, U]]
+                      ) -> Iterator[Tuple[int, int, R]]:
+        (left_start, left_stop, left_value) = next(left_iter)
+        (right_start, right_stop, right_value) = next(right_iter)
+        try:
+            while True:
+                yield (max(left_start, right_start),
+                       min(left_stop, right_stop),
+                       self._operation(left_value, right_value))
+                if left_stop < right_stop:
+                    (left_start, left_stop, left_value) = next(left_iter)
+                elif left_stop > right_stop:
+                    (right_start, right_stop, right_value) = next(right_iter)
+                else:
+                    (left_start, left_stop, left_value) = next(left_iter)
+                    (right_start, right_stop, right_value) = next(right_iter)
+        except StopIteration:
+            return
+
+    @overrides(AbstractList.get_default)
+    def get_default(self) -> Optional[R]:
+        l_default = self._left.get_default()
+        if l_default is None:
+            return None
+        r_default = self._right.get_default()
+        if r_default is None:
+            return None
+        return self._operation(l_default, r_default)
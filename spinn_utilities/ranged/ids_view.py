@@ -15,9 +15,10 @@ from __future__ import annotations
 from typing import (
     Dict, Generic, Iterable, Iterator, Optional, Sequence, Tuple,
     overload, TYPE_CHECKING, Union)
+from numpy.typing import NDArray
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, _StrSeq, _Keys
-from .abstract_list import IdsType
+from .abstract_list import IdsType, _MAX_BLOCK
 from .abstract_view import AbstractView, T
 if TYPE_CHECKING:
     from .range_dictionary import RangeDictionary
@@ -64,12 +65,21 @@ class _IdsView(AbstractView[T], Generic[T]):
                     self._ids)
                 for k in key}
 
+    @overrides(AbstractDict.get_columns)
+    def get_columns(self, key: _Keys = None) -> Dict[str, NDArray]:
+        return self._range_dict.get_columns(key, self._ids)
+
+    @overrides(AbstractDict.iter_blocks)
+    def iter_blocks(self, key: str, max_block: int = _MAX_BLOCK
+                    ) -> Iterator[Tuple[int, int, NDArray]]:
+        return self._range_dict.iter_blocks(key, max_block, self._ids)
+
     @overrides(AbstractDict.set_value)
     def set_value(
             self, key: str, value: T, use_list_as_value: bool = False):
-        ranged_list = self._range_dict.get_list(key)
-        for _id in self._ids:
-            ranged_list.set_value_by_id(the_id=_id, value=value)
+        # Each ID is given the value, even if it is a list
+        self._range_dict.get_list(key).set_value_by_ids(
+            ids=self._ids, value=value, use_list_as_value=True)
 
     def set_value_by_ids(self, key: str, ids: Iterable[int], value: T):
         """
@@ -79,9 +89,8 @@ class _IdsView(AbstractView[T], Generic[T]):
         :param iter(int) ids:
         :param value:
         """
-        rl = self._range_dict[key]
-        for _id in ids:
-            rl.set_value_by_id(the_id=_id, value=value)
+        self._range_dict[key].set_value_by_ids(
+            ids=list(ids), value=value, use_list_as_value=True)
 
     @overload
     def iter_all_values(self, key: str, update_safe=False) -> Iterator[T]:
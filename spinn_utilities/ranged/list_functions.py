@@ -0,0 +1,184 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+import math
+from typing import (
+    Any, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union, cast,
+    TYPE_CHECKING)
+import numpy
+from numpy.typing import DTypeLike, NDArray
+if TYPE_CHECKING:
+    from .abstract_list import AbstractList
+#: :meta private:
+T = TypeVar("T")
+
+#: Largest size of a fused integer result that cannot have overflowed
+_SAFE_INT = 2 ** 62
+
+#: Types whose values are compared with ``==`` rather than by NumPy
+_SIMPLE_TYPES = frozenset((bool, int, float, str, type(None)))
+#: Most values kept by :py:func:`_intern` before it starts again
+_MAX_INTERNED = 4096
+_interned: Dict[Tuple[type, Any, float], Any] = {}
+
+
+def _intern(value: T) -> T:
+    """
+    Gets one shared object for all equal values of the same simple type,
+    so that they take memory once and are found equal by identity.
+
+    Other values are returned as they are, as are NaNs.
+    Signed zero floats are kept apart.
+    """
+    # The exact types keep bools, ints and NumPy scalars apart
+    # pylint: disable=unidiomatic-typecheck
+    if type(value) not in _SIMPLE_TYPES or value != value:
+        return value
+    if len(_interned) >= _MAX_INTERNED:
+        _interned.clear()
+    sign = math.copysign(1, cast(float, value)) \
+        if type(value) is float else 1
+    return _interned.setdefault((type(value), value, sign), value)
+
+
+def _as_array(values: Sequence[Any],
+              dtype: Optional[DTypeLike] = None) -> NDArray:
+    """
+    Converts a sequence of values into a one dimensional NumPy array.
+
+    Without a ``dtype``, values that NumPy would treat as more than one
+    element each (such as lists), or that do not share a type NumPy can
+    hold, give an array of objects.
+    """
+    if dtype is not None:
+        return numpy.array(values, dtype=dtype)
+    try:
+        array = numpy.array(values)
+    except ValueError:
+        array = None
+    if array is None or array.ndim != 1 or (
+            array.dtype.kind in "USV" and not all(
+                isinstance(value, (str, bytes)) for value in values)):
+        array = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+    return array
+
+
+#: The Python types of values which NumPy arrays can hold exactly
+_EXACT_DTYPES = {bool: numpy.bool_, int: numpy.int64, float: numpy.float64}
+
+
+def _exact_array(values: Sequence[Any]) -> Optional[NDArray]:
+    """
+    Converts values to a NumPy array, if they are all simple numbers of the
+    same Python type, so that ``tolist()`` gives back equal values.
+    """
+    types = set(map(type, values))
+    if len(types) != 1:
+        return None
+    dtype = _EXACT_DTYPES.get(types.pop())
+    if dtype is None:
+        return None
+    try:
+        return numpy.array(values, dtype=dtype)
+    except OverflowError:
+        return None
+
+
+def _ranges_to_array(ranges: Sequence[Tuple[int, int, Any]],
+                     dtype: Optional[DTypeLike] = None) -> NDArray:
+    """
+    Expands ranges into an array with one element per ID,
+    repeating the value of each range rather than going element by element.
+    """
+    lengths = [stop - start for (start, stop, _) in ranges]
+    values = _as_array([value for (_, _, value) in ranges], dtype)
+    return numpy.repeat(values, lengths)
+
+
+def _run_starts(values: Union[Sequence[Any], NDArray]) -> Optional[
+        NDArray[numpy.intp]]:
+    """
+    Finds the index where each run of equal values starts, using NumPy.
+
+    :return: The start indexes,
+        or `None` if the values are not all simple numbers
+    """
+    try:
+        array = numpy.asarray(values)
+    except ValueError:
+        return None
+    if array.ndim != 1 or array.dtype.kind not in "biuf" or \
+            len(array) == 0:
+        return None
+    return numpy.append(0, numpy.flatnonzero(array[1:] != array[:-1]) + 1)
+
+
+def _slice_ranges(ranges: Sequence[Tuple[int, int, T]], stops: Sequence[int],
+                  slice_start: int, slice_stop: int) -> Iterator[
+                      Tuple[int, int, T]]:
+    """
+    Yields the ranges that overlap a checked slice, cut down to the slice,
+    finding the first by bisection of the stops of the ranges.
+    """
+    first = bisect_right(stops, slice_start)
+    last = max(first, bisect_left(stops, slice_stop, lo=first))
+    for (start, stop, value) in ranges[first:last + 1]:
+        yield (max(start, slice_start), min(stop, slice_stop), value)
+
+
+def _slice_runs(a_list: AbstractList, slice_start: int, slice_stop: int
+                ) -> Optional[Tuple[NDArray[numpy.int64], NDArray]]:
+    """
+    Gets the stops and values of the runs of a checked non-empty slice of a
+    list as arrays.
+
+    :return: The stops and values, or `None` if the list is not range
+        based and its values are not all simple numbers
+    """
+    if not a_list.range_based():
+        values = a_list.to_numpy(slice(slice_start, slice_stop))
+        starts = _run_starts(values)
+        if starts is None:
+            return None
+        return (numpy.append(starts[1:], len(values)) + slice_start,
+                values[starts])
+    ranges = _ranges_of_slice(a_list, slice_start, slice_stop)
+    stops = numpy.array([stop for (_, stop, _) in ranges], dtype=numpy.int64)
+    return stops, _as_array([value for (_, _, value) in ranges])
+
+
+def _ranges_of_slice(a_list: AbstractList, slice_start: int,
+                     slice_stop: int) -> List[Tuple[int, int, Any]]:
+    """
+    Gets the ranges of a checked slice of a range based list.
+    """
+    if slice_start == 0 and slice_stop == len(a_list):
+        # Lets a list that keeps its ranges do so
+        return list(a_list.iter_ranges())
+    return list(a_list.iter_ranges_by_slice(slice_start, slice_stop))
+
+
+def _weighted_total(lengths: Optional[NDArray[numpy.int64]],
+                    values: NDArray, dtype: DTypeLike) -> Any:
+    """
+    Adds up simple number values, each counted as many times as its length
+    (or once if there are no lengths), in the given type.
+    """
+    if lengths is None:
+        return values.sum(dtype=dtype)
+    return numpy.dot(lengths.astype(dtype, copy=False),
+                     values.astype(dtype, copy=False))
@@ -0,0 +1,170 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar, Union
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.abstract_base import AbstractBase, abstractmethod
+from .abstract_sized import AbstractSized, Selector
+from .list_functions import _SAFE_INT, _weighted_total
+#: :meta private:
+T = TypeVar("T")
+
+
+class _ListStatistics(AbstractSized, Generic[T], metaclass=AbstractBase):
+    """
+    Statistics of the values of the elements of a list, each worked
+    out a range of equal values at a time.
+    """
+    __slots__ = ()
+
+    @abstractmethod
+    def _weighted_values(self, selector: Selector) -> Tuple[
+            Optional[NDArray[numpy.int64]], NDArray]:
+        """
+        Gets the values pointed to by the selector, with each range of equal
+        values of a continuous slice of a range based list given once along
+        with its length.
+
+        :return: The length of each range, or `None` if each value is for a
+            single element, and the values
+        """
+        raise NotImplementedError
+
+    def sum(self, selector: Selector = None) -> Any:
+        """
+        Adds up the values of all elements pointed to by the selector.
+
+        Each range of equal values is counted in a single step, so this
+        takes time in proportion to the number of ranges, not elements.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The total, which is ``0`` if nothing is selected
+        """
+        lengths, values = self._weighted_values(selector)
+        kind = values.dtype.kind
+        if kind == "f":
+            return float(_weighted_total(lengths, values, numpy.float64))
+        if kind in "biu" and abs(_weighted_total(
+                lengths, values, numpy.float64)) < _SAFE_INT:
+            return int(_weighted_total(lengths, values, numpy.int64))
+        # Objects or integers too big for NumPy
+        if lengths is None:
+            return sum(values.tolist())
+        return sum(length * value for length, value in zip(
+            lengths.tolist(), values.tolist()))
+
+    def mean(self, selector: Selector = None) -> Any:
+        """
+        Gets the mean of the values of all elements pointed to by the
+        selector, in time in proportion to the number of ranges.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The mean
+        :raises ValueError: If nothing is selected
+        """
+        lengths, values = self._weighted_values(selector)
+        count = len(values) if lengths is None else int(lengths.sum())
+        if count == 0:
+            raise ValueError("mean of an empty selection")
+        if values.dtype.kind in "biuf":
+            return float(_weighted_total(
+                lengths, values, numpy.float64)) / count
+        return self.sum(selector) / count
+
+    def min(self, selector: Selector = None) -> T:
+        """
+        Gets the smallest of the values of all elements pointed to by the
+        selector, looking at each range only once.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The smallest value
+        :raises ValueError: If nothing is selected
+        """
+        _, values = self._weighted_values(selector)
+        if len(values) == 0:
+            raise ValueError("min of an empty selection")
+        return values.min().item() if values.dtype.kind in "biuf" \
+            else min(values.tolist())
+
+    def max(self, selector: Selector = None) -> T:
+        """
+        Gets the largest of the values of all elements pointed to by the
+        selector, looking at each range only once.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The largest value
+        :raises ValueError: If nothing is selected
+        """
+        _, values = self._weighted_values(selector)
+        if len(values) == 0:
+            raise ValueError("max of an empty selection")
+        return values.max().item() if values.dtype.kind in "biuf" \
+            else max(values.tolist())
+
+    def unique_with_counts(self, selector: Selector = None) -> Tuple[
+            NDArray, NDArray[numpy.int64]]:
+        """
+        Gets the different values of the elements pointed to by the
+        selector and how many elements have each, in time in proportion to
+        the number of ranges.
+
+        Like :py:func:`numpy.unique` with ``return_counts=True``,
+        the values are sorted and NaNs are counted together.
+
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The sorted values and the count of each
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        :raises TypeError: If the values can not be sorted
+        """
+        lengths, values = self._weighted_values(selector)
+        if len(values) == 0:
+            return values, numpy.empty(0, dtype=numpy.int64)
+        order = numpy.argsort(values, kind="stable")
+        values = values[order]
+        changes = values[1:] != values[:-1]
+        if values.dtype.kind == "f":
+            nans = numpy.isnan(values)
+            changes &= ~(nans[1:] & nans[:-1])
+        firsts = numpy.append(0, numpy.flatnonzero(changes) + 1)
+        if lengths is None:
+            counts = numpy.diff(firsts, append=len(values))
+        else:
+            counts = numpy.add.reduceat(lengths[order], firsts)
+        return values[firsts], counts
+
+    def histogram(
+            self, bins: Union[int, Sequence[float]] = 10,
+            value_range: Optional[Tuple[float, float]] = None,
+            selector: Selector = None) -> Tuple[
+                NDArray[numpy.int64], NDArray[numpy.float64]]:
+        """
+        Counts how many of the elements pointed to by the selector have
+        values in each bin, in time in proportion to the number of ranges.
+
+        The bins are as for :py:func:`numpy.histogram`.
+
+        :param bins: The number of equal width bins, or the edges of the bins
+        :param value_range: The lower and upper edges of the bins if
+            ``bins`` is a number; by default the smallest and largest values
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: The count of each bin and the edges of the bins
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        lengths, values = self._weighted_values(selector)
+        if len(values) == 0:
+            values = numpy.empty(0)
+        counts, edges = numpy.histogram(
+            values, bins, value_range, weights=lengths)
+        return counts.astype(numpy.int64), edges
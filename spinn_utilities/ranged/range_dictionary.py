@@ -12,14 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from __future__ import annotations
+import os
+import pickle
 from typing import (
-    Dict, Generator, Iterable, Iterator, Optional, Sequence, Tuple, Union,
-    Generic, overload, TYPE_CHECKING)
+    Any, Dict, Generator, Iterable, Iterator, List, Optional, Sequence,
+    Tuple, Union, Generic, overload, TYPE_CHECKING)
+import numpy
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, T, _StrSeq
-from .abstract_sized import AbstractSized
-from .abstract_list import IdsType
+from .abstract_sized import AbstractSized, Selector
+from .abstract_list import IdsType, _MAX_BLOCK
+from .list_functions import _as_array, _exact_array
 from .ids_view import _IdsView
 from .ranged_list import RangedList
 from .single_view import _SingleView
@@ -34,6 +39,13 @@ _Range: TypeAlias = Tuple[int, int, T]
 _SimpleRangeIter: TypeAlias = Iterator[_Range]
 _CompoundRangeIter: TypeAlias = Iterator[Tuple[int, int, Dict[str, T]]]
 
+#: Name of the file listing the keys in a saved dictionary
+_INDEX = "index.pickle"
+#: Version of the layout of a saved dictionary
+_FORMAT = 1
+#: Added to the name of a file of a save while it is being written
+_PARTIAL = ".partial"
+
 
 class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
     """
@@ -218,6 +230,74 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
         """
         return self._value_lists[key]
 
+    @overload
+    def to_numpy(self, key: str, selector: Selector = None) -> NDArray:
+        ...
+
+    @overload
+    def to_numpy(self, key: Optional[_StrSeq] = None,
+                 selector: Selector = None) -> Dict[str, NDArray]:
+        ...
+
+    def to_numpy(self, key: _Keys = None, selector: Selector = None
+                 ) -> Union[NDArray, Dict[str, NDArray]]:
+        """
+        Gets the values of one or more keys as NumPy arrays.
+
+        See :py:meth:`AbstractList.to_numpy`.
+
+        :param key: The key or keys to get the values of. Use `None` for all
+        :type key: str or iterable(str) or None
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: If key is a str, an array with one element per ID selected.
+            If key is iterable (list, tuple, set, etc.) of str (or `None`),
+            a dictionary of such arrays
+        """
+        if isinstance(key, str):
+            return self._value_lists[key].to_numpy(selector)
+        if key is None:
+            key = list(self.keys())
+        return {
+            a_key: self._value_lists[a_key].to_numpy(selector)
+            for a_key in key}
+
+    @overrides(AbstractDict.get_columns, extend_doc=False,
+               additional_arguments=["selector"], extend_defaults=True)
+    def get_columns(self, key: _Keys = None, selector: Selector = None
+                    ) -> Dict[str, NDArray]:
+        """
+        Gets the values of one or more keys as NumPy arrays.
+
+        Same as :py:meth:`to_numpy` but always gives a dictionary.
+
+        :param key: The key or keys to get the values of. Use `None` for all
+        :type key: str or iterable(str) or None
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: A dictionary of key to array of values
+        """
+        if isinstance(key, str):
+            key = [key]
+        return self.to_numpy(key, selector)
+
+    @overrides(AbstractDict.iter_blocks, extend_doc=False,
+               additional_arguments=["selector"], extend_defaults=True)
+    def iter_blocks(self, key: str, max_block: int = _MAX_BLOCK,
+                    selector: Selector = None) -> Iterator[
+                        Tuple[int, int, NDArray]]:
+        """
+        Iterates over the values of a key a block of IDs at a time rather
+        than one by one.
+
+        See :py:meth:`AbstractList.iter_blocks`.
+
+        :param str key: The key to get the values of
+        :param int max_block:
+            The most IDs in a block with one value per ID
+        :param selector: See :py:meth:`AbstractSized.selector_to_ids`
+        :return: yields tuples of (`start`, `stop`, `values`)
+        """
+        return self._value_lists[key].iter_blocks(selector, max_block)
+
     @overload
     def update_safe_iter_all_values(
             self, key: str, ids: IdsType) -> Generator[T, None, None]: ...
@@ -373,35 +453,80 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
     def keys(self) -> Iterable[str]:
         return self._value_lists.keys()
 
+    def _merge_columns(
+            self, range_iters: Dict[str, Iterator[Tuple[int, int, T]]]
+            ) -> Tuple[NDArray[numpy.int64], NDArray[numpy.int64],
+                       Dict[str, List[T]]]:
+        """
+        Merges the ranges of several keys, which must all cover the same
+        IDs, into the ranges over which none of the keys change value.
+
+        All the boundaries are merged in one go rather than stepping through
+        the keys once per range.
+
+        :return: The starts and stops of the merged ranges, and for each key
+            the value in each merged range
+        """
+        key_ranges = {key: list(ranges) for key, ranges in range_iters.items()}
+        if not key_ranges:
+            return (numpy.array([0], dtype=numpy.int64),
+                    numpy.array([self._size], dtype=numpy.int64), {})
+        key_stops = {
+            key: numpy.array([stop for (_, stop, _) in ranges],
+                             dtype=numpy.int64)
+            for key, ranges in key_ranges.items()}
+        first = next(iter(key_ranges.values()))
+        first_starts = numpy.array(
+            [start for (start, _, _) in first], dtype=numpy.int64)
+        cuts = numpy.sort(numpy.concatenate(
+            [first_starts, *key_stops.values()]))
+        cuts = cuts[numpy.append(True, cuts[1:] != cuts[:-1])]
+        starts = cuts[:-1]
+        stops = cuts[1:]
+        # Drop the gaps between IDs that are not included
+        first_stops = next(iter(key_stops.values()))
+        covered = first_starts[numpy.searchsorted(
+            first_stops, starts, side="right")] <= starts
+        starts = starts[covered]
+        stops = stops[covered]
+        columns: Dict[str, List[T]] = dict()
+        for key, ranges in key_ranges.items():
+            index = numpy.searchsorted(key_stops[key], starts, side="right")
+            columns[key] = [ranges[i][2] for i in index.tolist()]
+        return starts, stops, columns
+
     def _merge_ranges(
             self, range_iters: Dict[str, Iterator[Tuple[int, int, T]]]
             ) -> Iterator[Tuple[int, int, Dict[str, T]]]:
-        current: Dict[str, T] = dict()
-        ranges: Dict[str, Tuple[int, int, T]] = dict()
-        start = 0
-        stop = self._size
-        keys = range_iters.keys()
-        for key in keys:
-            ranges[key] = next(range_iters[key])
-            start = ranges[key][0]
-            current[key] = ranges[key][2]
-            stop = min(ranges[key][1], stop)
-        yield (start, stop, current)
-        while stop < self._size:
-            current = dict()
-            start = self._size
-            next_stop = self._size
-            for key in keys:
-                try:
-                    if ranges[key][1] == stop:
-                        ranges[key] = next(range_iters[key])
-                except StopIteration:
-                    return
-                start = min(max(ranges[key][0], stop), start)
-                next_stop = min(ranges[key][1], next_stop)
-                current[key] = ranges[key][2]
-            stop = next_stop
-            yield (start, stop, current)
+        starts, stops, columns = self._merge_columns(range_iters)
+        keys = list(columns.keys())
+        if not keys:
+            yield (int(starts[0]), int(stops[0]), dict())
+            return
+        for start, stop, values in zip(
+                starts.tolist(), stops.tolist(), zip(*columns.values())):
+            yield (start, stop, dict(zip(keys, values)))
+
+    def get_range_columns(self, key: _Keys = None) -> Tuple[
+            NDArray[numpy.int64], NDArray[numpy.int64], Dict[str, NDArray]]:
+        """
+        Gets the same ranges as :py:meth:`iter_ranges`, but as columns
+        rather than as a dictionary per range.
+
+        :param key: The key or keys to include. Use `None` for all
+        :type key: str or iterable(str) or None
+        :return: The starts and stops of the ranges, and a dictionary of
+            the value of each key in each range, as arrays in the same way
+            as :py:meth:`to_numpy`
+        """
+        if isinstance(key, str):
+            key = [key]
+        elif key is None:
+            key = list(self.keys())
+        starts, stops, columns = self._merge_columns({
+            a_key: self._value_lists[a_key].iter_ranges() for a_key in key})
+        return starts, stops, {
+            a_key: _as_array(values) for a_key, values in columns.items()}
 
     @overload
     def iter_ranges(self, key: str) -> Iterator[Tuple[int, int, T]]:
@@ -540,6 +665,59 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
     def get_default(self, key: str) -> Optional[T]:
         return self._value_lists[key].get_default()
 
+    def compact(self):
+        """
+        Compacts the list of every key.
+
+        See :py:meth:`RangedList.compact`.
+        """
+        for value_list in self._value_lists.values():
+            value_list.compact()
+
+    def dirty_keys(self) -> List[str]:
+        """
+        Gets the keys with values that may have changed since their dirty
+        ranges were last popped.
+
+        See :py:meth:`RangedList.pop_dirty_ranges`.
+
+        :rtype: list(str)
+        """
+        return [key for key, value_list in self._value_lists.items()
+                if value_list.has_dirty_ranges()]
+
+    def pop_dirty_ranges(self, key: str) -> List[Tuple[int, int]]:
+        """
+        Gets the slices of IDs whose values for a key may have changed since
+        this was last called for the key, and forgets them.
+
+        See :py:meth:`RangedList.pop_dirty_ranges`.
+
+        :param str key: Existing dict key
+        :return: The start and (exclusive) stop of each slice, sorted
+        :rtype: list(tuple(int, int))
+        """
+        return self._value_lists[key].pop_dirty_ranges()
+
+    def memory_report(self) -> str:
+        """
+        Describes how the values of each key are held, and roughly how much
+        memory that takes, one key per line.
+
+        :rtype: str
+        """
+        lines = []
+        for key, value_list in self._value_lists.items():
+            mode = value_list.storage_mode()
+            if mode == "ranges":
+                count = f"{len(value_list.get_ranges())} ranges"
+            else:
+                count = f"{len(value_list)} values"
+            lines.append(
+                f"{key}: {mode} of {count}, "
+                f"about {value_list.estimated_bytes()} bytes")
+        return "\n".join(lines)
+
     def copy_into(self, other: RangeDictionary[T]):
         """
         Turns this dict into a copy of the other dict but keep its id.
@@ -559,6 +737,92 @@ class RangeDictionary(AbstractSized, AbstractDict[T], Generic[T]):
                     len(value), key=key)
                 self._value_lists[key].copy_into(value)
 
+    def save(self, path: str):
+        """
+        Saves the dictionary to a directory, to be read back with
+        :py:meth:`load`.
+
+        Keys with one value per ID held in a NumPy array are saved as
+        ``.npy`` files, which :py:meth:`load` can memory map.
+        Everything else goes in one pickled index, with ranges and values
+        held as NumPy arrays where they are simple numbers of one type.
+
+        Each file is written under another name and then moved into place,
+        with the index last, so a dictionary memory mapped by
+        :py:meth:`load` can be saved back to the directory it came from.
+
+        :param str path: The directory to save in; created if needed
+        """
+        os.makedirs(path, exist_ok=True)
+        index: List[Dict[str, Any]] = []
+        for number, (key, value_list) in enumerate(
+                self._value_lists.items()):
+            # The values are saved as the list holds them
+            # pylint: disable-next=protected-access
+            stops, values = value_list._get_storage()
+            entry: Dict[str, Any] = {
+                "key": key, "class": type(value_list),
+                "default": value_list.get_default(),
+                "dtype": value_list.dtype, "stops": None, "values": None}
+            if isinstance(values, numpy.ndarray):
+                file_name = os.path.join(path, f"{number}.npy")
+                with open(file_name + _PARTIAL, "wb") as f:
+                    numpy.save(f, values)
+                os.replace(file_name + _PARTIAL, file_name)
+            else:
+                array = _exact_array(values)
+                entry["values"] = values if array is None else array
+            if stops is not None:
+                entry["stops"] = numpy.array(stops, dtype=numpy.int64)
+            index.append(entry)
+        file_name = os.path.join(path, _INDEX)
+        with open(file_name + _PARTIAL, "wb") as f:
+            pickle.dump({"format": _FORMAT, "size": self._size,
+                         "keys": index}, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(file_name + _PARTIAL, file_name)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> RangeDictionary:
+        """
+        Reads a dictionary saved with :py:meth:`save`.
+
+        .. warning::
+            The index of the save is read with :py:mod:`pickle`, so only
+            load directories from a trusted source.
+
+        :param str path: The directory the dictionary was saved in
+        :param bool mmap:
+            If True, keys which had one value per ID held in a NumPy array
+            are memory mapped, so their values are only read from the file
+            as they are used.
+            Changes to them are kept in memory; the file is not changed.
+        :rtype: RangeDictionary
+        """
+        with open(os.path.join(path, _INDEX), "rb") as f:
+            index = pickle.load(f)
+        if index["format"] != _FORMAT:
+            raise ValueError(f"Unknown format {index['format']} in {path}")
+        size = index["size"]
+        range_dict = cls(size)
+        for number, entry in enumerate(index["keys"]):
+            key = entry["key"]
+            value_list = entry["class"](size, None, key, dtype=entry["dtype"])
+            value_list.set_default(entry["default"])
+            stops = entry["stops"]
+            if stops is not None:
+                stops = stops.tolist()
+            values = entry["values"]
+            if values is None:
+                values = numpy.load(os.path.join(path, f"{number}.npy"),
+                                    mmap_mode="c" if mmap else None)
+            elif isinstance(values, numpy.ndarray):
+                values = values.tolist()
+            # The values are given back as the list held them
+            # pylint: disable-next=protected-access
+            value_list._set_storage(stops, values)
+            range_dict._value_lists[key] = value_list
+        return range_dict
+
     def copy(self) -> RangeDictionary[T]:
         """
         Make a copy of this dictionary. Inner ranged entities are deep copied,
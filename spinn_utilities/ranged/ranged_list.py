@@ -15,20 +15,32 @@ from __future__ import annotations
 from collections.abc import Sized
 from typing import (
     Any, Callable, Generic, List, Iterable, Iterator, Optional, Sequence,
-    Tuple, Union, cast, final)
+    Tuple, TypeVar, Union, cast, final)
+import numpy
+from numpy.typing import DTypeLike, NDArray
 from typing_extensions import TypeAlias, TypeGuard
 from spinn_utilities.overrides import overrides
 from spinn_utilities.helpful_functions import is_singleton
+from .abstract_list import AbstractList, T, _eq, IdsType, is_number
 from .abstract_sized import Selector
-from .abstract_list import AbstractList, T, _eq, IdsType
+from .bit_array import _BitArray, _as_bit
+from .chunked_values import ChunkedValues, _LazyArray
+from .list_functions import _as_array, _slice_ranges
 from .multiple_values_exception import MultipleValuesException
+from .ranged_list_storage import (
+    _DIRTY_JOIN, _MERGE_LOCK, _RangeType, _RangedListStorage, _id_runs)
 
-#: The type of a range descriptor
-_RangeType: TypeAlias = Tuple[int, int, T]
+#: The type of a function marked by :py:func:`vectorised_function`
+_F = TypeVar("_F", bound=Callable[[NDArray[numpy.int64]], Any])
 # The type of things we consider to be a list of values
 _ListType: TypeAlias = Union[Callable[[int], T], Sequence[T]]
 # The type of value arguments in several places
 _ValueType: TypeAlias = Optional[Union[T, _ListType]]
+# Attribute set on functions marked by vectorised_function
+_VECTORISED = "_ranged_vectorised"
+# How many IDs written one at a time a range based list holds apart from
+# its ranges before merging them in
+_MAX_OVERRIDES = 4096
 
 
 def function_iterator(
@@ -50,23 +62,106 @@ def function_iterator(
     :return: a sequence of values returned by the function
     :rtype: ~collections.abc.Iterable(object)
     """
+    if _is_vectorised(function):
+        yield from _call_vectorised(function, size, ids).tolist()
+        return
     if ids is None:
         ids = range(size)
     for _id in ids:
         yield function(_id)
 
 
-class RangedList(AbstractList[T], Generic[T]):
+def vectorised_function(function: _F) -> _F:
+    """
+    Marks a function of an ID as also able to work out the values of many
+    IDs at once, when called with a NumPy array of them.
+
+    A :py:class:`RangedList` given a marked function as its value calls it
+    once with all the IDs to set, rather than once for each ID, as in::
+
+        data["v"] = vectorised_function(lambda ids: -65.0 + ids * 0.001)
+
+    NumPy ufuncs and :py:class:`numpy.vectorize` objects are treated as
+    marked without this.
+
+    :param ~collections.abc.Callable function:
+        A function that returns an array of the values of an array of IDs
+    :return: The same function
+    """
+    setattr(function, _VECTORISED, True)
+    return function
+
+
+def _is_vectorised(function: Callable) -> bool:
+    return isinstance(
+        function, (numpy.ufunc, numpy.vectorize, ChunkedValues)) or \
+        getattr(function, _VECTORISED, False)
+
+
+def _call_vectorised(function: Callable, size: int,
+                     ids: Optional[Iterable[int]]) -> NDArray:
+    """
+    Calls a vectorised function once with an array of the IDs.
+    """
+    if ids is None:
+        id_array = numpy.arange(size, dtype=numpy.int64)
+    elif isinstance(ids, range):
+        id_array = numpy.arange(
+            ids.start, ids.stop, ids.step, dtype=numpy.int64)
+    else:
+        id_array = numpy.fromiter(ids, dtype=numpy.int64)
+    values = numpy.asarray(function(id_array))
+    if values.ndim == 0:
+        raise ValueError(
+            "A vectorised function must return one value for each ID")
+    return values
+
+
+class RangedList(_RangedListStorage[T], Generic[T]):
     """
     A list that is able to efficiently hold large numbers of elements
     that all have the same value.
+
+    When range based, the (exclusive) stop of every range is also held in a
+    sorted list so that the range holding any ID can be found by bisection.
+
+    If a ``dtype`` is given, a list that is not range based holds its values
+    in a NumPy array of that type rather than a Python list, and all values
+    are converted to that type as they are set.
+    Values are still returned as Python objects.
+
+    After bulk writes the list may switch between being range based and
+    holding one value per ID if the other is estimated to use much less
+    memory; see :py:meth:`compact`.
+
+    When not range based, the ranges are worked out (using NumPy if the
+    values are simple numbers) the first time they are needed and kept
+    until the next write.
+
+    The slices of IDs written to are recorded, so that work that depends
+    on the values can be redone for just those that may have changed;
+    see :py:meth:`pop_dirty_ranges`.
+
+    A copy shares the values of the list it was copied from until either
+    is written to, so copies that are never changed cost very little.
+
+    A list with a ``dtype`` of ``bool`` holds one bit per ID when not range
+    based.
+    Small integers are best held with a ``dtype`` such as ``uint8``.
+
+    A list with a ``dtype`` set to :py:class:`ChunkedValues` makes only
+    the values that are read until it is first written to.
+
+    A range based list keeps values written one ID at a time apart from its
+    ranges, and merges them into the ranges in one go when there are many
+    of them or when the ranges are next read.
     """
-    __slots__ = [
-        "_default", "_ranged_based", "_ranges"]
+    __slots__ = ["_default"]
 
     def __init__(
             self, size: Optional[int] = None, value: _ValueType = None,
-            key=None, use_list_as_value=False):
+            key=None, use_list_as_value=False,
+            dtype: Optional[DTypeLike] = None):
         """
         :param size:
             Fixed length of the list;
@@ -77,6 +172,9 @@ class RangedList(AbstractList[T], Generic[T]):
         :param key: The dict key this list covers.
             This is used only for better Exception messages
         :param bool use_list_as_value: True if the value *is* a list
+        :param dtype:
+            The NumPy type of the values, or ``None`` to hold any objects
+        :type dtype: ~numpy.dtype or None
         """
         if size is None:
             try:
@@ -84,14 +182,12 @@ class RangedList(AbstractList[T], Generic[T]):
             except TypeError as e:
                 raise ValueError("value parameter must have a length to "
                                  "determine the unsupplied size") from e
-        super().__init__(size=size, key=key)
+        super().__init__(size=size, key=key, dtype=dtype)
         if not use_list_as_value and (
                 not self.is_list(value, size) or self.__length(value) != size):
             self._default: Optional[T] = cast(Optional[T], value)
         else:
             self._default = None
-        self._ranges: Union[List[T], List[_RangeType]]
-        self._ranged_based: Optional[bool] = None
         self.set_value(value, use_list_as_value=use_list_as_value)
 
     def __length(self, value: Any) -> int:
@@ -105,31 +201,27 @@ class RangedList(AbstractList[T], Generic[T]):
     def range_based(self) -> bool:
         return self._ranged_based or False
 
-    @property
-    def __the_ranges(self) -> List[_RangeType]:
-        assert self._ranged_based
-        return cast(List[_RangeType], self._ranges)
-
-    @property
-    def __the_values(self) -> List[T]:
-        assert not self._ranged_based
-        return cast(List[T], self._ranges)
-
     @overrides(AbstractList.get_value_by_id)
     def get_value_by_id(self, the_id: int) -> T:
         the_id = self._check_id_in_range(the_id)
 
         # If range based, find the range containing the value and return
         if self._ranged_based:
-            for (_, stop, value) in self.__the_ranges:
-                if the_id < stop:
-                    return value  # pragma: no cover
-
-            # Must never get here because the ID is in range
-            raise ValueError  # pragma: no cover
+            if not self._overrides:
+                return cast(List[_RangeType], self._ranges)[
+                    self._find_range(the_id)][2]
+            # The ranges may be part way through having the IDs merged in
+            with _MERGE_LOCK:
+                pending = self._overrides
+                if pending and the_id in pending:
+                    return pending[the_id]
+                return cast(List[_RangeType], self._ranges)[
+                    self._find_range(the_id)][2]
 
         # Non-range-based so just return the value
-        return self.__the_values[the_id]
+        if self._dtype is not None:
+            return cast(NDArray, self._ranges).item(the_id)
+        return self._the_values[the_id]
 
     @overrides(AbstractList.get_single_value_by_slice)
     def get_single_value_by_slice(
@@ -142,28 +234,27 @@ class RangedList(AbstractList[T], Generic[T]):
             found_value = False
             result = None
 
-            # Go through the ranges until in range (assumed sorted)
-            for (_, stop, value) in self.__the_ranges:
+            # Go through the ranges from the one holding the slice start
+            ranges = self._the_ranges
+            for index in range(self._find_range(slice_start), len(ranges)):
+                (_, stop, value) = ranges[index]
 
-                # If we have found a range in the slice
-                if slice_start < stop:
+                # If we have already found a range in the slice, check the
+                # value is the same
+                if found_value:
+                    if not _eq(result, value):
+                        raise MultipleValuesException(
+                            self._key, result, value)
 
-                    # If we have already found a range in the slice, check the
-                    # value is the same
-                    if found_value:
-                        if not _eq(result, value):
-                            raise MultipleValuesException(
-                                self._key, result, value)
+                # If this is the first range in the slice, store it
+                else:
+                    result = value
+                    found_value = True
 
-                    # If this is the first range in the slice, store it
-                    else:
-                        result = value
-                        found_value = True
-
-                    # If we have found a range that finishes outside of the
-                    # slice, we have done, and can safely return the value
-                    if slice_stop <= stop:
-                        return value
+                # If we have found a range that finishes outside of the
+                # slice, we have done, and can safely return the value
+                if slice_stop <= stop:
+                    return value
 
             # This must be never possible, as the slices must be in range of
             # the list
@@ -171,8 +262,15 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # A non-range based list just has lots of single values, so check
         # they are all the same within the slice
-        result = self.__the_values[slice_start]
-        for value in self.__the_values[slice_start+1: slice_stop]:
+        if self._dtype is not None:
+            values = cast(NDArray, self._ranges)[slice_start:slice_stop]
+            different = numpy.flatnonzero(values != values[0])
+            if len(different):
+                raise MultipleValuesException(
+                    self._key, values.item(0), values.item(different[0]))
+            return values.item(0)
+        result = self._the_values[slice_start]
+        for value in self._the_values[slice_start+1: slice_stop]:
             if not _eq(result, value):
                 raise MultipleValuesException(self._key, result, value)
         return result
@@ -188,6 +286,26 @@ class RangedList(AbstractList[T], Generic[T]):
                 raise MultipleValuesException(self._key, result, value)
         return result
 
+    @overrides(AbstractList.iter_by_ids)
+    def iter_by_ids(self, ids: IdsType) -> Iterator[T]:
+        if not self._ranged_based:
+            if self._dtype is not None:
+                yield from cast(NDArray, self._ranges)[
+                    numpy.asarray(ids, dtype=numpy.intp)].tolist()
+            else:
+                values = self._the_values
+                for id_value in ids:
+                    yield values[id_value]
+            return
+        ranges = self._the_ranges
+        for id_value in ids:
+            yield ranges[self._find_range(id_value)][2]
+
+    @overrides(AbstractList.iter_ranges_by_id)
+    def iter_ranges_by_id(self, the_id: int) -> Iterator[_RangeType]:
+        the_id = self._check_id_in_range(the_id)
+        yield (the_id, the_id + 1, self.get_value_by_id(the_id))
+
     def __iter__(self) -> Iterator[T]:
         """
         Fast but *not* update-safe iterator of all elements.
@@ -198,12 +316,11 @@ class RangedList(AbstractList[T], Generic[T]):
         :return: yields each element one by one
         """
         if self._ranged_based:
-            for (start, stop, value) in self.__the_ranges:
+            for (start, stop, value) in self._the_ranges:
                 for _ in range(stop - start):
                     yield value
         else:
-            for value in self.__the_values:
-                yield value
+            yield from self._dense_values(0, self._size)
 
     @overrides(AbstractList.iter_by_slice)
     def iter_by_slice(self, slice_start: int, slice_stop: int) -> Iterator[T]:
@@ -212,51 +329,24 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # If non-range-based, just go through the values
         if not self._ranged_based:
-            yield from self.__the_values[slice_start: slice_stop]
+            yield from self._dense_values(slice_start, slice_stop)
             return
 
         # Range-based, so go through the ranges that intersect the slice
-
-        # Find the first range within the slice
-        ranges = self.iter_ranges()
-        (start, stop, value) = next(ranges)
-        while stop < slice_start:
-            (start, stop, value) = next(ranges)
-
-        # Continue until outside of the slice
-        while start < slice_stop:
-            first = max(start, slice_start)
-            end_point = min(stop, slice_stop)
-            for _ in range(end_point - first):
+        for (start, stop, value) in self.iter_ranges_by_slice(
+                slice_start, slice_stop):
+            for _ in range(stop - start):
                 yield value
-            try:
-                (start, stop, value) = next(ranges)
-            except StopIteration:
-                return
 
     @overrides(AbstractList.iter_ranges)
     def iter_ranges(self) -> Iterator[_RangeType]:
         # If range based just yield the ranges
         if self._ranged_based:
-            yield from self.__the_ranges
+            yield from self._the_ranges
             return
 
-        # If non-range based, build the ranges
-        previous_value = self.__the_values[0]
-        previous_start = 0
-        current_start = 0
-        current_value = None
-        any_value = False
-        for start, value in enumerate(self.__the_values):
-            current_start = start
-            current_value = value
-            if not _eq(value, previous_value):
-                yield (previous_start, start, previous_value)
-                previous_start = start
-                previous_value = value
-            any_value = True
-        if any_value:
-            yield (previous_start, current_start + 1, cast(T, current_value))
+        # If non-range based, build the ranges (if not already done)
+        yield from self._cached_ranges()[0]
 
     @overrides(AbstractList.iter_ranges_by_slice)
     def iter_ranges_by_slice(
@@ -266,28 +356,126 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # If range-based, go through ranges that intersect the slice
         if self._ranged_based:
-            for (start, stop, value) in self.__the_ranges:
-                if slice_start < stop:
-
-                    # The range is updated so that the start and stop values
-                    # are within the slice requested
-                    yield (max(start, slice_start), min(stop, slice_stop),
-                           value)
-                    if slice_stop <= stop:
-                        break
+            yield from _slice_ranges(
+                self._the_ranges, self._stops, slice_start, slice_stop)
+            return
+
+        # If non-range based, use the ranges if already built
+        if self._range_cache is not None:
+            yield from _slice_ranges(
+                *self._range_cache, slice_start, slice_stop)
             return
 
-        # If non-range based, just go through the values
-        previous_value = self.__the_values[slice_start]
-        previous_start = slice_start
-        for index, value in enumerate(
-                self.__the_values[slice_start: slice_stop]):
-            if not _eq(value, previous_value):
-                # Index is one ahead so no need for a + 1 here
-                yield (previous_start, slice_start + index, previous_value)
-                previous_start = slice_start + index
-                previous_value = value
-        yield (previous_start, slice_stop, previous_value)
+        # Otherwise work out the ranges of just the slice
+        if slice_start >= self._size:
+            return
+        starts = self._dense_run_starts(
+            slice_start, max(slice_stop, slice_start + 1))
+        if starts is None:
+            yield from self._dense_ranges(slice_start, slice_stop)
+        else:
+            yield from self._ranges_from_starts(
+                starts + slice_start, slice_stop)[0]
+
+    @overrides(_RangedListStorage._slice_to_numpy)
+    def _slice_to_numpy(self, slice_start: int, slice_stop: int,
+                        dtype: Optional[DTypeLike]) -> NDArray:
+        if self._ranged_based:
+            return super()._slice_to_numpy(slice_start, slice_stop, dtype)
+        if self._dtype is None:
+            return _as_array(
+                self._the_values[slice_start:slice_stop], dtype)
+        values = cast(NDArray, self._ranges)[slice_start:slice_stop]
+        if dtype is not None and numpy.dtype(dtype) != self._dtype:
+            return values.astype(dtype)
+        # A view, so read only to keep writes going through the list
+        values.flags.writeable = False
+        return values
+
+    @overrides(_RangedListStorage._ids_to_numpy)
+    def _ids_to_numpy(self, ids: NDArray[numpy.int64],
+                      dtype: Optional[DTypeLike]) -> NDArray:
+        if self._ranged_based:
+            return super()._ids_to_numpy(ids, dtype)
+        if self._dtype is None:
+            values = self._the_values
+            return _as_array([values[_id] for _id in ids.tolist()], dtype)
+        return cast(NDArray, self._ranges)[ids].astype(
+            self._dtype if dtype is None else dtype, copy=False)
+
+    def __array_ids(self, x: T) -> Optional[NDArray[numpy.int64]]:
+        """
+        Finds the IDs with a value by comparing it with every value, if
+        they are numbers held one per ID in an array (or as bits).
+
+        This is quicker than finding all the ranges of such values.
+
+        :return: The IDs, or `None` if the values are not held that way
+        """
+        values = self._ranges
+        if self._ranged_based or not isinstance(
+                values, (numpy.ndarray, _BitArray)) or (
+                    cast(numpy.dtype, self._dtype).kind not in "biuf"):
+            return None
+        if not (isinstance(x, numpy.bool_) or is_number(x)):
+            return numpy.empty(0, dtype=numpy.int64)
+        if isinstance(values, _BitArray):
+            bit = _as_bit(x)
+            if bit is None:
+                return numpy.empty(0, dtype=numpy.int64)
+            matches = numpy.asarray(values)
+            if not bit:
+                matches = ~matches
+        else:
+            matches = values == x
+        return numpy.flatnonzero(matches).astype(numpy.int64)
+
+    @overrides(AbstractList.where)
+    def where(self, x: T) -> List[Tuple[int, int]]:
+        ids = self.__array_ids(x)
+        if ids is None:
+            return super().where(x)
+        if len(ids) == 0:
+            return []
+        breaks = numpy.flatnonzero(numpy.diff(ids) != 1) + 1
+        return list(zip(ids[numpy.append(0, breaks)].tolist(),
+                        (ids[numpy.append(breaks - 1, -1)] + 1).tolist()))
+
+    @overrides(AbstractList.ids_of)
+    def ids_of(self, x: T) -> NDArray[numpy.int64]:
+        ids = self.__array_ids(x)
+        if ids is None:
+            return super().ids_of(x)
+        return ids
+
+    @overrides(AbstractList.count)
+    def count(self, x: T) -> int:
+        if not self._ranged_based and isinstance(self._ranges, _BitArray):
+            # Counting the bits set needs no unpacking
+            bit = _as_bit(x)
+            if bit is None:
+                return 0
+            ones = self._ranges.count()
+            return ones if bit else self._size - ones
+        ids = self.__array_ids(x)
+        if ids is None:
+            return super().count(x)
+        return len(ids)
+
+    @overrides(AbstractList.index)
+    def index(self, x: T) -> int:
+        ids = self.__array_ids(x)
+        if ids is None:
+            return super().index(x)
+        if len(ids) == 0:
+            raise ValueError(f"{x} is not in list")
+        return int(ids[0])
+
+    def __contains__(self, item: T) -> bool:
+        ids = self.__array_ids(item)
+        if ids is None:
+            return super().__contains__(item)
+        return bool(len(ids))
 
     # pylint: disable=unused-argument
     @final
@@ -339,6 +527,25 @@ class RangedList(AbstractList[T], Generic[T]):
                              f"does not equal the size:{size}")
         return values
 
+    def _as_values(
+            self, value: _ListType, size: int,
+            ids: Optional[IdsType] = None) -> Union[List[T], NDArray]:
+        """
+        Converts the value into the form in which a list that is not range
+        based holds its values; a NumPy array if this list has a ``dtype``.
+        """
+        if self._dtype is None:
+            return self.as_list(value, size, ids)
+        values = _call_vectorised(value, size, ids) \
+            if callable(value) and _is_vectorised(value) else value
+        if isinstance(values, numpy.ndarray):
+            if len(values) != size:
+                raise ValueError(f"The number of values:{len(values)} "
+                                 f"does not equal the size:{size}")
+            return values.astype(self._dtype)
+        return numpy.array(
+            self.as_list(values, size, ids), dtype=self._dtype)
+
     def set_value(self, value: _ValueType, use_list_as_value=False):
         """
         Sets *all* elements in the list to this value.
@@ -349,16 +556,28 @@ class RangedList(AbstractList[T], Generic[T]):
         :param value: new value
         :param use_list_as_value: True if the value to be set *is* a list
         """
+        self._modified()
+
+        # Values made by chunks are kept until needed if they can be
+        if self._dtype is not None and isinstance(value, ChunkedValues):
+            self._ranges = _LazyArray(value, self._size, self._dtype)
+            self._stops = []
+            self._ranged_based = False
 
         # If the value to set is a list, just copy the values
-        if not use_list_as_value and self.is_list(value, self._size):
-            self._ranges = self.as_list(value, self._size)
+        elif not use_list_as_value and self.is_list(value, self._size):
+            values = self._as_values(value, self._size)
+            self._ranges = values if self._dtype is None \
+                else self._packed(cast(NDArray, values))
+            self._stops = []
             self._ranged_based = False
+            self._note_dense_writes(self._size)
 
         # Otherwise store the value directly assuming it is the same value
         # for all items
         else:
-            self._ranges = [(0, self._size, value)]
+            self._ranges = [(0, self._size, self._typed(value))]
+            self._stops = [self._size]
             self._ranged_based = True
 
     def set_value_by_id(self, the_id: int, value: T):
@@ -377,48 +596,28 @@ class RangedList(AbstractList[T], Generic[T]):
 
         # If non-range-based, set the value directly
         if not self._ranged_based:
-            self.__the_values[the_id] = value
+            self._modified(slice(the_id, the_id + 1))
+            self._the_values[the_id] = value
+            self._note_dense_writes(1)
             return
 
-        # Find the range in which to set the value
-        for idx, (start, stop, old_value) in enumerate(self.__the_ranges):
-            if the_id < stop:
-                break
-        else:
+        # If already set as needed, only record the write
+        value = self._typed(value)
+        if _eq(value, self.get_value_by_id(the_id)):
+            self._dirty.append((the_id, the_id + 1))
+            if len(self._dirty) > _DIRTY_JOIN:
+                self._dirty = self._joined_dirty()
             return
 
-        # If already set as needed, do nothing
-        if _eq(value, old_value):
-            return
-
-        ranges = self.__the_ranges
-
-        # Split the ID out of the range
-        ranges[idx] = (the_id, the_id + 1, value)
-
-        # Need a new range after the ID
-        if the_id + 1 < stop:
-            ranges.insert(idx + 1, (the_id + 1, stop, old_value))
-
-        # Need a new range before the ID
-        if the_id > start:
-            ranges.insert(idx, (start, the_id, old_value))
-
-        # If not at the last range, update the start and stop value of
-        # the next range
-        if idx < len(ranges) - 1:
-            if _eq(ranges[idx][2], ranges[idx + 1][2]):
-                ranges[idx] = (
-                    ranges[idx][0], ranges[idx + 1][1], ranges[idx + 1][2])
-                ranges.pop(idx + 1)
-
-        # If not at the first range, update the start and stop value
-        # of the first range
-        if idx > 0:
-            if _eq(ranges[idx][2], ranges[idx - 1][2]):
-                ranges[idx - 1] = (
-                    ranges[idx - 1][0], ranges[idx][1], ranges[idx][2])
-                ranges.pop(idx)
+        # Otherwise keep the value apart from the ranges for now, as
+        # changing the ranges moves all those after it
+        self._modified(slice(the_id, the_id + 1))
+        if self._overrides is None:
+            self._overrides = dict()
+        self._overrides[the_id] = value
+        if len(self._overrides) >= _MAX_OVERRIDES:
+            self._merge_overrides()
+            self._auto_compact()
 
     def set_value_by_slice(
             self, slice_start: int, slice_stop: int, value: _ValueType,
@@ -445,69 +644,78 @@ class RangedList(AbstractList[T], Generic[T]):
                 value, size=slice_stop - slice_start):
             return self._set_values_list(range(slice_start, slice_stop), value)
 
+        self._modified(slice(slice_start, slice_stop))
+
         # If non-ranged-based, set the values directly
         if not self._ranged_based:
-            for id_value in range(slice_start, slice_stop):
-                self.__the_values[id_value] = cast(T, value)
+            if self._dtype is not None:
+                cast(NDArray, self._ranges)[slice_start:slice_stop] = value
+            else:
+                self._the_values[slice_start:slice_stop] = [
+                    cast(T, value)] * (slice_stop - slice_start)
+            self._note_dense_writes(slice_stop - slice_start)
             return
 
-        # Skip ranges before start of slice
-        ranges = self.__the_ranges
-        index = 0
-        while index < len(ranges) - 1 and ranges[index][1] <= slice_start:
-            index += 1
+        self._set_range(slice_start, slice_stop, self._typed(value))
 
-        # Strip off start of first range in case needed
-        (_start, _stop, old_value) = ranges[index]
+    def _set_values_list(self, ids: IdsType, value: _ListType):
+        values = self.as_list(value=value, size=len(ids), ids=ids)
+        self._set_id_values(self._check_ids_in_range(ids), values)
 
-        # If the slice to set starts after the current range,
-        # we may need a new range before the key
-        if slice_start > _start:
+    def _set_id_values(
+            self, ids: NDArray[numpy.int64], values: Optional[Sequence[T]],
+            value: Optional[T] = None):
+        """
+        Sets the values of a collection of checked IDs in one go.
 
-            # If the values are different, add a new range with the old value
-            if not _eq(value, old_value):
-                ranges.insert(index, (_start, slice_start, old_value))
+        Where an ID is repeated the last value for it is kept.
 
-                # We have added a value so move on one
-                index += 1
+        :param ids: The IDs to set
+        :param values: The value for each ID or `None` to use ``value``
+        :param value: The value to set all the IDs to if ``values`` is `None`
+        """
+        if len(ids) == 0:
+            return
 
-                # Change start of old range but leave value for now
-                ranges[index] = (slice_start, _stop, old_value)
-                (_start, _stop, old_value) = ranges[index]
+        # Sort the IDs, keeping only the last of any repeats
+        order = numpy.argsort(ids, kind="stable")
+        sorted_ids = ids[order]
+        last = numpy.append(sorted_ids[1:] != sorted_ids[:-1], True)
+        order = order[last]
+        sorted_ids = sorted_ids[last]
+        self._modified(sorted_ids)
 
-            # Existing already has this value so start the slice to set
-            # at the start of this range
+        # If non-range-based, set the values directly
+        if not self._ranged_based:
+            if values is None:
+                new_values: Any = [value] * len(sorted_ids)
             else:
-                slice_start = _start
-
-        # Merge with next if overlaps with that one
-        while slice_stop > _stop:
-            (_start, _stop, old_value) = ranges.pop(index + 1)
-            ranges[index] = (slice_start, _stop, old_value)
-
-        # Split off end of merged range if required
-        if slice_stop < _stop:
-            ranges[index] = (slice_start, slice_stop, old_value)
-            ranges.insert(index+1, (slice_stop, _stop, old_value))
-
-        # merge with previous if same value
-        if index > 0 and _eq(ranges[index-1][2], value):
-            ranges[index-1] = (ranges[index-1][0], slice_stop, value)
-            ranges.pop(index)
-            index -= 1
-
-        # merge with next if same value
-        if index < len(ranges) - 1 and _eq(ranges[index+1][2], value):
-            ranges[index] = (ranges[index][0], ranges[index + 1][1], value)
-            ranges.pop(index + 1)
-
-        # set the value in case missed elsewhere
-        ranges[index] = (ranges[index][0], ranges[index][1], value)
+                new_values = [values[index] for index in order.tolist()]
+            if self._dtype is not None:
+                cast(NDArray, self._ranges)[sorted_ids] = new_values
+            else:
+                the_values = self._the_values
+                for the_id, new_value in zip(sorted_ids.tolist(), new_values):
+                    the_values[the_id] = new_value
+            self._note_dense_writes(len(sorted_ids))
+            return
 
-    def _set_values_list(self, ids: IdsType, value: _ListType):
-        values = self.as_list(value=value, size=len(ids), ids=ids)
-        for id_value, val in zip(ids, values):
-            self.set_value_by_id(id_value, val)
+        # Group IDs that follow on from each other with the same value
+        if values is None:
+            value = self._typed(value)
+            breaks = numpy.flatnonzero(numpy.diff(sorted_ids) != 1) + 1
+            run_starts = sorted_ids[numpy.append(0, breaks)]
+            run_stops = sorted_ids[numpy.append(breaks - 1, -1)] + 1
+            runs = [
+                (start, stop, cast(T, value)) for start, stop in zip(
+                    run_starts.tolist(), run_stops.tolist())]
+        else:
+            runs = _id_runs(sorted_ids.tolist(), (
+                self._typed(values[index]) for index in order.tolist()))
+        if self._overrides:
+            self._merge_overrides()
+        self._merge_runs(runs)
+        self._auto_compact()
 
     def set_value_by_ids(
             self, ids: IdsType, value: _ValueType, use_list_as_value=False):
@@ -521,8 +729,8 @@ class RangedList(AbstractList[T], Generic[T]):
         if not use_list_as_value and self.is_list(value, len(ids)):
             self._set_values_list(ids, value)
         else:
-            for id_value in ids:
-                self.set_value_by_id(id_value, cast(T, value))
+            self._set_id_values(
+                self._check_ids_in_range(ids), None, cast(T, value))
 
     def set_value_by_selector(
             self, selector: Selector, value: _ValueType,
@@ -537,6 +745,11 @@ class RangedList(AbstractList[T], Generic[T]):
         if selector is None:
             self.set_value(value, use_list_as_value=use_list_as_value)
             return
+        if isinstance(selector, (int, numpy.integer)) and (
+                use_list_as_value or not self.is_list(value, 1)):
+            self.set_value_by_id(
+                self.selector_to_ids(selector)[0], cast(T, value))
+            return
         if isinstance(selector, slice):
             # Handle a slice
             if selector.step is None or selector.step == 1:
@@ -545,7 +758,7 @@ class RangedList(AbstractList[T], Generic[T]):
                     start, stop, value, use_list_as_value=use_list_as_value)
                 return
 
-        ids = self.selector_to_ids(selector)
+        ids = self._selector_to_id_array(selector)
         self.set_value_by_ids(
             ids=ids, value=value, use_list_as_value=use_list_as_value)
 
@@ -561,7 +774,7 @@ class RangedList(AbstractList[T], Generic[T]):
         :rtype: list(tuple(int,int,object))
         """
         if self._ranged_based:
-            return list(self.__the_ranges)
+            return list(self._the_ranges)
         return list(self.iter_ranges())
 
     def set_default(self, default: Optional[T]):
@@ -598,18 +811,46 @@ class RangedList(AbstractList[T], Generic[T]):
         :param RangedList other: Another Ranged List to copy the values from
         """
         # Assume the _default and key remain unchanged
+        self._modified()
+        if self.__can_share(other):
+            self._share_storage(other)
+            return
         self._ranged_based = other.range_based()
-        # clear the list fast and 2.7 safe
-        self._ranges *= 0
         if self._ranged_based:
-            self.__the_ranges.extend(other.iter_ranges())
+            self._ranges = [
+                (start, stop, self._typed(value))
+                for (start, stop, value) in other.iter_ranges()]
+            self._stops = [stop for (_, stop, _) in self._the_ranges]
         else:
-            self.__the_values.extend(other)
+            if self._dtype is None:
+                self._ranges = list(other)
+            else:
+                self._ranges = self._packed(numpy.array(
+                    other.to_numpy(dtype=self._dtype), dtype=self._dtype))
+            self._stops = []
+
+    def __can_share(self, other: RangedList[T]) -> bool:
+        """
+        Whether this list can share the values of another until either is
+        written to.
+
+        Values in a read only array are not shared, as they may be in memory
+        that could go away.
+        """
+        # The other list is also a RangedList, whose storage would be shared
+        # pylint: disable=protected-access
+        if not isinstance(other, RangedList) or other._dtype != self._dtype:
+            return False
+        if isinstance(other._ranges, numpy.ndarray):
+            return other._ranges.flags.writeable
+        return isinstance(other._ranges, (list, _BitArray, _LazyArray))
 
     def copy(self) -> RangedList[T]:
         """
         Creates a copy of this list.
 
+        The copy shares the values of this list until either is written to.
+
         Depth is just enough so that any changes done through the RangedList
         API on other will not change self
 
@@ -617,6 +858,6 @@ class RangedList(AbstractList[T], Generic[T]):
         :rtype: RangedList
         """
         clone: RangedList[T] = RangedList(
-            self._size, self._default, self._key)
+            self._size, self._default, self._key, dtype=self._dtype)
         clone.copy_into(self)
         return clone
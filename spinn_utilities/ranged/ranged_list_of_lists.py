@@ -12,24 +12,195 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 from collections.abc import Sized
+from itertools import chain
 from typing import (
-    Callable, Generic, List, Optional, Sequence, TypeVar, Union)
+    Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence,
+    TypeVar, Union, overload)
+import numpy
+from numpy.typing import NDArray
 from typing_extensions import TypeAlias
 from spinn_utilities.helpful_functions import is_singleton
 from spinn_utilities.overrides import overrides
+from .list_functions import _exact_array
 from .ranged_list import RangedList
 #: :meta private:
 T = TypeVar("T")
 # ranged_list._ValueType but specialised for how we use it here
 _ValueType: TypeAlias = Optional[Union[
     List[T], Callable[[int], List[T]], Sequence[List[T]]]]
+# How many lists written after compressing are held apart before they are
+# compressed with the rest
+_MAX_WRITTEN = 4096
+
+
+class _CompressedLists(Sequence[List[Any]]):
+    """
+    Lists of simple numbers held as one array of all the values and an
+    array of where the values of each list start (compressed sparse rows).
+
+    Lists written after compressing are held apart, by index, until they
+    are compressed again with the rest.
+
+    Reading a list gives a new Python list each time.
+    """
+    __slots__ = ["_offsets", "_values", "_written"]
+
+    def __init__(self, offsets: NDArray[numpy.int64], values: NDArray,
+                 written: Optional[Dict[int, List[Any]]] = None):
+        """
+        :param offsets: Where each list starts in the values, plus the end
+        :param values: The values of all the lists, one after the other
+        :param written: Lists that replace the compressed ones, by index
+        """
+        self._offsets = offsets
+        self._values = values
+        self._written: Dict[int, List[Any]] = \
+            {} if written is None else written
+
+    @classmethod
+    def from_lists(cls, lists: Sequence[Any]) -> Optional[_CompressedLists]:
+        """
+        Compresses lists, if they are all Python lists holding simple
+        numbers of the same type.
+
+        :return: The compressed lists, or `None` if they can not be
+        """
+        if not all(isinstance(a_list, list) for a_list in lists):
+            return None
+        flat = list(chain.from_iterable(lists))
+        if flat:
+            values = _exact_array(flat)
+            if values is None:
+                return None
+        else:
+            values = numpy.empty(0, dtype=numpy.int64)
+        offsets = numpy.zeros(len(lists) + 1, dtype=numpy.int64)
+        numpy.cumsum(numpy.fromiter(map(len, lists), dtype=numpy.int64,
+                                    count=len(lists)), out=offsets[1:])
+        return cls(offsets, values)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> List[Any]:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[List[Any]]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union[List[Any], List[List[Any]]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self.__lists(start, max(start, stop))
+        index = self.__index(index)
+        written = self._written.get(index)
+        if written is not None:
+            return list(written)
+        start, stop = self._offsets[index:index + 2].tolist()
+        return self._values[start:stop].tolist()
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        if isinstance(index, slice):
+            for i, a_list in zip(range(*index.indices(len(self))), value):
+                self._written[i] = a_list
+        else:
+            self._written[self.__index(index)] = value
+
+    def __index(self, index: int) -> int:
+        size = len(self._offsets) - 1
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("list index out of range")
+        return index
+
+    def __iter__(self) -> Iterator[List[Any]]:
+        return iter(self.__lists(0, len(self)))
+
+    def __lists(self, start: int, stop: int) -> List[List[Any]]:
+        offsets = self._offsets[start:stop + 1]
+        values = self._values[offsets[0]:offsets[-1]].tolist()
+        offsets = (offsets - offsets[0]).tolist()
+        lists = list(map(values.__getitem__, map(slice, offsets, offsets[1:])))
+        for index, written in self._written.items():
+            if start <= index < stop:
+                lists[index - start] = list(written)
+        return lists
+
+    def __reduce__(self):
+        return (_CompressedLists, (self._offsets, self._values, self._written))
+
+    @property
+    def written(self) -> int:
+        """
+        The number of lists written since compressing.
+
+        :rtype: int
+        """
+        return len(self._written)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The bytes used to hold the arrays.
+
+        :rtype: int
+        """
+        return self._offsets.nbytes + self._values.nbytes
+
+    def to_lists(self) -> List[List[Any]]:
+        """
+        Expands into a Python list of Python lists.
+        """
+        return list(self)
+
+    def run_starts(self, start: int, stop: int) -> NDArray[numpy.intp]:
+        """
+        Finds where each run of equal lists starts in a slice.
+
+        .. note::
+            Lists written since compressing are not looked at.
+
+        :return: The starts relative to the slice start
+        """
+        offsets = self._offsets[start:stop + 1]
+        lengths = numpy.diff(offsets)
+        same = lengths[1:] == lengths[:-1]
+        # Compare each value of each list after the first with the value in
+        # the same place in the list before, where that is as long
+        rows = numpy.repeat(numpy.arange(len(same)), lengths[1:])
+        to_check = same[rows]
+        rows = rows[to_check]
+        places = numpy.arange(offsets[1], offsets[-1])[to_check]
+        differs = self._values[places] != self._values[
+            places - lengths[:-1][rows]]
+        same[rows[differs]] = False
+        return numpy.append(0, numpy.flatnonzero(~same) + 1)
 
 
 class RangedListOfList(RangedList[List[T]], Generic[T]):
     """
     A Ranged object for lists of list.
+
+    When not range based, :py:meth:`compact` keeps lists that hold only
+    simple numbers of the same type compressed in two NumPy arrays rather
+    than as a Python list per ID. This uses much less memory, but reading
+    every list back is several times slower, so is not done automatically.
+    Lists written after that are held apart until there are enough of them
+    to be worth compressing with the rest.
     """
+    # _ranges is a slot of RangedList, but pylint does not see the slots
+    # inherited by a class whose own __slots__ is empty
+    # pylint: disable=assigning-non-slot
+    __slots__ = ()
+
     # pylint: disable=unused-argument
     @overrides(RangedList.listness_check)
     def listness_check(self, value: _ValueType) -> bool:
@@ -56,3 +227,72 @@ class RangedListOfList(RangedList[List[T]], Generic[T]):
             raise TypeError(
                 "Value must be an iterable or iterable of iterables") \
                 from original
+
+    def __compress(self):
+        if self._ranged_based or self._dtype is not None:
+            return
+        if isinstance(self._ranges, _CompressedLists):
+            if not self._ranges.written:
+                return
+            lists = self._ranges.to_lists()
+        else:
+            lists = self._ranges
+        compressed = _CompressedLists.from_lists(lists)
+        self._ranges = lists if compressed is None else compressed
+
+    @overrides(RangedList._note_dense_writes)
+    def _note_dense_writes(self, count: int):
+        if isinstance(self._ranges, _CompressedLists) and \
+                self._ranges.written >= _MAX_WRITTEN:
+            self.__compress()
+        super()._note_dense_writes(count)
+
+    @overrides(RangedList.compact)
+    def compact(self):
+        self.__compress()
+        super().compact()
+        # Switching from ranges gives a Python list
+        self.__compress()
+        if isinstance(self._ranges, _CompressedLists):
+            # The ranges found hold all the lists expanded again
+            self._range_cache = None
+
+    @overrides(RangedList._dense_run_starts)
+    def _dense_run_starts(self, slice_start: int, slice_stop: int
+                          ) -> Optional[NDArray[numpy.intp]]:
+        if isinstance(self._ranges, _CompressedLists):
+            self.__compress()
+        if isinstance(self._ranges, _CompressedLists):
+            return self._ranges.run_starts(
+                slice_start, min(slice_stop, self._size))
+        # Finding the runs of Python lists is no faster than comparing them
+        return None
+
+    @overrides(RangedList._values_bytes)
+    def _values_bytes(self) -> int:
+        if isinstance(self._ranges, _CompressedLists):
+            return self._ranges.nbytes
+        return super()._values_bytes()
+
+    @overrides(RangedList.storage_mode)
+    def storage_mode(self) -> str:
+        """
+        Describes how the values are currently held.
+
+        :return: ``"ranges"`` if range based, ``"compressed"`` if one list
+            per ID is held compressed in NumPy arrays, otherwise ``"list"``
+        :rtype: str
+        """
+        if isinstance(self._ranges, _CompressedLists):
+            return "compressed"
+        return super().storage_mode()
+
+    @overrides(RangedList._set_storage)
+    def _set_storage(self, stops: Optional[List[int]],
+                     values: Union[List[List[T]], NDArray]):
+        if isinstance(values, _CompressedLists):
+            # Kept compressed, as it was saved
+            super()._set_storage(stops, [])
+            self._ranges = values
+        else:
+            super()._set_storage(stops, values)
@@ -0,0 +1,636 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from itertools import repeat
+import threading
+from typing import (
+    Any, Dict, Generic, List, Iterable, Iterator, Optional, Tuple, Union, cast)
+import numpy
+from numpy.typing import DTypeLike, NDArray
+from typing_extensions import TypeAlias
+from spinn_utilities.overrides import overrides
+from .abstract_list import AbstractList, T, _eq
+from .bit_array import _BitArray
+from .chunked_values import _LazyArray
+from .list_functions import _intern, _run_starts
+#: The type of a range descriptor
+_RangeType: TypeAlias = Tuple[int, int, T]
+# How many elements of a typed array are turned into Python values at once
+_CHUNK = 4096
+# Rough memory cost of one range: the tuple, its two ints and the pointers
+# to it and its stop
+_RANGE_BYTES = 136
+# Memory cost of one element of a Python list (the pointer)
+_POINTER_BYTES = 8
+# How many times more memory the current representation must be estimated
+# to use before a list switches representation by itself
+_SWITCH_FACTOR = 2
+# How many slices of changed IDs a list reports; beyond this the slices
+# closest together are joined
+_MAX_DIRTY = 64
+# How many slices of changed IDs a list records before joining them
+_DIRTY_JOIN = 16 * _MAX_DIRTY
+# Held while merging the IDs held apart into the ranges of any list, so that
+# threads reading the list meanwhile wait for the merge to finish
+_MERGE_LOCK = threading.Lock()
+
+
+def _join_slices(starts: NDArray[numpy.int64], stops: NDArray[numpy.int64],
+                 limit: int) -> List[Tuple[int, int]]:
+    """
+    Sorts slices, joining those that overlap or touch, and then joining
+    those with the smallest gaps between them until there are no more than
+    the limit.
+
+    :param starts: The start of each slice
+    :param stops: The (exclusive) stop of each slice
+    :param int limit: The most slices to return; at least 2
+    :return: The start and stop of each joined slice
+    """
+    order = numpy.argsort(starts, kind="stable")
+    starts = starts[order]
+    stops = numpy.maximum.accumulate(stops[order])
+    firsts = numpy.append(0, numpy.flatnonzero(starts[1:] > stops[:-1]) + 1)
+    starts = starts[firsts]
+    stops = stops[numpy.append(firsts[1:] - 1, -1)]
+    if len(starts) > limit:
+        gaps = starts[1:] - stops[:-1]
+        keep = numpy.sort(numpy.argpartition(gaps, 1 - limit)[1 - limit:])
+        starts = numpy.append(starts[0], starts[keep + 1])
+        stops = numpy.append(stops[keep], stops[-1])
+    return list(zip(starts.tolist(), stops.tolist()))
+
+
+def _id_runs(ids: Iterable[int], values: Iterable[T]) -> List[_RangeType]:
+    """
+    Groups sorted IDs that follow on from each other with the same value
+    into runs.
+
+    :return: The (start, stop, value) of each run
+    """
+    runs: List[_RangeType] = []
+    for the_id, value in zip(ids, values):
+        if runs and runs[-1][1] == the_id and _eq(runs[-1][2], value):
+            runs[-1] = (runs[-1][0], the_id + 1, runs[-1][2])
+        else:
+            runs.append((the_id, the_id + 1, value))
+    return runs
+
+
+def _iter_array(values: NDArray) -> Iterator[Any]:
+    """
+    Iterates over a typed array yielding Python values rather than
+    NumPy scalars, converting a chunk at a time.
+    """
+    for start in range(0, len(values), _CHUNK):
+        yield from values[start:start + _CHUNK].tolist()
+
+
+class _RangedListStorage(  # pylint: disable=abstract-method
+        AbstractList[T], Generic[T]):
+    """
+    How a :py:class:`RangedList` holds its values, either as ranges or
+    as one value per ID, and the switching between the two.
+    It also keeps track of the IDs written to, the copies that share the values
+    and the single ID writes held apart from the ranges.
+    """
+    __slots__ = [
+        "_dense_writes", "_dirty", "_dtype", "_overrides", "_range_cache",
+        "_ranged_based", "_ranges", "_share", "_stops", "_version"]
+
+    def __init__(self, size: int, key: Any, dtype: Optional[DTypeLike]):
+        """
+        :param int size: Fixed length of the list
+        :param key: The dict key the list covers
+        :param dtype:
+            The NumPy type of the values, or ``None`` to hold any objects
+        :type dtype: ~numpy.dtype or None
+        """
+        super().__init__(size=size, key=key)
+        self._dtype = None if dtype is None else numpy.dtype(dtype)
+        self._ranges: Union[
+            List[T], List[_RangeType], NDArray, _LazyArray, _BitArray]
+        self._stops: List[int] = []
+        self._ranged_based: Optional[bool] = None
+        self._dense_writes = 0
+        self._range_cache: Optional[Tuple[List[_RangeType], List[int]]] = None
+        # Values of single IDs not yet merged into the ranges
+        self._overrides: Optional[Dict[int, T]] = None
+        self._version = 0
+        self._dirty: List[Tuple[int, int]] = []
+        # How many lists hold the values, shared by them all, if copied
+        self._share: Optional[List[int]] = None
+
+    @property
+    def dtype(self) -> Optional[numpy.dtype]:
+        """
+        The NumPy type in which values are held, if any.
+
+        :rtype: ~numpy.dtype or None
+        """
+        return self._dtype
+
+    def _typed(self, value: Any) -> Any:
+        """
+        Converts a single value to the type of this list (if it has one),
+        and interns it so that equal ranges share the object.
+
+        ``None`` is never converted.
+        """
+        if self._dtype is None or value is None:
+            return _intern(value)
+        return _intern(self._dtype.type(value).item())
+
+    @property
+    def _the_ranges(self) -> List[_RangeType]:
+        assert self._ranged_based
+        if self._overrides:
+            self._merge_overrides()
+        return cast(List[_RangeType], self._ranges)
+
+    def _merge_overrides(self):
+        """
+        Merges the values of single IDs written to a range based list into
+        its ranges.
+
+        The representation is not switched, so that this can be done while
+        reading. The IDs stay apart until the ranges are complete, so that
+        other threads reading meanwhile wait for the merge.
+        """
+        with _MERGE_LOCK:
+            pending = self._overrides
+            # Another thread may have merged them while this one waited
+            if not pending:
+                return
+            ids = sorted(pending)
+            self._merge_runs(_id_runs(ids, map(pending.__getitem__, ids)))
+            self._overrides = None
+
+    @property
+    def _the_values(self) -> List[T]:
+        assert not self._ranged_based
+        return cast(List[T], self._ranges)
+
+    def _packed(self, values: NDArray) -> Union[NDArray, _BitArray]:
+        """
+        Gets how an array of the values of all IDs of a list with a
+        ``dtype`` is held; one bit per ID if the values are bools.
+        """
+        if self._dtype == numpy.bool_:
+            return _BitArray.from_array(values)
+        return values
+
+    def _modified(self, changed: Union[
+            None, slice, NDArray[numpy.int64]] = None):
+        """
+        Called whenever the values of the list are about to change.
+
+        :param changed: The IDs that may change; a continuous slice of them,
+            a sorted array of them without repeats, or `None` if the values
+            of all of them are about to be replaced
+        """
+        self._range_cache = None
+        self._version += 1
+        if changed is None:
+            self._overrides = None
+        if self._share is not None:
+            self.__unshare(keep=changed is not None)
+        if changed is not None and isinstance(self._ranges, _LazyArray):
+            self._ranges = self._packed(numpy.asarray(self._ranges))
+        if changed is None:
+            self._dirty = [(0, self._size)] if self._size else []
+            return
+        if isinstance(changed, slice):
+            self._dirty.append((changed.start, changed.stop))
+        else:
+            breaks = numpy.flatnonzero(numpy.diff(changed) != 1) + 1
+            self._dirty.extend(_join_slices(
+                changed[numpy.append(0, breaks)],
+                changed[numpy.append(breaks - 1, -1)] + 1, _MAX_DIRTY))
+        if len(self._dirty) > _DIRTY_JOIN:
+            self._dirty = self._joined_dirty()
+
+    def _share_storage(self, other: _RangedListStorage[T]):
+        """
+        Shares the values of another list until either is written to.
+        """
+        # The other list holds its values in the same way
+        # pylint: disable=protected-access
+        if other._overrides:
+            other._merge_overrides()
+        if other._share is None:
+            other._share = [1]
+        other._share[0] += 1
+        self._share = other._share
+        self._ranges = other._ranges
+        self._stops = other._stops
+        self._ranged_based = other._ranged_based
+        self._range_cache = other._range_cache
+
+    def __unshare(self, keep: bool):
+        """
+        Stops sharing the values with copies, first copying them if they
+        are to be kept and are still shared.
+        """
+        share = cast(List[int], self._share)
+        self._share = None
+        share[0] -= 1
+        if keep and share[0]:
+            if isinstance(self._ranges, (numpy.ndarray, _BitArray)):
+                self._ranges = self._ranges.copy()
+            elif isinstance(self._ranges, list):
+                self._ranges = list(cast(List[Any], self._ranges))
+            self._stops = list(self._stops)
+
+    def __del__(self):
+        # Lets a list still sharing values with this one write without a copy
+        share = getattr(self, "_share", None)
+        if share is not None:
+            share[0] -= 1
+
+    def _joined_dirty(self) -> List[Tuple[int, int]]:
+        starts, stops = zip(*self._dirty)
+        return _join_slices(
+            numpy.array(starts, dtype=numpy.int64),
+            numpy.array(stops, dtype=numpy.int64), _MAX_DIRTY)
+
+    def has_dirty_ranges(self) -> bool:
+        """
+        Whether any values may have changed since :py:meth:`pop_dirty_ranges`
+        was last called (or since the list was created).
+
+        :rtype: bool
+        """
+        return bool(self._dirty)
+
+    def pop_dirty_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Gets the slices of IDs whose values may have changed since this was
+        last called (or since the list was created), and forgets them.
+
+        Every write is recorded, even one that sets the values they already
+        had. When there are many slices, those closest together are joined,
+        so the slices may include IDs that have not changed.
+
+        :return: The start and (exclusive) stop of each slice, sorted and
+            not touching each other
+        :rtype: list(tuple(int, int))
+        """
+        if not self._dirty:
+            return []
+        dirty = self._joined_dirty()
+        self._dirty = []
+        return dirty
+
+    @overrides(AbstractList.version)
+    def version(self) -> int:
+        return self._version
+
+    @overrides(AbstractList._settle)
+    def _settle(self) -> None:
+        if self._ranged_based and self._overrides:
+            self._merge_overrides()
+
+    def _find_range(self, the_id: int) -> int:
+        """
+        Finds the index of the range that holds an ID.
+
+        :param int the_id: An ID known to be in range
+        :return: The index into the ranges
+        """
+        return bisect_right(self._stops, the_id)
+
+    def _ranges_from_starts(
+            self, starts: NDArray[numpy.intp],
+            stop: int) -> Tuple[List[_RangeType], List[int]]:
+        """
+        Builds the ranges of a list that is not range based from where each
+        run of equal values starts.
+
+        :param starts: The start of each run
+        :param stop: Where the last run stops
+        :return: The ranges and their stops
+        """
+        starts_list = starts.tolist()
+        stops = starts_list[1:] + [stop]
+        if self._dtype is not None:
+            values = cast(NDArray, self._ranges)[starts].tolist()
+        else:
+            the_values = self._the_values
+            values = [the_values[start] for start in starts_list]
+        return list(zip(starts_list, stops, values)), stops
+
+    def _cached_ranges(self) -> Tuple[List[_RangeType], List[int]]:
+        """
+        Gets the ranges and their stops of a list that is not range based,
+        building them if not done since the last write.
+        """
+        if self._range_cache is None:
+            if self._size == 0:
+                self._range_cache = ([], [])
+            else:
+                starts = self._dense_run_starts(0, self._size)
+                if starts is None:
+                    ranges = list(self._dense_ranges(0, self._size))
+                    self._range_cache = (
+                        ranges, [stop for (_, stop, _) in ranges])
+                else:
+                    self._range_cache = self._ranges_from_starts(
+                        starts, self._size)
+        return self._range_cache
+
+    def _dense_run_starts(self, slice_start: int, slice_stop: int
+                          ) -> Optional[NDArray[numpy.intp]]:
+        """
+        Finds where each run of equal values starts in a slice of a list
+        that is not range based.
+
+        :return: The starts relative to the slice start, or `None` if they
+            can not be found quickly
+        """
+        # Values not yet made or held as bits are turned into an array by
+        # NumPy
+        values = cast(Union[List[T], NDArray], self._ranges)
+        if slice_start == 0 and slice_stop == self._size:
+            return _run_starts(values)
+        return _run_starts(values[slice_start:slice_stop])
+
+    def _dense_values(
+            self, slice_start: int, slice_stop: int) -> Iterable[T]:
+        if self._dtype is not None:
+            return _iter_array(
+                cast(NDArray, self._ranges)[slice_start: slice_stop])
+        return self._the_values[slice_start: slice_stop]
+
+    def _dense_ranges(
+            self, slice_start: int, slice_stop: int) -> Iterator[_RangeType]:
+        previous_value = self.get_value_by_id(slice_start)
+        previous_start = slice_start
+        for index, value in enumerate(
+                self._dense_values(slice_start, slice_stop), slice_start):
+            if not _eq(value, previous_value):
+                yield (previous_start, index, previous_value)
+                previous_start = index
+                previous_value = value
+        yield (previous_start, slice_stop, previous_value)
+
+    def _set_range(self, slice_start: int, slice_stop: int, value: T):
+        """
+        Sets a non-empty slice of a range based list to a single value.
+
+        Only the ranges that overlap the slice, or that neighbour it and
+        hold the same value, are replaced, and the stops are kept in step.
+
+        :param int slice_start: Start of the slice, known to be in range
+        :param int slice_stop: Exclusive end of the slice, known to be in range
+        :param object value: The value to save
+        """
+        ranges = self._the_ranges
+        first = self._find_range(slice_start)
+        last = bisect_left(self._stops, slice_stop, lo=first)
+        new_ranges: List[_RangeType] = []
+
+        # Keep or absorb the part of the first range before the slice,
+        # or merge with the previous range if that has the same value
+        (start, _, old_value) = ranges[first]
+        if start < slice_start:
+            if _eq(old_value, value):
+                slice_start = start
+            else:
+                new_ranges.append((start, slice_start, old_value))
+        elif first > 0 and _eq(ranges[first - 1][2], value):
+            first -= 1
+            slice_start = ranges[first][0]
+
+        # Likewise for the part of the last range after the slice
+        (_, stop, old_value) = ranges[last]
+        after: Optional[_RangeType] = None
+        if slice_stop < stop:
+            if _eq(old_value, value):
+                slice_stop = stop
+            else:
+                after = (slice_stop, stop, old_value)
+        elif last < len(ranges) - 1 and _eq(ranges[last + 1][2], value):
+            last += 1
+            slice_stop = ranges[last][1]
+
+        new_ranges.append((slice_start, slice_stop, value))
+        if after is not None:
+            new_ranges.append(after)
+        ranges[first:last + 1] = new_ranges
+        self._stops[first:last + 1] = [
+            new_stop for (_, new_stop, _) in new_ranges]
+
+    def _merge_runs(self, runs: List[_RangeType]):
+        """
+        Writes sorted, non-overlapping runs of values into a range based
+        list, building the new ranges in a single pass over the old ones.
+
+        Any IDs held apart from the ranges must already be merged in, or be
+        being merged in by this call.
+
+        :param runs: The (start, stop, value) of each run to write
+        """
+        ranges = cast(List[_RangeType], self._ranges)
+        stops = self._stops
+        new_ranges: List[_RangeType] = []
+
+        def append(start: int, stop: int, value: T):
+            # Merge with the previous range if it has the same value
+            if new_ranges and _eq(new_ranges[-1][2], value):
+                new_ranges[-1] = (new_ranges[-1][0], stop, new_ranges[-1][2])
+            else:
+                new_ranges.append((start, stop, value))
+
+        def keep(keep_start: int, keep_stop: int):
+            # Copy the old ranges over the IDs from start to stop
+            if keep_start >= keep_stop:
+                return
+            first = bisect_right(stops, keep_start)
+            last = bisect_left(stops, keep_stop, lo=first)
+            if first == last:
+                append(keep_start, keep_stop, ranges[first][2])
+                return
+            append(keep_start, ranges[first][1], ranges[first][2])
+            if first + 1 < last:
+                append(*ranges[first + 1])
+                new_ranges.extend(ranges[first + 2:last])
+            append(ranges[last][0], keep_stop, ranges[last][2])
+
+        cursor = 0
+        for (start, stop, value) in runs:
+            keep(cursor, start)
+            append(start, stop, value)
+            cursor = stop
+        keep(cursor, self._size)
+        self._ranges = new_ranges
+        self._stops = [stop for (_, stop, _) in new_ranges]
+
+    def _note_dense_writes(self, count: int):
+        """
+        Records writes to a list that is not range based, checking whether
+        it would be better range based once as many values as are in the
+        list have been written.
+        """
+        self._dense_writes += count
+        if self._dense_writes >= self._size:
+            self._dense_writes = 0
+            self._auto_compact()
+
+    def _values_bytes(self) -> int:
+        if self._dtype == numpy.bool_:
+            return (self._size + 7) // 8
+        if self._dtype is not None:
+            return self._size * self._dtype.itemsize
+        return self._size * _POINTER_BYTES
+
+    def _auto_compact(self):
+        """
+        Switches representation if the other is estimated to use much less
+        memory.
+
+        Lists that are not range based are only checked if their values are
+        simple numbers, as only then can the runs be found quickly.
+        """
+        if self._ranged_based:
+            if (len(self._ranges) * _RANGE_BYTES >
+                    _SWITCH_FACTOR * self._values_bytes()):
+                self.__to_values()
+        elif self._size:
+            starts = self._dense_run_starts(0, self._size)
+            if starts is not None and (
+                    _SWITCH_FACTOR * len(starts) * _RANGE_BYTES <
+                    self._values_bytes()):
+                self.__to_ranges(starts)
+
+    def compact(self):
+        """
+        Makes the list range based or hold one value per ID, whichever is
+        estimated to use less memory.
+
+        .. note::
+            This is done automatically after bulk writes, but only when one
+            representation is much better than the other.
+        """
+        if self._ranged_based:
+            if len(self._the_ranges) * _RANGE_BYTES > self._values_bytes():
+                self.__to_values()
+        elif self._size:
+            ranges, stops = self._cached_ranges()
+            if len(ranges) * _RANGE_BYTES < self._values_bytes():
+                self._ranges = ranges
+                self._stops = stops
+                self._ranged_based = True
+                self._range_cache = None
+
+    def __to_values(self):
+        ranges = self._the_ranges
+        if self._dtype is not None:
+            lengths = [stop - start for (start, stop, _) in ranges]
+            self._ranges = self._packed(numpy.repeat(numpy.array(
+                [value for (_, _, value) in ranges], dtype=self._dtype),
+                lengths))
+        else:
+            values: List[T] = []
+            for (start, stop, value) in ranges:
+                values.extend(repeat(value, stop - start))
+            self._ranges = values
+        self._stops = []
+        self._ranged_based = False
+        self._dense_writes = 0
+        self._range_cache = None
+
+    def __to_ranges(self, starts: NDArray[numpy.intp]):
+        self._ranges, self._stops = self._ranges_from_starts(
+            starts, self._size)
+        self._ranged_based = True
+        self._range_cache = None
+
+    def storage_mode(self) -> str:
+        """
+        Describes how the values are currently held.
+
+        :return: ``"ranges"`` if range based, ``"lazy"`` if the values are
+            :py:class:`ChunkedValues` not yet made, ``"bits"`` if one bool
+            per ID is held as a bit, ``"array"`` if one value per ID is held
+            in a NumPy array, otherwise ``"list"``
+        :rtype: str
+        """
+        if self._ranged_based:
+            return "ranges"
+        if isinstance(self._ranges, _LazyArray):
+            return "lazy"
+        if isinstance(self._ranges, _BitArray):
+            return "bits"
+        if self._dtype is not None:
+            return "array"
+        return "list"
+
+    def estimated_bytes(self) -> int:
+        """
+        Estimates the memory used to hold the values in their current
+        representation, not counting the value objects themselves.
+
+        :rtype: int
+        """
+        if self._ranged_based:
+            return len(self._the_ranges) * _RANGE_BYTES
+        if isinstance(self._ranges, _LazyArray):
+            return 0
+        if isinstance(self._ranges, _BitArray):
+            return self._ranges.nbytes
+        return self._values_bytes()
+
+    def _get_storage(self) -> Tuple[
+            Optional[List[int]], Union[List[T], NDArray]]:
+        """
+        Gets the values as they are held, for :py:meth:`_set_storage`.
+
+        :return: If range based, the stop of each range and the value of
+            each range; otherwise `None` and the value of each ID
+        """
+        if self._ranged_based:
+            values = [value for (_, _, value) in self._the_ranges]
+            return list(self._stops), values
+        if isinstance(self._ranges, (_LazyArray, _BitArray)):
+            return None, numpy.asarray(self._ranges)
+        return None, cast(Union[List[T], NDArray], self._ranges)
+
+    def _set_storage(self, stops: Optional[List[int]],
+                     values: Union[List[T], NDArray]):
+        """
+        Replaces all the values with ones as from :py:meth:`_get_storage`.
+
+        An array of values is used as it is (and so may be memory mapped)
+        if this list has a ``dtype``.
+        """
+        self._modified()
+        if stops is not None:
+            starts = [0] + stops[:-1]
+            self._ranges = list(zip(starts, stops, values))
+            self._stops = list(stops)
+            self._ranged_based = True
+        else:
+            if self._dtype is None:
+                self._ranges = values if isinstance(values, list) \
+                    else list(values)
+            elif isinstance(values, numpy.ndarray) and \
+                    values.dtype == self._dtype:
+                self._ranges = values
+            else:
+                self._ranges = numpy.array(values, dtype=self._dtype)
+            self._stops = []
+            self._ranged_based = False
+        self._dense_writes = 0
@@ -0,0 +1,282 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from multiprocessing import resource_tracker, shared_memory
+import os
+import pickle
+import sys
+from typing import Any, Dict, Generic, List, Optional, Tuple, Union
+import numpy
+from numpy.typing import NDArray
+from spinn_utilities.abstract_context_manager import AbstractContextManager
+from spinn_utilities.overrides import overrides
+from .abstract_dict import AbstractDict, T
+from .list_functions import _exact_array
+from .range_dictionary import RangeDictionary
+from .ranged_list import RangedList
+
+#: Bytes at the start of the memory giving the length of the description
+_HEADER = 8
+#: Alignment of each array in the memory
+_ALIGN = 64
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def _tracker() -> Optional[Tuple[int, int]]:
+    """
+    Identifies the resource tracker that frees the shared memory of this
+    process when it ends, by the pipe to it.
+
+    Processes started by :py:mod:`multiprocessing` share the tracker of
+    the process that started them.
+
+    :return: The device and inode of the pipe, or `None` if not POSIX
+    """
+    fd = resource_tracker.getfd() if os.name == "posix" else None
+    if fd is None:
+        return None
+    stat = os.fstat(fd)
+    return stat.st_dev, stat.st_ino
+
+
+class _SharedRangedList(RangedList[T], Generic[T]):
+    """
+    A list over values in shared memory, which may not be changed.
+    """
+    __slots__ = ["_locked"]
+
+    def __init__(self, *args, **kwargs):
+        self._locked = False
+        super().__init__(*args, **kwargs)
+
+    @overrides(RangedList._modified)
+    def _modified(self, changed: Union[
+            None, slice, NDArray[numpy.int64]] = None):
+        if self._locked:
+            raise TypeError(
+                f"The values of {self._key} are in shared memory so can not "
+                "be changed; copy the list first")
+        super()._modified(changed)
+
+
+class SharedRangeDictionary(
+        RangeDictionary[T], AbstractContextManager, Generic[T]):
+    """
+    A read only :py:class:`RangeDictionary` whose values are held in
+    shared memory, so that several processes can read them without each
+    having a copy.
+
+    Use :py:meth:`publish` to put a dictionary into shared memory, and
+    :py:meth:`attach` (or simply pickle this object, which only sends the
+    name of the memory) to read it from another process.
+
+    Values held one per ID are used straight from the shared memory.
+    Range based values are rebuilt from it, which costs only as much as
+    the number of ranges.
+    Only simple numbers (bool, int and float) may be shared.
+
+    .. note::
+        Keys held one per ID become lists with a ``dtype`` when attached,
+        even if they had none.
+    """
+    __slots__ = ["_memory", "_owner"]
+
+    def __init__(self, size: int, defaults: Optional[Dict[str, T]] = None):
+        """
+        Use :py:meth:`publish` or :py:meth:`attach` to create these
+        """
+        super().__init__(size, defaults)
+        self._memory: Optional[shared_memory.SharedMemory] = None
+        self._owner = False
+
+    @classmethod
+    def publish(cls, range_dict: RangeDictionary[T]
+                ) -> SharedRangeDictionary[T]:
+        """
+        Copies the values of a dictionary into new shared memory.
+
+        The memory is freed when the returned dictionary is closed.
+
+        :param RangeDictionary range_dict: The dictionary to copy
+        :rtype: SharedRangeDictionary
+        :raises TypeError: If any key has values that are not simple numbers
+        """
+        keys: List[Dict[str, Any]] = []
+        arrays: List[NDArray] = []
+        for key in range_dict.keys():
+            value_list = range_dict.get_list(key)
+            # The values are shared as the list holds them
+            # pylint: disable-next=protected-access
+            stops, values = value_list._get_storage()
+            array = values if isinstance(values, numpy.ndarray) \
+                else _exact_array(values)
+            if array is None:
+                raise TypeError(
+                    f"The values of {key} are not all simple numbers of "
+                    "the same type so can not be shared")
+            keys.append({
+                "key": key, "default": value_list.get_default(),
+                "dtype": value_list.dtype, "ranges": stops is not None})
+            if stops is not None:
+                arrays.append(numpy.array(stops, dtype=numpy.int64))
+            arrays.append(array)
+
+        # The layout needs the length of the description and vice versa,
+        # so describe the arrays relative to the end of the description
+        places: List[Tuple[int, str, int]] = []
+        offset = 0
+        for array in arrays:
+            offset = _aligned(offset)
+            places.append((offset, array.dtype.str, len(array)))
+            offset += array.nbytes
+        description = pickle.dumps(
+            {"size": len(range_dict), "keys": keys, "arrays": places,
+             "tracker": _tracker()},
+            pickle.HIGHEST_PROTOCOL)
+        base = _aligned(_HEADER + len(description))
+
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(base + offset, 1))
+        buf = memory.buf
+        assert buf is not None
+        buf[:_HEADER] = len(description).to_bytes(_HEADER, "little")
+        buf[_HEADER:_HEADER + len(description)] = description
+        for array, (start, dtype, count) in zip(arrays, places):
+            numpy.ndarray(count, dtype, buf, base + start)[:] = array
+        shared = cls._from_memory(memory)
+        shared._owner = True
+        return shared
+
+    @classmethod
+    def attach(cls, name: str) -> SharedRangeDictionary:
+        """
+        Reads a dictionary put into shared memory with :py:meth:`publish`,
+        possibly by another process.
+
+        :param str name: The :py:attr:`name` of the shared memory
+        :rtype: SharedRangeDictionary
+        """
+        if sys.version_info >= (3, 13):
+            # pylint: disable-next=unexpected-keyword-arg
+            memory = shared_memory.SharedMemory(name=name, track=False)
+            return cls._from_memory(memory)
+        memory = shared_memory.SharedMemory(name=name)
+        return cls._from_memory(memory, tracked=True)
+
+    @classmethod
+    def _from_memory(cls, memory: shared_memory.SharedMemory,
+                     tracked: bool = False) -> SharedRangeDictionary:
+        """
+        Builds a dictionary over memory that :py:meth:`publish` wrote.
+
+        :param bool tracked:
+            Whether attaching registered the memory with the resource
+            tracker of this process
+        """
+        buf = memory.buf
+        assert buf is not None
+        length = int.from_bytes(buf[:_HEADER], "little")
+        description = pickle.loads(buf[_HEADER:_HEADER + length])
+        if tracked and description["tracker"] != _tracker():
+            # Otherwise the memory is freed when this process ends, even
+            # though the publisher (and others) still use it; a tracker
+            # shared with the publisher must keep it to free it
+            resource_tracker.unregister(
+                # The name as registered, which is not the public one
+                # pylint: disable-next=protected-access
+                memory._name, "shared_memory")  # type: ignore
+        base = _aligned(_HEADER + length)
+        arrays = iter(description["arrays"])
+
+        def next_array() -> NDArray:
+            (start, dtype, count) = next(arrays)
+            array: NDArray = numpy.ndarray(count, dtype, buf, base + start)
+            array.flags.writeable = False
+            return array
+
+        size = description["size"]
+        shared = cls(size)
+        shared._memory = memory
+        for entry in description["keys"]:
+            key = entry["key"]
+            stops = None
+            if entry["ranges"]:
+                stops = next_array().tolist()
+                values = next_array().tolist()
+                dtype = entry["dtype"]
+            else:
+                values = next_array()
+                dtype = values.dtype
+            value_list: _SharedRangedList = _SharedRangedList(
+                size, None, key, dtype=dtype)
+            value_list.set_default(entry["default"])
+            # The list is made here over the memory and then locked
+            # pylint: disable=protected-access
+            value_list._set_storage(stops, values)
+            value_list._locked = True
+            shared._value_lists[key] = value_list
+        return shared
+
+    @property
+    def name(self) -> str:
+        """
+        The name of the shared memory, to pass to :py:meth:`attach`.
+
+        :rtype: str
+        """
+        if self._memory is None:
+            raise ValueError("The shared memory has been closed")
+        return self._memory.name
+
+    @overrides(AbstractContextManager.close)
+    def close(self) -> None:
+        """
+        Stops using the shared memory, freeing it if this is the dictionary
+        that published it.
+
+        Processes that have already attached may carry on using it.
+
+        .. note::
+            Arrays got from the lists of this dictionary (for example with
+            :py:meth:`to_numpy`) must be dropped first, as they may be views
+            of the shared memory.
+        """
+        if self._memory is None:
+            return
+        memory = self._memory
+        self._memory = None
+        # Drop the arrays over the memory so it can be closed
+        self._value_lists = dict()
+        memory.close()
+        if self._owner:
+            memory.unlink()
+
+    def __reduce__(self):
+        return (SharedRangeDictionary.attach, (self.name, ))
+
+    @overrides(AbstractDict.set_value)
+    def set_value(
+            self, key: str, value: T, use_list_as_value: bool = False):
+        raise TypeError(
+            "The values are in shared memory so can not be changed; "
+            "copy the dictionary first")
+
+    @overrides(RangeDictionary.__setitem__)
+    def __setitem__(self, key: str, value: Any):
+        raise TypeError(
+            "The values are in shared memory so can not be changed; "
+            "copy the dictionary first")
@@ -0,0 +1,108 @@
+# Copyright (c) 2017 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, cast
+from numpy.typing import NDArray
+from spinn_utilities.abstract_base import AbstractBase
+from spinn_utilities.overrides import overrides
+from .abstract_list import AbstractList, IdsType, R, T
+from .derived_list import _DerivedList, _Fusion, _checked, _fusion_of
+
+
+class SingleList(_DerivedList[R], Generic[T, R], metaclass=AbstractBase):
+    """
+    A List that performs an operation on the elements of another list.
+
+    .. note::
+        The ranges may be kept and reused until the other list changes, so
+        the operation should always give the same result for the same value.
+    """
+    __slots__ = [
+        "_a_list", "_operation", "_vectorised"]
+
+    def __init__(self, a_list: AbstractList[T],
+                 operation: Callable[[T], R],
+                 key: Optional[str] = None, vectorised: bool = False):
+        """
+        :param AbstractList a_list: The list to perform the operation on
+        :param callable operation:
+            A function which takes a single value and returns the result of
+            the operation on that value
+        :param key: The dict key this list covers.
+            This is used only for better Exception messages
+        :param vectorised:
+            True if the operation also works element by element on a NumPy
+            array of numbers, giving an array of the same length
+        """
+        super().__init__(size=len(a_list), key=key)
+        self._a_list = a_list
+        self._operation = operation
+        self._vectorised = vectorised
+
+    @overrides(AbstractList.range_based)
+    def range_based(self) -> bool:
+        return self._a_list.range_based()
+
+    @overrides(AbstractList.version)
+    def version(self) -> Optional[Hashable]:
+        return self._a_list.version()
+
+    @overrides(_DerivedList._settle)
+    def _settle(self) -> None:
+        # The list this is derived from is settled in the same way
+        # pylint: disable-next=protected-access
+        self._a_list._settle()
+
+    @overrides(AbstractList.get_value_by_id)
+    def get_value_by_id(self, the_id: int) -> R:
+        return self._operation(self._a_list.get_value_by_id(the_id))
+
+    @overrides(AbstractList.get_single_value_by_slice)
+    def get_single_value_by_slice(
+            self, slice_start: int, slice_stop: int) -> R:
+        return self._operation(self._a_list.get_single_value_by_slice(
+            slice_start, slice_stop))
+
+    @overrides(AbstractList.get_single_value_by_ids)
+    def get_single_value_by_ids(self, ids: IdsType) -> R:
+        return self._operation(self._a_list.get_single_value_by_ids(ids))
+
+    @overrides(_DerivedList._compute_ranges)
+    def _compute_ranges(self) -> Iterator[Tuple[int, int, R]]:
+        for (start, stop, value) in self._a_list.iter_ranges():
+            yield (start, stop, self._operation(value))
+
+    @overrides(_DerivedList._fusion)
+    def _fusion(self) -> Optional[_Fusion]:
+        if not self._vectorised:
+            return None
+        leaves, inner = _fusion_of(self._a_list)
+        # A vectorised operation works on arrays as well as single values
+        operation = cast(Callable[[NDArray], NDArray], self._operation)
+        return leaves, lambda arrays: _checked(operation, inner(arrays))
+
+    @overrides(AbstractList.get_default)
+    def get_default(self) -> Optional[R]:
+        default = self._a_list.get_default()
+        if default is None:
+            return None
+        return self._operation(default)
+
+    @overrides(_DerivedList._compute_ranges_by_slice)
+    def _compute_ranges_by_slice(
+            self, slice_start: int, slice_stop: int
+            ) -> Iterator[Tuple[int, int, R]]:
+        for (start, stop, value) in \
+                self._a_list.iter_ranges_by_slice(slice_start, slice_stop):
+            yield (start, stop, self._operation(value))
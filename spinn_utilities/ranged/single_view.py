@@ -15,8 +15,10 @@ from __future__ import annotations
 from typing import (
     Dict, Generic, Iterator, Optional, Sequence, Tuple, overload,
     TYPE_CHECKING, Union)
+from numpy.typing import NDArray
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, T, _StrSeq, _Keys
+from .abstract_list import _MAX_BLOCK
 from .abstract_view import AbstractView
 if TYPE_CHECKING:
     from .range_dictionary import RangeDictionary
@@ -81,6 +83,15 @@ class _SingleView(AbstractView[T], Generic[T]):
         else:
             yield self._range_dict.get_values_by_id(key=key, the_id=self._id)
 
+    @overrides(AbstractDict.get_columns)
+    def get_columns(self, key: _Keys = None) -> Dict[str, NDArray]:
+        return self._range_dict.get_columns(key, [self._id])
+
+    @overrides(AbstractDict.iter_blocks)
+    def iter_blocks(self, key: str, max_block: int = _MAX_BLOCK
+                    ) -> Iterator[Tuple[int, int, NDArray]]:
+        return self._range_dict.iter_blocks(key, max_block, [self._id])
+
     @overrides(AbstractDict.set_value)
     def set_value(self, key: str, value: T, use_list_as_value: bool = False):
         return self._range_dict.get_list(key).set_value_by_id(
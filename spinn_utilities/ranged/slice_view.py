@@ -15,8 +15,10 @@ from __future__ import annotations
 from typing import (
     Dict, Generic, Iterable, Iterator, Optional, Sequence, Tuple, overload,
     TYPE_CHECKING, Union)
+from numpy.typing import NDArray
 from spinn_utilities.overrides import overrides
 from .abstract_dict import AbstractDict, T, _StrSeq, _Keys
+from .abstract_list import _MAX_BLOCK
 from .abstract_view import AbstractView
 if TYPE_CHECKING:
     from .range_dictionary import RangeDictionary
@@ -65,6 +67,17 @@ class _SliceView(AbstractView[T], Generic[T]):
                     slice_start=self._start, slice_stop=self._stop)
                 for k in key}
 
+    @overrides(AbstractDict.get_columns)
+    def get_columns(self, key: _Keys = None) -> Dict[str, NDArray]:
+        return self._range_dict.get_columns(
+            key, slice(self._start, self._stop))
+
+    @overrides(AbstractDict.iter_blocks)
+    def iter_blocks(self, key: str, max_block: int = _MAX_BLOCK
+                    ) -> Iterator[Tuple[int, int, NDArray]]:
+        return self._range_dict.iter_blocks(
+            key, max_block, slice(self._start, self._stop))
+
     def update_safe_iter_all_values(self, key: str) -> Iterable[T]:
         """
         Iterate over the Values in a way that will work even between updates
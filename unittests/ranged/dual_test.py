@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import pytest
-from spinn_utilities.ranged import RangedList, DualList
+from spinn_utilities.ranged import RangedList, DualList, derived_list
 import numpy
 
 
@@ -215,3 +215,152 @@ def test_numpy_array():
     right = RangedList(2, 2, "many")
     ans = left / right
     assert all(ans.get_single_value_all() == numpy.array([1, 2, 3]))
+
+
+def test_cached_ranges():
+    calls = []
+
+    def add(x, y):
+        calls.append((x, y))
+        return x + y
+
+    left = RangedList(10, 1, "left")
+    right = RangedList(10, 2, "right")
+    right[5:] = 3
+    both = DualList(left, right, add)
+    scaled = both * 2
+    assert list(scaled.iter_ranges()) == [(0, 5, 6), (5, 10, 8)]
+    assert len(calls) == 2
+    assert list(scaled.iter_ranges()) == [(0, 5, 6), (5, 10, 8)]
+    assert list(scaled.iter_ranges_by_slice(3, 7)) == [(3, 5, 6), (5, 7, 8)]
+    assert list(both.iter_ranges_by_slice(4, 6)) == [(4, 5, 3), (5, 6, 4)]
+    assert len(calls) == 2
+
+    version = scaled.version()
+    left[2] = 5
+    assert scaled.version() != version
+    assert list(scaled.iter_ranges()) == [
+        (0, 2, 6), (2, 3, 14), (3, 5, 6), (5, 10, 8)]
+    assert len(calls) == 6
+
+
+class _UntrackedList(RangedList):
+    def version(self):
+        return None
+
+
+def test_untracked_lists_not_cached():
+    left = _UntrackedList(4, 1, "left")
+    right = RangedList(4, 2, "right")
+    plus = left + right
+    # A list that does not track changes stops the whole result being kept
+    assert list(plus.iter_ranges()) == [(0, 4, 3)]
+    assert plus.version() is None
+    left[1] = 3
+    assert list(plus.iter_ranges()) == [(0, 1, 3), (1, 2, 5), (2, 4, 3)]
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_fused_expression(dense):
+    rng = numpy.random.default_rng(7)
+    lists = []
+    for name in "abcde":
+        a_list = RangedList(50, 1, name)
+        for _ in range(6):
+            start = int(rng.integers(0, 49))
+            a_list[start:start + int(rng.integers(1, 10))] = \
+                int(rng.integers(1, 5))
+        if dense:
+            a_list.set_value(list(a_list))
+        lists.append(a_list)
+    a, b, c, d, e = lists
+    result = (a + b * c - d / e) * 3 - 1
+    expected = [(va + vb * vc - vd / ve) * 3 - 1 for (va, vb, vc, vd, ve)
+                in zip(a, b, c, d, e)]
+    assert list(result) == expected
+    assert list(result.to_numpy()) == expected
+    assert list(result.iter_by_slice(10, 30)) == expected[10:30]
+    for (start, stop, value) in result.iter_ranges():
+        assert all(x == value for x in expected[start:stop])
+
+    # A change to any list is seen
+    c[4:9] = 7
+    expected[4:9] = [(va + vb * 7 - vd / ve) * 3 - 1 for (va, vb, vd, ve)
+                     in zip(a[4:9], b[4:9], d[4:9], e[4:9])]
+    assert list(result) == expected
+
+
+def test_fused_keeps_python_results():
+    left = RangedList(4, 2 ** 40, "left")
+    right = RangedList(4, 2 ** 40, "right")
+    assert list(left * right) == [2 ** 80] * 4
+    flags = RangedList(4, True, "flags")
+    assert list(flags + flags) == [2] * 4
+    zero = RangedList(4, 1, "zero")
+    zero[2] = 0
+    with pytest.raises(ZeroDivisionError):
+        list((left + right) / zero)
+    floor = (left + right) // RangedList(4, 3, "three") + 1
+    assert list(floor) == [(2 ** 41) // 3 + 1] * 4
+
+
+def test_fused_intermediate_overflow():
+    a = b = c = RangedList(3, 2 ** 40)
+    assert list((a * b) / c) == [1099511627776.0] * 3
+    assert list(((a * b) / c).to_numpy()) == [1099511627776.0] * 3
+    dense = RangedList(3, [2 ** 40, 3, 5])
+    assert list((dense * dense) / dense) == [1099511627776.0, 3.0, 5.0]
+
+
+def test_fused_keeps_mixed_int_and_float():
+    mixed = RangedList(4, 0, "mixed")
+    mixed[0:2] = 10 ** 17 + 1
+    mixed[2:4] = 0.5
+    assert list(mixed + RangedList(4, 0, "zero")) == [
+        10 ** 17 + 1, 10 ** 17 + 1, 0.5, 0.5]
+    mixed[0:2] = 3
+    assert list(mixed + 1) == [4, 4, 1.5, 1.5]
+    assert all(type(x) is int for x in list(mixed + 1)[:2])
+    dense = RangedList(4, [3, 4, 0.5, 0.6], "dense")
+    assert list(dense + 1) == [4, 5, 1.5, 1.6]
+    assert [type(value) for (_, _, value) in (dense + 1).iter_ranges()] \
+        == [int, int, float, float]
+
+
+def test_to_numpy_parallel(monkeypatch):
+    monkeypatch.setattr(derived_list, "_PARALLEL_CHUNK", 100)
+    a = RangedList(1050, numpy.arange(1050) % 7, "a", dtype="float64")
+    b = RangedList(1050, 2.0, "b")
+    b[300:700] = 3.0
+    result = a * b + 1
+    expected = (numpy.arange(1050) % 7) * numpy.where(
+        (numpy.arange(1050) >= 300) & (numpy.arange(1050) < 700), 3, 2) + 1
+    assert numpy.array_equal(result.to_numpy_parallel(), expected)
+    assert numpy.array_equal(
+        result.to_numpy_parallel(slice(50, 990), workers=3), expected[50:990])
+    assert result.to_numpy_parallel(dtype="float32").dtype == numpy.float32
+    assert numpy.array_equal(
+        result.to_numpy_parallel([5, 400]), expected[[5, 400]])
+    assert numpy.array_equal(
+        result.to_numpy_parallel(workers=1), expected)
+
+    # Operations that are not vectorised are worked out as usual
+    slow = DualList(a, b, lambda x, y: x * y + 1)
+    assert numpy.array_equal(slow.to_numpy_parallel(), expected)
+
+
+def test_to_numpy_parallel_pending_writes(monkeypatch):
+    monkeypatch.setattr(derived_list, "_PARALLEL_CHUNK", 2000)
+    size = 1000000
+    a = RangedList(size, 1.0, "a")
+    b = RangedList(size, 3.0, "b")
+    for the_id in range(0, size, 331):
+        a[the_id] = 2.0
+    # Single ID writes are held apart until the ranges are next read
+    assert a._overrides
+    expected = numpy.where(numpy.arange(size) % 331 == 0, 2.0, 1.0) * 3
+    for _ in range(3):
+        assert numpy.array_equal(
+            (a * b).to_numpy_parallel(workers=8), expected)
+        a[5] = 2.0
+        expected[5] = 6.0
@@ -113,3 +113,14 @@ def test_defaults():
 def test_str():
     s = str(ranged_view)
     assert len(s) > 0
+
+
+def test_get_columns():
+    rd1 = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd1["a"][3] = 4
+    view = rd1[8, 3, 0, 3]
+    columns = view.get_columns()
+    assert list(columns["a"]) == [1, 4, 1, 4]
+    assert list(columns["b"]) == ["x"] * 4
+    assert list(view.get_columns("a")) == ["a"]
+    assert list(rd1[3].get_columns(["a"])["a"]) == [4]
@@ -190,3 +190,12 @@ def test_check_slice_in_range():
     assert (2, 10) == rd._check_slice_in_range(2, 12)
     assert (10, 10) == rd._check_slice_in_range(10, 12)
     assert (10, 10) == rd._check_slice_in_range(4, 2)
+
+
+def test_get_columns():
+    rd1 = RangeDictionary(10, {"a": 1.5, "b": "x"})
+    rd1["a"][5:] = 2.5
+    columns = rd1[3:7].get_columns()
+    assert list(columns["a"]) == [1.5, 1.5, 2.5, 2.5]
+    assert list(columns["b"]) == ["x"] * 4
+    assert list(rd1.get_columns("a", [9, 0])["a"]) == [2.5, 1.5]
@@ -0,0 +1,115 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy
+import pytest
+from spinn_utilities.ranged import RangeDictionary, RangedList
+from spinn_utilities.ranged.bit_array import _BitArray
+
+
+def test_bits_match_array():
+    rng = numpy.random.default_rng(3)
+    expected = rng.integers(2, size=77).astype(bool)
+    bits = _BitArray.from_array(expected)
+    assert bits.nbytes == 10
+    for _ in range(200):
+        start = int(rng.integers(77))
+        stop = int(rng.integers(start, 78))
+        choice = rng.integers(4)
+        if choice == 0:
+            bits[start:stop] = True
+            expected[start:stop] = True
+        elif choice == 1:
+            values = rng.integers(2, size=stop - start).astype(bool)
+            bits[start:stop] = values
+            expected[start:stop] = values
+        elif choice == 2:
+            ids = numpy.unique(rng.integers(77, size=5))
+            values = rng.integers(2, size=len(ids))
+            bits[ids] = values
+            expected[ids] = values
+        else:
+            bits[start] = not expected[start]
+            expected[start] = not expected[start]
+        assert numpy.array_equal(numpy.asarray(bits), expected)
+        assert numpy.array_equal(bits[start:stop], expected[start:stop])
+    assert bits.count() == expected.sum()
+    assert numpy.array_equal(bits[3:70:4], expected[3:70:4])
+    assert bits.item(76) is bool(expected[76])
+    with pytest.raises(IndexError):
+        bits[77]
+    assert numpy.array(bits, copy=True).dtype == numpy.bool_
+    with pytest.raises(ValueError):
+        numpy.array(bits, copy=False)
+
+
+def test_bool_list():
+    values = [i % 3 == 0 for i in range(20)]
+    rl = RangedList(20, values, "flags", dtype=bool)
+    assert rl.storage_mode() == "bits"
+    assert rl.estimated_bytes() == 3
+    assert list(rl) == values
+    assert [type(value) for value in rl] == [bool] * 20
+    assert rl.count(True) == 7
+    assert rl.count(0) == 13
+    assert rl.count("a") == 0
+    assert list(rl.ids_of(True)) == list(range(0, 20, 3))
+    assert rl.where(False)[:2] == [(1, 3), (4, 6)]
+    assert rl.index(False) == 1
+    assert True in rl and 2 not in rl
+    copy = rl.copy()
+    rl[1] = True
+    rl[5:9] = True
+    rl[[10, 11]] = [True, False]
+    values[1] = True
+    values[5:9] = [True] * 4
+    values[10] = True
+    assert list(rl) == values
+    assert rl.storage_mode() == "bits"
+    assert list(copy) == [i % 3 == 0 for i in range(20)]
+    assert rl.to_numpy().dtype == numpy.bool_
+
+    # Ranges are used when better, and bits again when not
+    rl.set_value(False)
+    assert rl.storage_mode() == "ranges"
+    rl[[i for i in range(0, 20, 2)]] = True
+    assert rl.storage_mode() == "bits"
+    assert list(rl.iter_ranges())[:2] == [(0, 1, True), (1, 2, False)]
+
+
+def test_bool_dictionary(tmp_path):
+    rd = RangeDictionary(30)
+    rd["spikes"] = RangedList(
+        30, [i > 20 for i in range(30)], "spikes", dtype=bool)
+    rd.save(str(tmp_path))
+    assert list(RangeDictionary.load(str(tmp_path))["spikes"]) == \
+        list(rd["spikes"])
+    assert rd["spikes"].sum() == 9
+
+
+def test_small_integers():
+    values = [i % 5 for i in range(40)]
+    rl = RangedList(40, values, "enum", dtype="uint8")
+    assert rl.storage_mode() == "array"
+    assert rl.estimated_bytes() == 40
+    assert rl.count(3) == 8
+    assert rl.count(3.5) == 0
+    assert rl.count(None) == 0
+    assert list(rl.ids_of(4)) == list(range(4, 40, 5))
+    assert rl.where(0)[:2] == [(0, 1), (5, 6)]
+    assert rl.index(2) == 2
+    assert 4 in rl and 5 not in rl
+    with pytest.raises(ValueError):
+        rl.index(7)
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy
+import pytest
+from spinn_utilities.ranged import ChunkedValues, RangeDictionary, RangedList
+
+
+def _normal(seed=5, chunk_size=16):
+    return ChunkedValues(
+        lambda rng, n: rng.normal(-65.0, 5.0, n), seed, chunk_size)
+
+
+def test_deterministic():
+    whole = _normal().values(0, 100)
+    assert len(whole) == 100
+    parts = numpy.concatenate(
+        [_normal().values(start, start + 7) for start in range(0, 100, 7)])
+    assert list(parts[:100]) == list(whole)
+    ids = numpy.array([99, 3, 40, 3])
+    assert list(_normal()(ids)) == list(whole[ids])
+    assert list(_normal(seed=6).values(0, 100)) != list(whole)
+
+
+def test_lazy_list():
+    made = []
+    source = _normal()
+
+    def count(rng, n):
+        made.append(n)
+        return rng.normal(-65.0, 5.0, n)
+
+    rl = RangedList(100, ChunkedValues(count, 5, 16), dtype="float64")
+    assert rl.storage_mode() == "lazy"
+    assert made == []
+    assert list(rl.iter_by_slice(10, 20)) == list(source.values(10, 20))
+    assert len(made) == 2
+    assert rl.to_numpy(slice(40, 45)).tolist() == \
+        source.values(40, 45).tolist()
+    assert rl[50] == source.values(50, 51)[0]
+    assert rl.get_values([99, 0]) == source(numpy.array([99, 0])).tolist()
+    assert rl.storage_mode() == "lazy"
+    copy = rl.copy()
+
+    # Writing makes all the values
+    rl[3] = 1.0
+    assert rl.storage_mode() == "array"
+    assert rl[3] == 1.0 and rl[4] == source.values(4, 5)[0]
+    assert list(copy) == list(source.values(0, 100))
+    assert copy.storage_mode() == "lazy"
+
+
+def test_eager_list():
+    rl = RangedList(50, _normal())
+    assert rl.storage_mode() == "list"
+    assert list(rl) == _normal().values(0, 50).tolist()
+    rl[10:20] = _normal(seed=1)
+    assert rl[12] == _normal(seed=1).values(12, 13)[0]
+
+
+def test_dictionary():
+    rd = RangeDictionary(40)
+    rd["v"] = RangedList(40, _normal(), "v", dtype="float32")
+    rd["w"] = 3
+    assert rd[10:12].get_columns("v")["v"].dtype == numpy.float32
+    rd.copy()
+
+
+def test_bad_generator():
+    rl = RangedList(10, ChunkedValues(lambda rng, n: 1.0, 1), dtype=float)
+    with pytest.raises(ValueError):
+        rl[3]
+    with pytest.raises(ValueError):
+        ChunkedValues(lambda rng, n: 1.0, 1, 0)
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+import sys
+import threading
 import pytest
 import numpy
 from spinn_utilities.ranged import MultipleValuesException
-from spinn_utilities.ranged import RangedList
+from spinn_utilities.ranged import RangedList, vectorised_function
+from spinn_utilities.ranged import ranged_list
 
 
 def test_simple():
@@ -483,3 +487,374 @@ def test_numpy_selector():
     rl = RangedList(value=range(5))
     selector = numpy.array([1, 3, 4])
     assert [1, 3, 4] == rl.selector_to_ids(selector)
+
+
+def test_numpy_selector_checks():
+    rl = RangedList(5, 0)
+    mask = numpy.array([True, False, True, False, True, True])
+    assert [0, 2, 4] == rl.selector_to_ids(mask, warn=True)
+    assert [] == rl.selector_to_ids(numpy.array([]))
+    assert [4, 1, 4] == rl.selector_to_ids((4, 1, numpy.int8(4)))
+    with pytest.raises(TypeError):
+        rl.selector_to_ids(numpy.array([1, -1]))
+    with pytest.raises(TypeError):
+        rl.selector_to_ids(numpy.array([1, 5], dtype=numpy.uint8))
+    with pytest.raises(TypeError):
+        rl.selector_to_ids([1, True])
+    rl[mask] = 3
+    rl[numpy.array([1])] = 2
+    assert list(rl) == [3, 2, 3, 0, 3]
+    assert list(rl.to_numpy(mask[:5])) == [3, 3, 3]
+
+
+def test_random_updates_match_list():
+    rng = numpy.random.default_rng(42)
+    size = 200
+    rl = RangedList(size, 0)
+    expected = [0] * size
+    for _ in range(500):
+        start = int(rng.integers(size))
+        stop = int(rng.integers(start, size + 1))
+        value = int(rng.integers(3))
+        if rng.integers(2):
+            rl[start] = value
+            expected[start] = value
+        elif start < stop:
+            rl[start:stop] = value
+            expected[start:stop] = [value] * (stop - start)
+        assert list(rl) == expected
+    ranges = rl.get_ranges()
+    # Neighbouring ranges never have the same value
+    for (_, _, left), (_, _, right) in zip(ranges, ranges[1:]):
+        assert left != right
+    for the_id in range(size):
+        assert rl[the_id] == expected[the_id]
+        assert list(rl.iter_ranges_by_id(the_id)) == [
+            (the_id, the_id + 1, expected[the_id])]
+    assert list(rl.iter_by_ids([7, 3, 150, 3])) == [
+        expected[7], expected[3], expected[150], expected[3]]
+    assert list(rl.iter_by_slice(17, 123)) == expected[17:123]
+    for (start, stop, value) in rl.iter_ranges_by_slice(17, 123):
+        assert 17 <= start < stop <= 123
+        assert expected[start:stop] == [value] * (stop - start)
+
+
+@pytest.mark.parametrize("dense", [False, True])
+def test_set_value_by_ids_matches_single_sets(dense):
+    rng = numpy.random.default_rng(7)
+    size = 300
+    start = list(rng.integers(0, 3, size)) if dense else 0
+    bulk = RangedList(size, start)
+    single = RangedList(size, start)
+    for _ in range(20):
+        ids = [int(x) for x in rng.integers(0, size, 40)]
+        if rng.integers(2):
+            values = [int(x) for x in rng.integers(0, 3, 40)]
+            bulk.set_value_by_ids(ids, values)
+            for the_id, value in zip(ids, values):
+                single.set_value_by_id(the_id, value)
+        else:
+            value = int(rng.integers(0, 3))
+            bulk.set_value_by_ids(numpy.array(ids), value)
+            for the_id in ids:
+                single.set_value_by_id(the_id, value)
+        assert list(bulk) == list(single)
+    assert bulk.get_ranges() == single.get_ranges()
+    with pytest.raises(IndexError):
+        bulk.set_value_by_ids([3, size], 1)
+
+
+def test_compact():
+    rl = RangedList(1000, list(range(1000)))
+    assert rl.storage_mode() == "list"
+    rl[0:1000] = 3
+    # Once the whole list has been written it is seen to be one run
+    assert rl.storage_mode() == "ranges"
+    assert rl.get_ranges() == [(0, 1000, 3)]
+
+    # Fragmenting the ranges with a bulk write makes it hold values again
+    rl.set_value_by_ids(list(range(0, 1000, 2)), 4)
+    assert rl.storage_mode() == "list"
+    assert list(rl) == [4, 3] * 500
+
+    # Not worth making range based even if asked
+    rl.compact()
+    assert not rl.range_based()
+    rl.set_value_by_slice(0, 1000, 5)
+    assert rl.range_based()
+
+    # Fragmented but not enough to switch by itself, only when asked
+    rl.set_value_by_ids(list(range(0, 1000, 20)), 6)
+    assert rl.range_based()
+    assert rl.estimated_bytes() > 1000 * 8
+    rl.compact()
+    assert not rl.range_based()
+    assert rl.estimated_bytes() == 1000 * 8
+    assert rl[20] == 6 and rl[21] == 5
+
+    objects = RangedList(100, [[1]] * 100)
+    objects.compact()
+    assert objects.range_based()
+    assert objects.get_ranges() == [(0, 100, [1])]
+
+
+@pytest.mark.parametrize("dtype", [None, "float64"])
+def test_reductions(dtype):
+    values = [1.5] * 10 + [4.0] * 5 + [float(i) for i in range(5)]
+    rl = RangedList(20, 1.5, dtype=dtype)
+    rl[10:15] = 4.0
+    rl[15:20] = [float(i) for i in range(5)]
+    for selector in (None, slice(3, 17), [19, 0, 12, 0], slice(2, 18, 3)):
+        expected = numpy.array(values)[
+            slice(None) if selector is None else selector]
+        assert rl.sum(selector) == pytest.approx(expected.sum())
+        assert rl.mean(selector) == pytest.approx(expected.mean())
+        assert rl.min(selector) == expected.min()
+        assert rl.max(selector) == expected.max()
+        unique, counts = rl.unique_with_counts(selector)
+        expected_unique, expected_counts = numpy.unique(
+            expected, return_counts=True)
+        assert list(unique) == list(expected_unique)
+        assert list(counts) == list(expected_counts)
+        counts, edges = rl.histogram(4, (0, 4), selector)
+        expected_counts, expected_edges = numpy.histogram(
+            expected, 4, (0, 4))
+        assert list(counts) == list(expected_counts)
+        assert list(edges) == list(expected_edges)
+    assert isinstance(rl.sum(), float)
+    assert rl.sum(slice(5, 5)) == 0
+    with pytest.raises(ValueError):
+        rl.mean(slice(5, 5))
+    with pytest.raises(ValueError):
+        rl.min([])
+
+
+def test_reductions_types():
+    rl = RangedList(10, True)
+    rl[3:5] = False
+    assert rl.sum() == 8
+    assert rl.min() is False
+    assert rl.unique_with_counts()[1].tolist() == [2, 8]
+    big = RangedList(4, 2 ** 62)
+    assert big.sum() == 2 ** 64
+    names = RangedList(5, "a")
+    names[1] = "b"
+    assert names.max() == "b"
+    unique, counts = names.unique_with_counts()
+    assert unique.tolist() == ["a", "b"] and counts.tolist() == [4, 1]
+    nans = RangedList(6, float("nan"))
+    nans[2:4] = 1.0
+    assert nans.unique_with_counts()[1].tolist() == [2, 4]
+    assert (RangedList(3, 1.5) * 2).sum() == 9.0
+
+
+@pytest.mark.parametrize("dtype", [None, "int32"])
+def test_dirty_ranges(dtype):
+    rl = RangedList(100, 0, dtype=dtype)
+    assert rl.has_dirty_ranges()
+    assert rl.pop_dirty_ranges() == [(0, 100)]
+    assert not rl.has_dirty_ranges()
+    assert rl.pop_dirty_ranges() == []
+    rl[5] = 1
+    rl[10:20] = 2
+    rl[15:25] = 3
+    rl.set_value_by_ids([90, 40, 41, 42, 25], 4)
+    assert rl.pop_dirty_ranges() == [(5, 6), (10, 26), (40, 43), (90, 91)]
+    rl.set_value(7)
+    assert rl.pop_dirty_ranges() == [(0, 100)]
+
+    # Writing the value already held is still recorded
+    rl[3] = 7
+    rl[50:52] = 7
+    assert rl.pop_dirty_ranges() == [(3, 4), (50, 52)]
+
+    # Too many slices are joined where closest
+    rl.set_value_by_ids(list(range(0, 100, 3)) + [1], 8)
+    dirty = rl.pop_dirty_ranges()
+    assert len(dirty) <= 64
+    assert all(any(start <= i < stop for (start, stop) in dirty)
+               for i in list(range(0, 100, 3)) + [1])
+    assert dirty == sorted(dirty)
+
+
+@pytest.mark.parametrize("dtype", [None, "int64"])
+@pytest.mark.parametrize("values", [7, list(range(100))])
+def test_copy_on_write(dtype, values):
+    rl = RangedList(100, values, dtype=dtype)
+    expected = list(rl)
+    copy = rl.copy()
+    other = rl.copy()
+    assert copy._ranges is rl._ranges
+    copy[3] = 50
+    copy.set_value_by_slice(10, 12, 60)
+    assert copy[3] == 50 and copy[11] == 60
+    assert list(rl) == expected and list(other) == expected
+    rl.set_value_by_ids([5, 6], 70)
+    assert list(other) == expected
+    assert rl[5] == 70 and copy[5] == expected[5]
+    other[0] = 80
+    assert rl[0] == expected[0] and copy[0] == expected[0]
+
+    # Once its copies are gone a list writes without copying
+    rl = RangedList(100, values, dtype=dtype)
+    ranges = rl._ranges
+    del copy
+    copy = rl.copy()
+    del copy
+    rl[99] = 1
+    if not rl.range_based():
+        assert rl._ranges is ranges
+
+
+def test_where():
+    rl = RangedList(20, "a")
+    rl[3:6] = "b"
+    rl[10] = "b"
+    assert rl.where("b") == [(3, 6), (10, 11)]
+    assert rl.ids_of("b").tolist() == [3, 4, 5, 10]
+    assert rl.where("c") == [] and rl.ids_of("c").tolist() == []
+    assert rl.count("a") == 16 and rl.index("b") == 3
+    assert "b" in rl and "c" not in rl
+    with pytest.raises(ValueError):
+        rl.index("c")
+    # The index is rebuilt after a write
+    rl[4] = "c"
+    assert rl.where("b") == [(3, 4), (5, 6), (10, 11)]
+    assert rl.where("c") == [(4, 5)]
+
+    numbers = RangedList(10, 1.0) + RangedList(10, list(range(10)))
+    assert numbers.where(3) == [(2, 3)]
+    assert numbers.ids_of(5.0).tolist() == [4]
+    nans = RangedList(5, float("nan"))
+    assert nans.where(float("nan")) == [] and nans.count(1) == 0
+
+    # Values that can not be hashed are still found
+    lists = RangedList(4, [[1], [2], [1], [3]])
+    assert lists.where([1]) == [(0, 1), (2, 3)]
+    assert lists.count([1]) == 2
+    assert lists.index([3]) == 3
+
+
+@pytest.mark.parametrize("dtype", [None, "float64"])
+def test_vectorised_function(dtype):
+    calls = []
+
+    @vectorised_function
+    def half(ids):
+        calls.append(ids)
+        return ids / 2
+
+    rl = RangedList(10, half, dtype=dtype)
+    assert list(rl) == [i / 2 for i in range(10)]
+    assert all(isinstance(value, float) for value in rl)
+    assert len(calls) == 1
+    rl[2:5] = half
+    rl.set_value_by_ids([9, 7], half)
+    assert len(calls) == 3
+    assert calls[1].tolist() == [2, 3, 4] and calls[2].tolist() == [9, 7]
+    assert list(rl) == [i / 2 for i in range(10)]
+
+    rl.set_value(numpy.sqrt)
+    assert rl[4] == 2.0
+    with pytest.raises(ValueError):
+        rl.set_value(vectorised_function(lambda ids: 1.0))
+    with pytest.raises(ValueError):
+        rl.set_value(vectorised_function(lambda ids: ids[1:]))
+
+
+def test_single_id_overrides(monkeypatch):
+    monkeypatch.setattr(ranged_list, "_MAX_OVERRIDES", 8)
+    rl = RangedList(100, 0)
+    rl[20:40] = 1
+    expected = [0] * 20 + [1] * 20 + [0] * 60
+    rl.pop_dirty_ranges()
+    version = rl.version()
+    for the_id in (5, 3, 21, 4, 90):
+        rl[the_id] = 2
+        expected[the_id] = 2
+        assert rl[the_id] == 2
+    # Setting a value already held is not a change, but is still a write
+    rl[3] = 2
+    rl[50] = 0
+    assert rl.version() == version + 5
+    assert rl.pop_dirty_ranges() == [(3, 6), (21, 22), (50, 51), (90, 91)]
+    copy = rl.copy()
+    assert rl.get_ranges() == [
+        (0, 3, 0), (3, 6, 2), (6, 20, 0), (20, 21, 1), (21, 22, 2),
+        (22, 40, 1), (40, 90, 0), (90, 91, 2), (91, 100, 0)]
+    assert list(copy) == expected
+
+    # Enough single IDs are merged in by the writes
+    for the_id in range(60, 76, 2):
+        rl[the_id] = 3
+        expected[the_id] = 3
+    assert list(rl) == expected
+    assert list(copy) != expected
+    assert rl.to_numpy().tolist() == expected
+    assert rl.count(3) == 8
+    rl[61] = 3
+    rl.set_value(4)
+    assert list(rl) == [4] * 100
+
+
+def test_single_id_overrides_threads():
+    # Switch threads often, so that they read while the IDs are merged
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _ in range(5):
+            rl = RangedList(100000, 0)
+            for the_id in range(0, 100000, 50):
+                rl[the_id] = 1
+            barrier = threading.Barrier(8)
+
+            def count():
+                barrier.wait()
+                return rl.count(1)
+
+            with ThreadPoolExecutor(8) as pool:
+                counts = list(pool.map(lambda _: count(), range(8)))
+            assert counts == [2000] * 8
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def test_equal_values_shared():
+    rl = RangedList(10, "".join(["in", "h"]))
+    rl[2:4] = "".join(["ex", "c"])
+    rl[6:8] = "".join(["ex", "c"])
+    ranges = rl.get_ranges()
+    assert ranges[1][2] is ranges[3][2]
+    assert ranges[0][2] is ranges[2][2]
+    rl[4:6] = "exc"
+    assert rl.get_ranges() == [(0, 2, "inh"), (2, 8, "exc"), (8, 10, "inh")]
+
+    # Equal values of different types are kept apart
+    ones = RangedList(4, 0)
+    ones[2] = 1
+    flags = RangedList(4, False)
+    flags[2] = True
+    assert [type(value) for value in ones] == [int] * 4
+    assert [type(value) for value in flags] == [bool] * 4
+    nan = RangedList(4, float("nan"))
+    nan[2] = float("nan")
+    assert len(nan.get_ranges()) == 3
+
+    # Signed zeros are kept apart however the other was interned
+    RangedList(4, 0.0)
+    negative = RangedList(4, -0.0)
+    assert str(negative[0]) == "-0.0"
+    ones = RangedList(4, 1.0)
+    ones[2] = -0.0
+    assert str(ones[2]) == "-0.0"
+
+
+def test_same_nan_object_not_equal():
+    nan = numpy.float32("nan")
+    rl = RangedList(4, nan)
+    rl[2] = nan
+    assert len(rl.get_ranges()) == 3
+    array = numpy.array([1.0, numpy.nan])
+    rl = RangedList(4, array, use_list_as_value=True)
+    rl.set_value_by_id(2, array)
+    assert len(rl.get_ranges()) == 3
@@ -160,3 +160,30 @@ def test_iter_by_slice():
     assert [2, 3, 4] == list(rl.iter_by_slice(2, 5))
     rl[3:7] = "b"
     assert [2, "b", "b"] == list(rl.iter_by_slice(2, 5))
+
+
+def test_numeric_ranges():
+    values = [1.0, 1.0, 2.0, float("nan"), float("nan"), 3.0, 3.0, 3.0]
+    for rl in (RangedList(8, values),
+               RangedList(8, values, dtype="float32")):
+        assert not rl.range_based()
+        assert list(rl.iter_ranges_by_slice(1, 7))[:2] == [
+            (1, 2, 1.0), (2, 3, 2.0)]
+        assert list(rl.iter_ranges_by_slice(6, 6)) == [(6, 6, 3.0)]
+        ranges = rl.get_ranges()
+        # NaN is never equal to anything so each is a range of its own
+        assert [(start, stop) for (start, stop, _) in ranges] == [
+            (0, 2), (2, 3), (3, 4), (4, 5), (5, 8)]
+        assert ranges[4] == (5, 8, 3.0)
+        assert list(rl.iter_ranges_by_slice(1, 7))[-1] == (5, 7, 3.0)
+        rl[4] = 2.0
+        assert list(rl.iter_ranges_by_slice(3, 6))[1:] == [
+            (4, 5, 2.0), (5, 6, 3.0)]
+        assert rl.get_ranges()[3] == (4, 5, 2.0)
+
+
+def test_object_ranges():
+    rl = RangedList(5, ["a", "a", None, [1], [1]])
+    assert rl.get_ranges() == [(0, 2, "a"), (2, 3, None), (3, 5, [1])]
+    rl[2] = "a"
+    assert rl.get_ranges() == [(0, 3, "a"), (3, 5, [1])]
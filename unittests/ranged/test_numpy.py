@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from spinn_utilities.ranged import MultipleValuesException, RangeDictionary
 from spinn_utilities.ranged.ranged_list import RangedList
 import numpy
 import pytest
@@ -68,3 +69,112 @@ def test_list_of_numpy_list(ranged_list, range_based):
         ranged_list.get_single_value_by_slice(0, 5), numpy.arange(10))
     assert numpy.array_equal(
         ranged_list.get_single_value_by_ids([0, 9]), numpy.arange(10))
+
+
+def test_dtype_storage():
+    values = numpy.arange(10, dtype=numpy.float64)
+    rl = RangedList(10, values, dtype=numpy.float32)
+    assert not rl.range_based()
+    assert rl.dtype == numpy.float32
+    assert list(rl) == list(range(10))
+    assert isinstance(rl[3], float)
+    rl[3] = 7
+    rl[5:8] = 2
+    assert rl[2:9] == [2, 7, 4, 2, 2, 2, 8]
+    assert rl.get_single_value_by_slice(5, 8) == 2
+    with pytest.raises(MultipleValuesException):
+        rl.get_single_value_by_slice(4, 8)
+    assert rl.get_ranges()[3:6] == [(3, 4, 7), (4, 5, 4), (5, 8, 2)]
+
+    clone = rl.copy()
+    assert clone.dtype == numpy.float32
+    rl[0] = 100
+    assert clone[0] == 0
+    assert clone[1:] == rl[1:]
+
+
+def test_dtype_ranged():
+    rl = RangedList(10, 1, dtype=numpy.int16)
+    assert rl.range_based()
+    rl[4] = 2.0
+    assert rl.get_ranges() == [(0, 4, 1), (4, 5, 2), (5, 10, 1)]
+    assert all(isinstance(value, int) for value in rl)
+    rl.set_value([3] * 10)
+    assert not rl.range_based()
+    assert list(rl) == [3] * 10
+    with pytest.raises(ValueError):
+        rl.set_value(numpy.arange(3))
+
+
+def test_to_numpy():
+    rl = RangedList(10, 1.5)
+    rl[3:6] = 2.5
+    expected = numpy.array([1.5] * 3 + [2.5] * 3 + [1.5] * 4)
+    assert numpy.array_equal(rl.to_numpy(), expected)
+    assert numpy.array_equal(rl.to_numpy(slice(2, 7)), expected[2:7])
+    assert numpy.array_equal(rl.to_numpy([8, 4, 0, 4]), expected[[8, 4, 0, 4]])
+    assert rl.to_numpy(dtype=numpy.int32).dtype == numpy.int32
+    assert len(rl.to_numpy(slice(4, 4))) == 0
+
+    dense = RangedList(10, expected, dtype=numpy.float64)
+    view = dense.to_numpy(slice(2, 7))
+    assert numpy.array_equal(view, expected[2:7])
+    with pytest.raises(ValueError):
+        view[0] = 7
+    assert numpy.array_equal(dense.to_numpy([8, 4]), [1.5, 2.5])
+    assert numpy.array_equal(
+        (rl + dense * 2).to_numpy(), expected + expected * 2)
+    assert numpy.array_equal(
+        rl.apply_operation(lambda x: x * 2).to_numpy(slice(0, 5)),
+        expected[0:5] * 2)
+
+    objects = RangedList(4, [[1], [2, 3], "a", None])
+    assert list(objects.to_numpy()) == [[1], [2, 3], "a", None]
+    strings = RangedList(3, "a")
+    assert list(strings.to_numpy()) == ["a", "a", "a"]
+
+
+def test_iter_blocks():
+    rl = RangedList(10, 1.5)
+    rl[3:6] = 2.5
+    blocks = list(rl.iter_blocks())
+    assert [(start, stop, list(values)) for (start, stop, values)
+            in blocks] == [(0, 3, [1.5]), (3, 6, [2.5]), (6, 10, [1.5])]
+    buffer = numpy.zeros(10)
+    for (start, stop, values) in blocks:
+        buffer[start:stop] = values
+    assert numpy.array_equal(buffer, rl.to_numpy())
+    assert [(start, stop) for (start, stop, _) in rl.iter_blocks(
+        [1, 2, 4, 8, 9])] == [(1, 3), (4, 5), (8, 10)]
+
+    dense = RangedList(10, numpy.arange(10), dtype="uint8")
+    blocks = list(dense.iter_blocks(slice(1, 9), max_block=3))
+    assert [(start, stop) for (start, stop, _) in blocks] == [
+        (1, 4), (4, 7), (7, 9)]
+    assert numpy.array_equal(
+        numpy.concatenate([values for (_, _, values) in blocks]),
+        numpy.arange(1, 9))
+    assert blocks[0][2].dtype == numpy.uint8
+    assert list(dense.iter_blocks(slice(4, 4))) == []
+    derived = list((dense + rl).iter_blocks(max_block=5))
+    assert numpy.array_equal(
+        numpy.concatenate([values for (_, _, values) in derived]),
+        dense.to_numpy() + rl.to_numpy())
+    with pytest.raises(ValueError):
+        list(dense.iter_blocks(max_block=0))
+
+
+def test_iter_blocks_dict():
+    rd = RangeDictionary(10, {"a": 1})
+    rd["a"][4:6] = 2
+    rd["b"] = RangedList(10, numpy.arange(10), "b", dtype="int32")
+    assert [(start, stop, list(values)) for (start, stop, values)
+            in rd.iter_blocks("a")] == [(0, 4, [1]), (4, 6, [2]), (6, 10, [1])]
+    assert [(start, stop, list(values)) for (start, stop, values)
+            in rd[3:8].iter_blocks("b", max_block=4)] == [
+        (3, 7, [3, 4, 5, 6]), (7, 8, [7])]
+    assert [(start, stop, list(values)) for (start, stop, values)
+            in rd[[2, 3, 7]].iter_blocks("a")] == [
+        (2, 4, [1]), (7, 8, [1])]
+    assert [(start, stop, list(values)) for (start, stop, values)
+            in rd[5].iter_blocks("b")] == [(5, 6, [5])]
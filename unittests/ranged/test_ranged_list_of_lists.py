@@ -48,3 +48,69 @@ class TestRangeListOfLists(unittest.TestCase):
             rl.set_value(2)
         with self.assertRaises(TypeError):
             rl.set_value("bacon")
+
+    def test_compressed(self):
+        values = [[float(i), i / 2] for i in range(40)] + [[], []]
+        rl = RangedListOfList(42, [])
+        rl.set_value(values)
+        self.assertEqual("list", rl.storage_mode())
+        rl.compact()
+        self.assertEqual("compressed", rl.storage_mode())
+        self.assertListEqual(values, list(rl))
+        self.assertListEqual(values[5:9], list(rl[5:9]))
+        self.assertListEqual([2.0, 1.0], rl[2])
+        self.assertListEqual([[], []], list(rl[40:42]))
+        self.assertEqual(3, len(list(rl.iter_ranges_by_slice(38, 42))))
+        rl[3] = [7.0, 8.0, 9.0]
+        values[3] = [7.0, 8.0, 9.0]
+        rl[6:8] = [1.0]
+        values[6:8] = [[1.0], [1.0]]
+        self.assertEqual("compressed", rl.storage_mode())
+        self.assertListEqual(values, list(rl))
+        self.assertListEqual(values[2:7], list(rl[2:7]))
+        self.assertListEqual([7.0, 8.0, 9.0], rl[3])
+        rl.compact()
+        self.assertEqual("compressed", rl.storage_mode())
+        self.assertListEqual(values, list(rl))
+        rl[4] = ["a"]
+        values[4] = ["a"]
+        rl.compact()
+        self.assertEqual("list", rl.storage_mode())
+        self.assertListEqual(values, list(rl))
+
+    def test_compressed_writes(self):
+        rl = RangedListOfList(10000, [])
+        rl.set_value([[i, i + 1] for i in range(10000)])
+        rl.compact()
+        copy = RangedListOfList(10000, [])
+        copy.copy_into(rl)
+        for i in range(5000):
+            rl[i] = [-i]
+        self.assertEqual("compressed", rl.storage_mode())
+        self.assertListEqual(
+            [[-i] for i in range(5000)] +
+            [[i, i + 1] for i in range(5000, 10000)], list(rl))
+        self.assertListEqual([[i, i + 1] for i in range(10000)], list(copy))
+
+    def test_compressed_runs(self):
+        rl = RangedListOfList(40, [])
+        rl.set_value([[1, 2]] * 10 + [[1, 3]] * 10 + [[1]] * 10 +
+                     [[i] for i in range(10)])
+        rl.compact()
+        self.assertEqual("compressed", rl.storage_mode())
+        self.assertListEqual(
+            [(0, 10, [1, 2]), (10, 20, [1, 3]), (20, 30, [1])],
+            list(rl.iter_ranges())[:3])
+        rl.set_value([[1, 2]] * 20 + [[3]] * 20)
+        rl.compact()
+        self.assertEqual("ranges", rl.storage_mode())
+        self.assertListEqual([(0, 20, [1, 2]), (20, 40, [3])],
+                             rl.get_ranges())
+
+    def test_not_compressed(self):
+        rl = RangedListOfList(3, [])
+        rl.set_value([[1, 2], [3.5], [4, 5]])
+        self.assertEqual("list", rl.storage_mode())
+        rl.set_value([["a"], ["b"], ["c"]])
+        self.assertEqual("list", rl.storage_mode())
+        self.assertListEqual([["a"], ["b"], ["c"]], list(rl))
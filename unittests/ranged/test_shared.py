@@ -0,0 +1,127 @@
+# Copyright (c) 2026 The University of Manchester
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, resource_tracker
+import os
+import pickle
+import subprocess
+import sys
+import pytest
+from spinn_utilities.ranged import (
+    RangeDictionary, RangedList, SharedRangeDictionary)
+
+
+def _range_dict():
+    rd = RangeDictionary(50, {"a": 1, "b": 0.5, "c": True})
+    rd["a"][10:20] = 3
+    rd["c"][7] = False
+    rd["d"] = RangedList(50, [i * 2 for i in range(50)], "d")
+    rd["e"] = RangedList(50, list(range(50)), "e", dtype="uint16")
+    return rd
+
+
+def test_publish_and_attach():
+    rd = _range_dict()
+    with SharedRangeDictionary.publish(rd) as shared:
+        for other in (shared, SharedRangeDictionary.attach(shared.name),
+                      pickle.loads(pickle.dumps(shared))):
+            assert set(other.keys()) == set(rd.keys())
+            for key in rd.keys():
+                assert list(other[key]) == list(rd[key])
+                assert [type(value) for value in other[key]] == \
+                    [type(value) for value in rd[key]]
+            assert list(other.iter_ranges()) == list(rd.iter_ranges())
+            assert list(other[5:12].get_columns(["a"])["a"]) == \
+                [1] * 5 + [3] * 2
+            assert other.get_default("b") == 0.5
+        assert shared["d"].dtype is not None
+
+
+def test_read_only():
+    with SharedRangeDictionary.publish(_range_dict()) as shared:
+        with pytest.raises(TypeError):
+            shared["a"] = 4
+        with pytest.raises(TypeError):
+            shared["new"] = 4
+        with pytest.raises(TypeError):
+            shared["a"][3] = 4
+        with pytest.raises(TypeError):
+            shared["e"].set_value_by_slice(0, 5, 4)
+        assert shared["a"][3] == 1
+        copy = shared.copy()
+        copy["e"][3] = 9
+        assert copy["e"][3] == 9
+        assert shared["e"][3] == 3
+
+
+def test_not_numbers():
+    rd = RangeDictionary(5, {"a": "alpha"})
+    with pytest.raises(TypeError):
+        SharedRangeDictionary.publish(rd)
+
+
+def test_close():
+    shared = SharedRangeDictionary.publish(_range_dict())
+    attached = SharedRangeDictionary.attach(shared.name)
+    attached.close()
+    assert list(shared["a"])[10] == 3
+    shared.close()
+    shared.close()
+    with pytest.raises(ValueError):
+        shared.name
+
+
+def _attach_in_worker(data):
+    unregistered = []
+    unregister = resource_tracker.unregister
+
+    def record(name, rtype):
+        unregistered.append(name)
+        unregister(name, rtype)
+
+    resource_tracker.unregister = record
+    shared = pickle.loads(data)
+    total = sum(shared["d"])
+    shared.close()
+    return total, unregistered
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Needs a resource tracker")
+def test_attach_in_spawned_worker():
+    with SharedRangeDictionary.publish(_range_dict()) as shared:
+        with ProcessPoolExecutor(
+                1, mp_context=get_context("spawn")) as pool:
+            total, unregistered = pool.submit(
+                _attach_in_worker, pickle.dumps(shared)).result()
+        assert total == 2450
+        # The worker shares the tracker which is to free the memory
+        assert unregistered == []
+        assert list(shared["a"])[10] == 3
+
+
+@pytest.mark.skipif(os.name != "posix", reason="Needs a resource tracker")
+def test_attach_in_other_process():
+    with SharedRangeDictionary.publish(_range_dict()) as shared:
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import pickle, sys\n"
+             "from unittests.ranged.test_shared import _attach_in_worker\n"
+             "print(len(_attach_in_worker(bytes.fromhex(sys.argv[1]))[1]))",
+             pickle.dumps(shared).hex()],
+            check=True, capture_output=True, text=True, env=dict(
+                os.environ, PYTHONPATH=os.pathsep.join(sys.path)))
+        # A process with its own tracker must stop that freeing the memory
+        # when it ends, unless attaching did not register it
+        assert int(result.stdout) == (0 if sys.version_info >= (3, 13) else 1)
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import numpy
 import pytest
 from spinn_utilities.ranged import RangeDictionary, RangedList
 
@@ -269,3 +271,131 @@ def test_copy():
     calc2_copy = rd2["calc2"]
     assert calc2_copy == [20, 20, 20]
     assert list(calc2_copy.iter_ranges()) == [(0, 3, 20)]
+
+
+def test_to_numpy():
+    rd = RangeDictionary(5, {"a": 1, "b": "x"})
+    rd["a"][2] = 3
+    assert list(rd.to_numpy("a")) == [1, 1, 3, 1, 1]
+    arrays = rd.to_numpy(selector=slice(1, 3))
+    assert set(arrays) == {"a", "b"}
+    assert list(arrays["a"]) == [1, 3]
+    assert list(arrays["b"]) == ["x", "x"]
+    assert list(rd.to_numpy(["a"], [4, 2])["a"]) == [1, 3]
+
+
+def test_memory_report():
+    rd = RangeDictionary(100, {"a": 1})
+    rd["b"] = RangedList(100, list(range(100)), dtype="uint8")
+    report = rd.memory_report().split("\n")
+    assert report[0].startswith("a: ranges of 1 ranges")
+    assert report[1] == "b: array of 100 values, about 100 bytes"
+    # A single range takes more memory than 100 uint8 values
+    rd["b"].set_value_by_slice(0, 100, 7)
+    rd.compact()
+    assert rd["b"].storage_mode() == "array"
+    rd["c"] = RangedList(100, [7] * 100)
+    assert rd["c"].storage_mode() == "ranges"
+
+
+def _runs(values):
+    """ The maximal runs of equal values as (start, stop, value) """
+    runs = []
+    for index, value in enumerate(values):
+        if runs and runs[-1][1] == index and runs[-1][2] == value:
+            runs[-1] = (runs[-1][0], index + 1, value)
+        else:
+            runs.append((index, index + 1, value))
+    return runs
+
+
+def test_merged_ranges():
+    size = 60
+    rd = RangeDictionary(size, {"a": 0, "b": "x", "c": 1.5})
+    rd["a"][5:20] = 3
+    rd["a"][40] = 4
+    rd["b"][10:45] = "y"
+    rd["c"].set_value([float(i // 7) for i in range(size)])
+    values = [rd.get_values_by_id(None, i) for i in range(size)]
+    assert list(rd.iter_ranges()) == _runs(values)
+    assert list(rd.iter_ranges(["a", "b"])) == _runs(
+        [{"a": v["a"], "b": v["b"]} for v in values])
+    assert list(rd.iter_ranges_by_slice(None, 8, 42)) == [
+        (start + 8, stop + 8, value)
+        for (start, stop, value) in _runs(values[8:42])]
+    assert list(rd.iter_ranges_by_id(the_id=40)) == [(40, 41, values[40])]
+    # Gaps between IDs are kept out of the ranges
+    assert list(rd.iter_ranges_by_ids([1, 2, 3, 30, 31, 50])) == [
+        (1, 4, values[1]), (30, 32, values[30]), (50, 51, values[50])]
+    assert list(RangeDictionary(4).iter_ranges()) == [(0, 4, {})]
+
+
+def test_get_range_columns():
+    rd = RangeDictionary(10, {"a": 1, "b": "x"})
+    rd["a"][3:6] = 2
+    rd["b"][5:] = "y"
+    starts, stops, columns = rd.get_range_columns()
+    assert list(starts) == [0, 3, 5, 6]
+    assert list(stops) == [3, 5, 6, 10]
+    assert list(columns["a"]) == [1, 2, 2, 1]
+    assert list(columns["b"]) == ["x", "x", "y", "y"]
+    starts, stops, columns = rd.get_range_columns("a")
+    assert list(zip(starts, stops, columns["a"])) == list(
+        rd.iter_ranges("a"))
+
+
+def test_save_load(tmp_path):
+    rd = RangeDictionary(100, {"a": 1, "b": "x"})
+    rd["a"][10:20] = 3
+    rd["b"].set_value_by_id(5, ("any", "object"))
+    rd["c"] = RangedList(100, [i / 4 for i in range(100)], "c")
+    rd["d"] = RangedList(100, list(range(100)), "d", dtype="int16")
+    rd.set_default("a", 7)
+    rd.save(str(tmp_path))
+
+    loaded = RangeDictionary.load(str(tmp_path))
+    assert set(loaded.keys()) == {"a", "b", "c", "d"}
+    for key in rd.keys():
+        assert list(loaded[key]) == list(rd[key])
+        assert loaded[key].storage_mode() == rd[key].storage_mode()
+        assert loaded[key].dtype == rd[key].dtype
+    assert loaded.get_default("a") == 7
+    assert type(loaded["a"][0]) is int
+    assert loaded["d"].storage_mode() == "array"
+
+    # Changes to a memory mapped key do not change the saved values
+    loaded["d"][3] = -1
+    assert loaded["d"][3] == -1
+    again = RangeDictionary.load(str(tmp_path), mmap=False)
+    assert again["d"][3] == 3
+    assert list(again.iter_ranges()) == list(rd.iter_ranges())
+
+
+def test_save_over_load(tmp_path):
+    path = str(tmp_path)
+    rd = RangeDictionary(100000, {"a": 1})
+    rd["d"] = RangedList(100000, numpy.arange(100000), "d", dtype="int64")
+    rd.save(path)
+
+    # Saving a memory mapped dictionary back where it came from
+    loaded = RangeDictionary.load(path)
+    loaded["d"][3] = -1
+    loaded.save(path)
+    assert loaded["d"][99999] == 99999
+    again = RangeDictionary.load(path)
+    assert again["d"][3] == -1
+    assert list(again["d"]) == [-1 if i == 3 else i for i in range(100000)]
+    assert sorted(os.listdir(path)) == ["1.npy", "index.pickle"]
+
+
+def test_dirty_keys():
+    rd = RangeDictionary(10, {"a": 1, "b": 2})
+    assert sorted(rd.dirty_keys()) == ["a", "b"]
+    assert rd.pop_dirty_ranges("a") == [(0, 10)]
+    assert rd.pop_dirty_ranges("b") == [(0, 10)]
+    assert rd.dirty_keys() == []
+    rd[3:5]["b"] = 7
+    rd["c"] = 1
+    assert sorted(rd.dirty_keys()) == ["b", "c"]
+    assert rd.pop_dirty_ranges("b") == [(3, 5)]
+    assert rd.dirty_keys() == ["c"]